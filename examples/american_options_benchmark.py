@@ -35,7 +35,8 @@ app = typer.Typer(
     add_completion=False,
     no_args_is_help=True,
 )
-console = Console()
+console = Console(highlight=False)
+_fmt_4f = "{:.4f}".format
 
 
 def run_american_benchmark(config: dict[str, Any]):
@@ -48,10 +49,9 @@ def run_american_benchmark(config: dict[str, Any]):
         config.get("kwargs", {}),
     )
     console.rule(f"[bold cyan]{config['model_name']}[/bold cyan]", style="cyan")
-    console.print(f"[bold]Model:[/] {model}")
-
     option = Option(strike=110.0, maturity=1.0, option_type=OptionType.PUT)
     console.print(
+        f"[bold]Model:[/] {model}\n"
         f"[bold]Option:[/] American Put, K={option.strike}, T={option.maturity}"
     )
 
@@ -70,9 +70,8 @@ def run_american_benchmark(config: dict[str, Any]):
         timing_s = end - start
 
         if isinstance(price, float):
-            table.add_row(name, f"{price:.4f}", f"{timing_s:.4f}")
-        else:
-            table.add_row(name, price, f"{timing_s:.4f}")
+            price = _fmt_4f(price)
+        table.add_row(name, price, _fmt_4f(timing_s))
     console.print(table)
 
 
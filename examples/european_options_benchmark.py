@@ -47,9 +47,18 @@ app = typer.Typer(
     add_completion=False,
     no_args_is_help=True,
 )
-console = Console()
+console = Console(highlight=False)
 parity_model = ParityModel(params={})
 
+METRICS = ("Price", "Delta", "Gamma", "Vega", "Theta", "Rho", "ImpliedVol")
+_CELL_TEMPLATE = "{:.4f}\n[dim]({:.4f} s)[/dim]"
+_fmt_error = "{:.4e}".format
+
+
+def _fmt_cell(val_time: tuple[float, float]) -> str:
+    """Formats a (value, elapsed) pair as a two-line table cell."""
+    return _CELL_TEMPLATE.format(*val_time)
+
 
 def profile_all_metrics(
     technique: Any,
@@ -80,10 +89,7 @@ def profile_all_metrics(
     }
     skip_mc_greeks = model.has_jumps and isinstance(technique, MonteCarloTechnique)
     if skip_mc_greeks and isinstance(technique, MonteCarloTechnique):
-        console.print(
-            "[yellow]  (Skipping unstable MC greeks for jump model)[/yellow]",
-            highlight=False,
-        )
+        console.print("[yellow]  (Skipping unstable MC greeks for jump model)[/yellow]")
 
     for name, func in greeks_to_calc.items():
         start = time.perf_counter()
@@ -120,9 +126,9 @@ def run_benchmark(config: dict[str, Any]):
         config.get("kwargs", {}),
     )
     console.rule(f"[bold cyan]{config['model_name']}[/bold cyan]", style="cyan")
-    console.print(f"[bold]Model:[/] {model}")
-    console.print(f"[bold]Stock:[/] {stock}")
-    console.print(f"[bold]Rate:[/]  {rate}")
+    console.print(
+        f"[bold]Model:[/] {model}\n[bold]Stock:[/] {stock}\n[bold]Rate:[/]  {rate}"
+    )
 
     all_results: dict[str, dict[str, Any]] = {}
     for option_type in [OptionType.CALL, OptionType.PUT]:
@@ -145,40 +151,29 @@ def run_benchmark(config: dict[str, Any]):
         for tech_name in techniques:
             table.add_column(tech_name, justify="center")
 
-        def _fmt_cell(val_time: tuple[float, float]) -> str:
-            price, elapsed = val_time
-            return f"{price:.4f}\n[dim]({elapsed:.4f} s)[/dim]"
-
-        metrics = [
-            "Price",
-            "Delta",
-            "Gamma",
-            "Vega",
-            "Theta",
-            "Rho",
-            "ImpliedVol",
-        ]
-        for metric in metrics:
+        for metric in METRICS:
             row_data = [_fmt_cell(tech_results[tech][metric]) for tech in techniques]
             table.add_row(metric, *row_data)
         console.print(table)
 
     console.print("[bold]Put-Call Parity Errors:[/bold]")
+    # Every technique prices the same (K, T) pair, so the parity offset
+    # P - C = K*exp(-rT) - S*exp(-qT) is evaluated once and reused
+    put_minus_call = parity_model._closed_form_impl(
+        spot=stock.spot,
+        strike=option.strike,
+        r=rate.get_rate(option.maturity),
+        t=option.maturity,
+        call=True,
+        option_price=0.0,
+        q=stock.dividend,
+    )
     parity_errors = {}
     for tech_name in techniques:
         call_price = all_results["Call"][tech_name]["Price"][0]
         put_price = all_results["Put"][tech_name]["Price"][0]
         if np.isfinite(call_price) and np.isfinite(put_price):
-            expected_put = parity_model._closed_form_impl(
-                spot=stock.spot,
-                strike=option.strike,
-                r=rate.get_rate(option.maturity),
-                t=option.maturity,
-                call=True,
-                option_price=call_price,
-                q=stock.dividend,
-            )
-            parity_errors[tech_name] = put_price - expected_put
+            parity_errors[tech_name] = put_price - (call_price + put_minus_call)
         else:
             parity_errors[tech_name] = np.nan
 
@@ -187,7 +182,7 @@ def run_benchmark(config: dict[str, Any]):
     )
     for tech_name in parity_errors:
         parity_table.add_column(tech_name, justify="center")
-    parity_table.add_row(*[f"{err:.4e}" for err in parity_errors.values()])
+    parity_table.add_row(*map(_fmt_error, parity_errors.values()))
     console.print(parity_table)
 
 
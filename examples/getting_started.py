@@ -21,9 +21,7 @@ delta = cf_technique.delta(option, stock, bsm_model, rate)
 gamma = cf_technique.gamma(option, stock, bsm_model, rate)
 vega = cf_technique.vega(option, stock, bsm_model, rate)
 
-print(f"Delta: {delta:.4f}")
-print(f"Gamma: {gamma:.4f}")
-print(f"Vega:  {vega:.4f}")
+print(f"Delta: {delta:.4f}\nGamma: {gamma:.4f}\nVega:  {vega:.4f}")
 
 target_price = 7.50
 iv = cf_technique.implied_volatility(
@@ -43,5 +41,4 @@ cir = CIRModel(params={"kappa": 0.86, "theta": 0.09, "sigma": 0.02})
 p_vasi = cf_technique.price(bond, r0_stock, vasicek, dummy_rate).price
 p_cir = cf_technique.price(bond, r0_stock, cir, dummy_rate).price
 
-print(f"Vasicek ZCB Price: {p_vasi:.4f}")
-print(f"CIR ZCB Price:     {p_cir:.4f}")
+print(f"Vasicek ZCB Price: {p_vasi:.4f}\nCIR ZCB Price:     {p_cir:.4f}")
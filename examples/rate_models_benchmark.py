@@ -17,7 +17,7 @@ app = typer.Typer(
     add_completion=False,
     no_args_is_help=True,
 )
-console = Console()
+console = Console(highlight=False)
 
 
 @app.command()
@@ -36,8 +36,8 @@ def main():
     # Vasicek Model
     vasicek_model = VasicekModel(params={"kappa": 0.86, "theta": 0.09, "sigma": 0.02})
     vasicek_price = cf_technique.price(bond, r0_stock, vasicek_model, dummy_rate).price
-    console.print(f"Vasicek Model: {vasicek_model}")
     console.print(
+        f"Vasicek Model: {vasicek_model}\n"
         f" -> ZCB Price (r0=0.05, T=1.0): "
         f"[bold green]{vasicek_price:.6f}[/bold green]\n"
     )
@@ -45,8 +45,8 @@ def main():
     # CIR Model
     cir_model = CIRModel(params={"kappa": 0.86, "theta": 0.09, "sigma": 0.02})
     cir_price = cf_technique.price(bond, r0_stock, cir_model, dummy_rate).price
-    console.print(f"CIR Model: {cir_model}")
     console.print(
+        f"CIR Model: {cir_model}\n"
         f" -> ZCB Price (r0=0.05, T=1.0): [bold green]{cir_price:.6f}[/bold green]"
     )
 
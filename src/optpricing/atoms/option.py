@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, replace
 from enum import Enum
 
+import numpy as np
+
 __doc__ = """
 This module defines the core data structures for representing financial options.
 """
@@ -14,6 +16,11 @@ class OptionType(Enum):
     CALL = "Call"
     PUT = "Put"
 
+    @property
+    def sign(self) -> float:
+        """+1.0 for a call and -1.0 for a put, used for branchless payoffs."""
+        return 1.0 if self is OptionType.CALL else -1.0
+
 
 class ExerciseStyle(Enum):
     """Enumeration for the exercise style of an option."""
@@ -51,6 +58,31 @@ class Option:
         if self.maturity <= 0:
             raise ValueError(f"Maturity must be positive, got {self.maturity}")
 
+    def payoff(self, spot: np.ndarray | float) -> np.ndarray | float:
+        """
+        Compute the intrinsic payoff for one or many terminal spot prices.
+
+        The call/put distinction is folded into a sign factor. For an array of
+        spots, the difference, sign flip and floor are applied in place on a
+        single output buffer, so no temporaries are allocated.
+
+        Parameters
+        ----------
+        spot : np.ndarray | float
+            The terminal price(s) of the underlying asset.
+
+        Returns
+        -------
+        np.ndarray | float
+            The payoff, with the same shape as `spot`.
+        """
+        if np.ndim(spot) == 0:
+            return max(self.option_type.sign * (spot - self.strike), 0.0)
+        intrinsic = np.subtract(spot, self.strike, dtype=np.float64)
+        if self.option_type is OptionType.PUT:
+            np.negative(intrinsic, out=intrinsic)
+        return np.maximum(intrinsic, 0.0, out=intrinsic)
+
     def parity_counterpart(self) -> Option:
         """
         Create the put-call parity equivalent of this option.
@@ -1,19 +1,38 @@
 from __future__ import annotations
 
+import logging
+from collections.abc import Callable
+from typing import Any
+
 import numpy as np
 import pandas as pd
-from scipy.optimize import minimize, minimize_scalar
+from scipy.optimize import least_squares, minimize, minimize_scalar
 
 from optpricing.atoms import Rate, Stock
 from optpricing.models import BaseModel
+from optpricing.models.bsm import bsm_greeks_vectorized
 
 from .technique_selector import select_fastest_technique
-from .vectorized_pricer import price_options_vectorized
+from .vectorized_bsm_iv import BSMIVSolver
+from .vectorized_pricer import ChainLayout, price_options_vectorized
 
 __doc__ = """
 Defines the main Calibrator class used to fit financial models to market data.
 """
 
+logger = logging.getLogger(__name__)
+
+# Stopping tolerances for the derivative-free methods, sized to the precision
+# that market quotes support
+_DFO_OPTIONS = {
+    "Powell": {"xtol": 1e-6, "ftol": 1e-8},
+    "Nelder-Mead": {"xatol": 1e-6, "fatol": 1e-8, "adaptive": True},
+}
+# Number of past objective values kept for exact-repeat lookups
+_OBJECTIVE_CACHE_SIZE = 256
+# Bounded `least_squares` methods, which fit the residual vector directly
+_LEAST_SQUARES_METHODS = ("trf", "dogbox")
+
 
 class Calibrator:
     """
@@ -29,6 +48,9 @@ class Calibrator:
         market_data: pd.DataFrame,
         stock: Stock,
         rate: Rate,
+        *,
+        pricing_method: str = "integration",
+        weights: np.ndarray | str | None = None,
     ):
         """
         Initializes the Calibrator.
@@ -44,15 +66,79 @@ class Calibrator:
             The underlying asset's properties.
         rate : Rate
             The risk-free rate structure.
+        pricing_method : {"integration", "fft"}, optional
+            How `price_options_vectorized` prices each maturity slice. "fft"
+            sweeps all strikes of a maturity with one Carr-Madan FFT, which
+            is cheaper on wide strike ladders. Defaults to "integration".
+        weights : np.ndarray | str | None, optional
+            Per-quote weights applied to the price residuals. "vega" divides
+            each residual by the BSM vega at the quote's market implied
+            volatility, so the fit approximates an implied-volatility fit and
+            is better conditioned across strikes. Defaults to None
+            (unweighted).
         """
         self.model = model
         self.market_data = market_data
         self.stock = stock
         self.rate = rate
+        self.pricing_method = pricing_method
+        # Market prices as one contiguous float64 array, plus reusable
+        # buffers the objective writes model prices and residuals into
+        self._market_prices = np.ascontiguousarray(
+            market_data["marketPrice"].to_numpy(), dtype=np.float64
+        )
+        self._model_prices = np.empty_like(self._market_prices)
+        # The chain never changes during a fit, so its layout is built once
+        self._layout = ChainLayout.from_frame(market_data)
+        self._residuals = np.empty_like(self._market_prices)
+        self._objective_cache: dict[tuple, float] = {}
+        if isinstance(weights, str):
+            if weights != "vega":
+                raise ValueError(f"Unknown weighting scheme '{weights}'.")
+            self._weights = self._vega_weights()
+        elif weights is None:
+            self._weights = None
+        else:
+            self._weights = np.ascontiguousarray(weights, dtype=np.float64)
         self.technique = select_fastest_technique(model)
         _class_name = self.technique.__class__.__name__
         print(f"Calibrator using '{_class_name}' for model '{model.name}'.")
 
+    def _vega_weights(self) -> np.ndarray:
+        """Inverse BSM vegas at the market implied volatilities."""
+        data = self.market_data
+        maturities = data["maturity"].to_numpy(dtype=np.float64)
+        ivs = BSMIVSolver().solve(self._market_prices, data, self.stock, self.rate)
+        vegas = bsm_greeks_vectorized(
+            self.stock.spot,
+            data["strike"].to_numpy(dtype=np.float64),
+            np.array([self.rate.get_rate(T) for T in maturities]),
+            self.stock.dividend,
+            maturities,
+            ivs,
+            data["optionType"].to_numpy() == "call",
+        )["vega"]
+
+        # Quotes without an implied vol get a typical vega; tiny wing vegas
+        # are floored so a few far-OTM quotes cannot dominate the fit
+        valid = np.isfinite(vegas)
+        if not valid.any():
+            return np.ones_like(self._market_prices)
+        vegas = np.where(valid, vegas, np.median(vegas[valid]))
+        return 1.0 / np.maximum(vegas, 1e-3 * vegas.max())
+
+    def _price_all(self, model: BaseModel) -> np.ndarray:
+        """Prices the whole chain in one bulk call, into the reusable buffer."""
+        return price_options_vectorized(
+            self.market_data,
+            self.stock,
+            model,
+            self.rate,
+            method=self.pricing_method,
+            out=self._model_prices,
+            layout=self._layout,
+        )
+
     def _objective_function(
         self,
         params_to_fit_values: np.ndarray,
@@ -61,44 +147,100 @@ class Calibrator:
     ) -> float:
         """The objective function to be minimized, calculating total squared error."""
         native_params = np.asarray(params_to_fit_values, dtype=float)
+
+        # An exact repeat within a fit (e.g. a user gradient re-evaluating
+        # the current point) skips the chain pricing
+        key = (
+            native_params.tobytes(),
+            tuple(params_to_fit_names),
+            tuple(frozen_params.items()),
+        )
+        cached = self._objective_cache.get(key)
+        if cached is not None:
+            return cached
+
         current_params = {
             **frozen_params,
             **dict(zip(params_to_fit_names, native_params)),
         }
-        print(
-            f"  Trying params: { {k: f'{v:.4f}' for k, v in current_params.items()} }",
-            end="",
-        )
+        # Per-evaluation trace only; formatting it costs as much as a BSM chain
+        trace = logger.isEnabledFor(logging.DEBUG)
         try:
             temp_model = self.model.with_params(**current_params)
         except ValueError as e:
-            print(f" -> Invalid params ({e}), returning large error.")
-            return 1e12
+            if trace:
+                logger.debug("Params %s invalid (%s), large error", current_params, e)
+            return self._remember(key, 1e12)
 
-        model_prices = price_options_vectorized(
-            self.market_data, self.stock, temp_model, self.rate
-        )
+        model_prices = self._price_all(temp_model)
 
-        # Calculate error against market prices
-        total_error = np.sum(
-            (model_prices - self.market_data["marketPrice"].values) ** 2
-        )
+        # Sum of squared errors as a dot product, with no temporaries
+        error = np.subtract(model_prices, self._market_prices, out=self._residuals)
+        if self._weights is not None:
+            error *= self._weights
+        total_error = float(np.dot(error, error))
 
-        print(f"  --> RMSE: {np.sqrt(total_error / len(self.market_data)):.6f}")
-        return total_error
+        if trace:
+            rmse = np.sqrt(total_error / len(self.market_data))
+            logger.debug("Params %s -> RMSE %.6f", current_params, rmse)
+        return self._remember(key, total_error)
+
+    def _residual_function(
+        self,
+        params_to_fit_values: np.ndarray,
+        params_to_fit_names: list[str],
+        frozen_params: dict[str, float],
+    ) -> np.ndarray:
+        """Weighted model minus market prices, the least-squares residuals."""
+        native_params = np.asarray(params_to_fit_values, dtype=float)
+        current_params = {
+            **frozen_params,
+            **dict(zip(params_to_fit_names, native_params)),
+        }
+        n_quotes = len(self._market_prices)
+        trace = logger.isEnabledFor(logging.DEBUG)
+        try:
+            temp_model = self.model.with_params(**current_params)
+        except ValueError as e:
+            if trace:
+                logger.debug("Params %s invalid (%s), large error", current_params, e)
+            # Same total penalty as the scalar objective
+            return np.full(n_quotes, np.sqrt(1e12 / n_quotes))
+
+        # A fresh array: least_squares keeps residuals across iterations
+        residuals = self._price_all(temp_model) - self._market_prices
+        if self._weights is not None:
+            residuals *= self._weights
+        if trace:
+            rmse = np.sqrt(np.dot(residuals, residuals) / n_quotes)
+            logger.debug("Params %s -> RMSE %.6f", current_params, rmse)
+        return residuals
+
+    def _remember(self, key: tuple, value: float) -> float:
+        """Stores an objective value, evicting the oldest beyond the cap."""
+        cache = self._objective_cache
+        if len(cache) >= _OBJECTIVE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
+        return value
 
     def fit(
         self,
         initial_guess: dict[str, float],
         bounds: dict[str, tuple],
         frozen_params: dict[str, float] = None,
+        *,
+        method: str = "L-BFGS-B",
+        jac: Callable[..., np.ndarray] | str | None = None,
+        options: dict[str, Any] | None = None,
     ) -> dict[str, float]:
         """
         Performs the calibration using an optimization algorithm.
 
-        This method uses `scipy.optimize.minimize` (or `minimize_scalar` for
-        a single parameter) to find the optimal set of parameters that
-        minimizes the objective function.
+        This method uses `scipy.optimize.minimize` (`least_squares` for the
+        "trf" and "dogbox" methods, `minimize_scalar` for a single parameter)
+        to find the optimal set of parameters that minimizes the objective
+        function.
 
         Parameters
         ----------
@@ -109,6 +251,29 @@ class Calibrator:
         frozen_params : dict[str, float] | None, optional
             A dictionary of parameters to hold constant during the optimization.
             Defaults to None.
+        method : str, optional
+            The `scipy.optimize.minimize` method used when more than one
+            parameter is fitted, e.g. "L-BFGS-B", "SLSQP" or the
+            derivative-free "Powell" and "Nelder-Mead", all of which honour
+            the bounds. "trf" and "dogbox" instead run
+            `scipy.optimize.least_squares` on the vector of price residuals,
+            which exploits the sum-of-squares structure and usually needs
+            several times fewer pricings. Defaults to "L-BFGS-B".
+        jac : Callable | str | None, optional
+            Gradient of the objective, forwarded to `minimize`. A callable is
+            called as `jac(values, names, frozen_params)` and saves the
+            `len(values)` extra objective evaluations per step that finite
+            differences cost. A string selects a finite-difference scheme
+            ("2-point", "3-point"). Defaults to None (scipy's 2-point default).
+            For the least-squares methods a callable returns the Jacobian of
+            the residuals, one row per quote.
+        options : dict[str, Any] | None, optional
+            Solver options forwarded to `minimize`, or as keyword arguments
+            (e.g. `ftol`, `max_nfev`) to `least_squares`, which scales the
+            parameters by the Jacobian (`x_scale="jac"`) unless told
+            otherwise. Defaults to None,
+            which uses explicit stopping tolerances for Powell and
+            Nelder-Mead and scipy's defaults for every other method.
 
         Returns
         -------
@@ -116,6 +281,7 @@ class Calibrator:
             A dictionary containing the full set of calibrated and frozen parameters.
         """
         frozen_params = frozen_params or {}
+        self._objective_cache.clear()
         params_to_fit_names = [p for p in initial_guess if p not in frozen_params]
         print(f"Fitting parameters: {params_to_fit_names}")
         if not params_to_fit_names:
@@ -135,14 +301,36 @@ class Calibrator:
             )
             final_params = {**frozen_params, params_to_fit_names[0]: res.x}
             print(f"Scalar optimization finished. Final loss: {res.fun:.6f}")
+        elif method in _LEAST_SQUARES_METHODS:
+            # residual-vector solver; a missing bound is an infinite one
+            lower = [b[0] if b and b[0] is not None else -np.inf for b in fit_bounds]
+            upper = [b[1] if b and b[1] is not None else np.inf for b in fit_bounds]
+            res = least_squares(
+                self._residual_function,
+                x0=initial_values,
+                args=(params_to_fit_names, frozen_params),
+                method=method,
+                jac=jac if jac is not None else "2-point",
+                bounds=(lower, upper),
+                **{"x_scale": "jac", **(options or {})},
+            )
+            final_params = {**frozen_params, **dict(zip(params_to_fit_names, res.x))}
+            # least_squares reports half the sum of squared residuals
+            print(
+                f"Least-squares optimization finished. Final loss: {2 * res.cost:.6f}"
+            )
         else:
-            # gradient-based optimizer for multiple parameters
+            # bounded optimizer for multiple parameters
+            if options is None:
+                options = _DFO_OPTIONS.get(method)
             res = minimize(
                 fun=self._objective_function,
                 x0=initial_values,
                 args=(params_to_fit_names, frozen_params),
-                method="L-BFGS-B",
+                method=method,
+                jac=jac,
                 bounds=fit_bounds,
+                options=options,
             )
             final_params = {**frozen_params, **dict(zip(params_to_fit_names, res.x))}
             print(f"Multivariate optimization finished. Final loss: {res.fun:.6f}")
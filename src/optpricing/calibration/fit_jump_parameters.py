@@ -36,19 +36,21 @@ def fit_jump_params_from_history(
     """
     print("Fitting jump parameters from historical returns...")
 
-    std_dev = log_returns.std()
-    jump_threshold = threshold_stds * std_dev
+    # One pass over a plain array: a single |r| and two masks, no Series copies
+    returns = log_returns.to_numpy(dtype=float)
+    abs_returns = np.abs(returns)
+    jump_threshold = threshold_stds * np.nanstd(returns, ddof=1)
 
-    diffusion_returns = log_returns[abs(log_returns) < jump_threshold]
-    jump_returns = log_returns[abs(log_returns) >= jump_threshold]
+    diffusion_returns = returns[abs_returns < jump_threshold]
+    jump_returns = returns[abs_returns >= jump_threshold]
 
     # Annualize daily std dev by multiplying by sqrt(252 trading days)
-    sigma_est = diffusion_returns.std() * np.sqrt(252)
+    sigma_est = diffusion_returns.std(ddof=1) * np.sqrt(252)
 
     if len(jump_returns) > 2:
-        lambda_est = len(jump_returns) / len(log_returns) * 252
+        lambda_est = len(jump_returns) / len(returns) * 252
         mu_j_est = jump_returns.mean()
-        sigma_j_est = jump_returns.std()
+        sigma_j_est = jump_returns.std(ddof=1)
     else:
         lambda_est, mu_j_est, sigma_j_est = 0.1, 0.0, 0.0
         print("  -> Warning: Not enough jumps detected. Using default jump parameters.")
@@ -56,11 +56,11 @@ class VolatilitySurface:
         self,
         stock: Stock,
         rate: Rate,
-        prices_to_invert: pd.Series,
+        prices_to_invert: np.ndarray | pd.Series,
     ) -> np.ndarray:
         """Calculates IVs using the fast, vectorized BSM solver."""
         ivs = self.iv_solver.solve(
-            prices_to_invert.values,
+            np.asarray(prices_to_invert, dtype=float),
             self.data,
             stock,
             rate,
@@ -93,12 +93,9 @@ class VolatilitySurface:
         """
         print("Calculating market implied volatility surface...")
         market_ivs = self._calculate_ivs(stock, rate, self.data["marketPrice"])
-        self.surface = self.data.copy()
-        self.surface["iv"] = market_ivs
-        self.surface.dropna(inplace=True)
-        self.surface = self.surface[
-            (self.surface["iv"] > 1e-4) & (self.surface["iv"] < 2.0)
-        ]
+        # NaN IVs fail both comparisons, so one mask filters them out as well
+        keep = (market_ivs > 1e-4) & (market_ivs < 2.0)
+        self.surface = self.data[keep].assign(iv=market_ivs[keep]).dropna()
         return self
 
     def calculate_model_iv(
@@ -141,10 +138,6 @@ class VolatilitySurface:
             **model.params,
         )
 
-        model_ivs = self._calculate_ivs(
-            stock, rate, pd.Series(model_prices, index=self.data.index)
-        )
-        self.surface = self.data.copy()
-        self.surface["iv"] = model_ivs
-        self.surface.dropna(inplace=True)
+        model_ivs = self._calculate_ivs(stock, rate, model_prices)
+        self.surface = self.data.assign(iv=model_ivs).dropna()
         return self
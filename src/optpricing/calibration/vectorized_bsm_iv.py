@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
 
 from optpricing.atoms import Rate, Stock
+from optpricing.models.closed_form_kernels import bsm_implied_vol_chain_kernel
 
 __doc__ = """
 Defines a high-performance, vectorized solver for Black-Scholes-Merton
@@ -14,16 +14,21 @@ implied volatility.
 
 class BSMIVSolver:
     """
-    High-performance, vectorized Newton-Raphson solver for BSM implied volatility.
+    High-performance solver for BSM implied volatility over a whole chain.
 
     This solver is designed to calculate the implied volatility for a large
-    number of options simultaneously, leveraging NumPy for vectorized operations.
+    number of options simultaneously. Every option is inverted by the
+    JIT-compiled Halley solver, warm-started from the Corrado-Miller
+    approximation and safeguarded by a bisection bracket, inside a single
+    parallel loop over the chain.
     """
 
     def __init__(
         self,
-        max_iter: int = 20,
+        max_iter: int = 32,
         tolerance: float = 1e-6,
+        low: float = 1e-6,
+        high: float = 5.0,
     ):
         """
         Initializes the BSM implied volatility solver.
@@ -31,13 +36,18 @@ class BSMIVSolver:
         Parameters
         ----------
         max_iter : int, optional
-            The maximum number of iterations for the Newton-Raphson method,
-            by default 20.
+            The maximum number of iterations per option, by default 32.
         tolerance : float, optional
-            The error tolerance to determine convergence, by default 1e-6.
+            The convergence tolerance on the volatility, by default 1e-6.
+        low : float, optional
+            The initial lower bound of the volatility bracket, by default 1e-6.
+        high : float, optional
+            The initial upper bound of the volatility bracket, by default 5.0.
         """
         self.max_iter = max_iter
         self.tolerance = tolerance
+        self.low = low
+        self.high = high
 
     def solve(
         self,
@@ -65,29 +75,28 @@ class BSMIVSolver:
         -------
         np.ndarray
             An array of calculated implied volatilities corresponding to the
-            target prices.
+            target prices. Entries that violate the no-arbitrage bounds or do
+            not converge are `np.nan`.
         """
-        S, q = stock.spot, stock.dividend
-        K, T = options["strike"].values, options["maturity"].values
-        r = rate.get_rate(T)  # Use get_rate for term structure
-        is_call = options["optionType"].values == "call"
-        iv = np.full_like(target_prices, 0.20)
+        K = np.ascontiguousarray(options["strike"].to_numpy(dtype=float))
+        T = np.ascontiguousarray(options["maturity"].to_numpy(dtype=float))
+        # Use get_rate for term structure
+        r = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(rate.get_rate(T), dtype=float), T.shape)
+        )
+        calls = options["optionType"].to_numpy() == "call"
+        target = np.ascontiguousarray(target_prices, dtype=float)
 
-        for _ in range(self.max_iter):
-            with np.errstate(all="ignore"):
-                sqrt_T = np.sqrt(T)
-                d1 = (np.log(S / K) + (r - q + 0.5 * iv**2) * T) / (iv * sqrt_T)
-                d2 = d1 - iv * sqrt_T
-                vega = S * np.exp(-q * T) * sqrt_T * norm.pdf(d1)
-                call_prices = S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(
-                    -r * T
-                ) * norm.cdf(d2)
-                put_prices = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(
-                    -q * T
-                ) * norm.cdf(-d1)
-            model_prices = np.where(is_call, call_prices, put_prices)
-            error = model_prices - target_prices
-            if np.all(np.abs(error) < self.tolerance):
-                break
-            iv = iv - error / np.maximum(vega, 1e-8)
-        return iv
+        return bsm_implied_vol_chain_kernel(
+            target,
+            float(stock.spot),
+            K,
+            r,
+            float(stock.dividend),
+            T,
+            calls,
+            self.low,
+            self.high,
+            self.tolerance,
+            self.max_iter,
+        )
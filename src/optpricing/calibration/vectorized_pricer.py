@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from scipy import integrate
 
+from optpricing.models.bsm import BSMModel
+from optpricing.models.closed_form_kernels import bsm_chain_kernel
+from optpricing.techniques.fft import FFTTechnique
+
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -16,6 +21,57 @@ Defines a high-performance, vectorized pricer for models with CF.
 """
 
 
+@dataclass(frozen=True, slots=True)
+class ChainLayout:
+    """
+    Structure-of-arrays view of an option chain, grouped by maturity.
+
+    Building it reads the DataFrame columns into contiguous arrays and sorts
+    the rows by maturity. It depends only on the chain, so a caller that
+    prices the same chain repeatedly (e.g. a calibration loop) builds it once.
+
+    Attributes
+    ----------
+    strikes : np.ndarray
+        Contiguous float64 strikes, in row order.
+    maturities : np.ndarray
+        Contiguous float64 maturities, in row order.
+    calls : np.ndarray
+        Boolean call flags, in row order.
+    unique_maturities : np.ndarray
+        Sorted distinct maturities.
+    group_ids : np.ndarray
+        Index into `unique_maturities` for each row.
+    groups : list[np.ndarray]
+        Row indices of each maturity slice, in original row order.
+    """
+
+    strikes: np.ndarray
+    maturities: np.ndarray
+    calls: np.ndarray
+    unique_maturities: np.ndarray
+    group_ids: np.ndarray
+    groups: list[np.ndarray]
+
+    @classmethod
+    def from_frame(cls, options_df: pd.DataFrame) -> ChainLayout:
+        """Builds the layout from a chain with strike/maturity/optionType."""
+        strikes = np.ascontiguousarray(
+            options_df["strike"].to_numpy(), dtype=np.float64
+        )
+        maturities = np.ascontiguousarray(
+            options_df["maturity"].to_numpy(), dtype=np.float64
+        )
+        calls = options_df["optionType"].to_numpy() == "call"
+        unique_maturities, group_ids = np.unique(maturities, return_inverse=True)
+
+        # Sort rows by maturity once and split, instead of one mask per maturity
+        counts = np.bincount(group_ids, minlength=len(unique_maturities))
+        order = np.argsort(group_ids, kind="stable")
+        groups = np.split(order, np.cumsum(counts)[:-1])
+        return cls(strikes, maturities, calls, unique_maturities, group_ids, groups)
+
+
 def price_options_vectorized(
     options_df: pd.DataFrame,
     stock: Stock,
@@ -23,16 +79,24 @@ def price_options_vectorized(
     rate: Rate,
     *,
     upper_bound: float = 200.0,
+    method: str = "integration",
+    out: np.ndarray | None = None,
+    layout: ChainLayout | None = None,
     **kwargs: Any,
 ) -> np.ndarray:
     """
     Vectorised integral pricer (Carr-Madan representation).
 
+    BSM chains skip the integration: every row is priced in one fused,
+    JIT-compiled closed-form loop. With `method="fft"` each maturity slice
+    is priced by a single Carr-Madan FFT over a log-strike grid, and the
+    strikes are read off it by interpolation.
+
     Parameters
     ----------
     options_df : pd.DataFrame
-        Must contain `strike`, `maturity` and `optionType`.
-        The index is reset internally to guarantee safe positional writes.
+        Must contain `strike`, `maturity` and `optionType`. Columns are read
+        once into contiguous float64 arrays, so the index is never used.
     stock : Stock
         Underlying description.
     model : BaseModel
@@ -41,38 +105,84 @@ def price_options_vectorized(
         Continuous zero-curve.
     upper_bound : float, default 200
         Integration truncation limit (works for double precision).
+    method : {"integration", "fft"}, default "integration"
+        How non-BSM maturity slices are priced. "fft" costs one FFT per
+        maturity however many strikes it has, at the accuracy of the
+        interpolated FFT grid rather than adaptive quadrature.
+    out : np.ndarray | None, optional
+        Preallocated float64 array of length `len(options_df)` to write the
+        prices into, so repeated calls (e.g. a calibration loop) do not
+        allocate a new result each time. Defaults to None.
+    layout : ChainLayout | None, optional
+        A layout already built from `options_df` with
+        `ChainLayout.from_frame`, reused instead of rebuilding it. Defaults
+        to None.
 
     Returns
     -------
     np.ndarray
-        Model prices - aligned with the row order of options_df.
+        Model prices - aligned with the row order of options_df. This is
+        `out` itself when it is given.
     """
-    options_df = options_df.reset_index(drop=True)
+    if method not in ("integration", "fft"):
+        raise ValueError(f"Unknown pricing method '{method}'.")
 
-    n_opts = len(options_df)
-    prices = np.empty(n_opts)
+    if layout is None:
+        layout = ChainLayout.from_frame(options_df)
+    strikes, maturities, calls = layout.strikes, layout.maturities, layout.calls
+    unique_maturities, group_ids = layout.unique_maturities, layout.group_ids
+
+    prices = np.empty(len(strikes)) if out is None else out
 
     S = stock.spot
     q = stock.dividend
 
-    for T, grp in options_df.groupby("maturity", sort=False):
-        loc = grp.index.to_numpy()
-        K = grp["strike"].to_numpy()
-        is_call = grp["optionType"].to_numpy() == "call"
+    if type(model) is BSMModel:
+        # The whole chain in one closed-form pass, no integration needed
+        rates = np.array([rate.get_rate(T) for T in unique_maturities])[group_ids]
+        prices[:] = bsm_chain_kernel(
+            float(S),
+            strikes,
+            rates,
+            float(q),
+            maturities,
+            float(model.params["sigma"]),
+            calls,
+        )
+        return prices
+
+    fft = FFTTechnique() if method == "fft" else None
+
+    for T, loc in zip(unique_maturities, layout.groups):
+        K = strikes[loc]
+        is_call = calls[loc]
 
         r = rate.get_rate(T)
-        phi = model.cf(t=T, spot=S, r=r, q=q, **kwargs)
-        lnK = np.log(K)
-
-        def _integrand_p2(u: float) -> np.ndarray:
-            return (np.exp(-1j * u * lnK) * phi(u)).imag / u
 
-        def _integrand_p1(u: float) -> np.ndarray:
-            return (np.exp(-1j * u * lnK) * phi(u - 1j)).imag / u
+        if fft is not None:
+            # One FFT prices the whole log-strike grid of this maturity
+            k_grid, call_grid = fft._call_price_grid(S, T, r, q, model, **kwargs)
+            call_vals = np.interp(np.log(K), k_grid, call_grid)
+            put_vals = call_vals - (S * np.exp(-q * T) - K * np.exp(-r * T))
+            prices[loc] = np.where(is_call, call_vals, put_vals)
+            continue
 
-        # Vectorised quad once per maturity
-        p2, _ = integrate.quad_vec(_integrand_p2, 1e-15, upper_bound)
-        p1, _ = integrate.quad_vec(_integrand_p1, 1e-15, upper_bound)
+        phi = model.cf(t=T, spot=S, r=r, q=q, **kwargs)
+        lnK = np.log(K)
+        n_strikes = len(K)
+
+        def _integrand(u: float) -> np.ndarray:
+            # One strike kernel and one CF pair per node feed both P1 and P2
+            strike_kernel = np.exp(-1j * u * lnK)
+            vals = np.empty(2 * n_strikes)
+            vals[:n_strikes] = (strike_kernel * phi(u - 1j)).imag
+            vals[n_strikes:] = (strike_kernel * phi(u)).imag
+            vals /= u
+            return vals
+
+        # Vectorised quad once per maturity, for the whole strike slice
+        p12, _ = integrate.quad_vec(_integrand, 1e-15, upper_bound)
+        p1, p2 = p12[:n_strikes], p12[n_strikes:]
 
         denom = np.real(phi(-1j))
         denom = 1.0 if abs(denom) < 1e-12 else denom
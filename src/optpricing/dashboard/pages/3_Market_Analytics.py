@@ -41,7 +41,7 @@ st.header("Option Chain Explorer")
 
 # Filter by Expiry
 expiries = sorted(chain_df["expiry"].unique())
-expiry_str = [pd.to_datetime(e).strftime("%Y-%m-%d") for e in expiries]
+expiry_str = pd.to_datetime(expiries).strftime("%Y-%m-%d").tolist()
 selected_expiry_str = st.selectbox("Select Expiry Date", expiry_str)
 
 if not selected_expiry_str:
@@ -2,10 +2,8 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
-from optpricing.atoms import Rate, Stock, ZeroCouponBond
 from optpricing.dashboard.widgets import build_sidebar
 from optpricing.models import CIRModel, VasicekModel
-from optpricing.techniques import ClosedFormTechnique
 
 __doc__ = """
 A page for pricing and visualizing interest rate term structures. It allows
@@ -40,17 +38,8 @@ else:  # CIR
 
 st.subheader("Generated Yield Curve")
 maturities = np.linspace(0.1, 30, 100)
-prices = []
-technique = ClosedFormTechnique()
-r0_stock = Stock(spot=r0)
-dummy_rate = Rate(rate=0.0)
-
-for T in maturities:
-    bond = ZeroCouponBond(maturity=T)
-    price = technique.price(bond, r0_stock, model, dummy_rate).price
-    prices.append(price)
-
-prices = np.array(prices)
+# The bond formulas broadcast over maturity: the whole curve in one call
+prices = model.price_closed_form(spot=r0, t=maturities)
 yields = -np.log(prices) / maturities
 
 fig = go.Figure(data=go.Scatter(x=maturities, y=yields, mode="lines"))
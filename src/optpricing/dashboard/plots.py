@@ -29,7 +29,7 @@ def plot_smiles_by_expiry(
         rows=2,
         cols=2,
         subplot_titles=[
-            f"Expiry: {pd.to_datetime(e).strftime('%Y-%m-%d')}" for e in plot_expiries
+            f"Expiry: {e}" for e in pd.to_datetime(plot_expiries).strftime("%Y-%m-%d")
         ],
         vertical_spacing=0.15,
         horizontal_spacing=0.05,
@@ -193,7 +193,7 @@ def plot_error_heatmap(
         data=go.Heatmap(
             z=pivot_df.values,
             x=pivot_df.columns,
-            y=[pd.to_datetime(d).strftime("%Y-%m-%d") for d in pivot_df.index],
+            y=pd.to_datetime(pivot_df.index).strftime("%Y-%m-%d"),
             colorscale="RdBu",
             zmid=0,
             hovertemplate="Strike: %{x}<br>Expiry: %{y}<br>Error: %{z:.2f} bps<extra></extra>",  # noqa E501
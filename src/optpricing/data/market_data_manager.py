@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from datetime import date, datetime
 
 import pandas as pd
@@ -12,6 +13,11 @@ Utility functions to download and load market snapshots, live option chains,
 and forward dividend yields.
 """
 
+# Live dividend yields barely move intraday; a backtest asks for the same
+# ticker on every period, so successful fetches are reused for a while.
+_DIVIDEND_TTL_SECONDS = 900.0
+_dividend_cache: dict[str, tuple[float, float]] = {}
+
 
 def _fetch_from_yfinance(ticker: str) -> pd.DataFrame | None:
     """Fetches a live option chain using yfinance."""
@@ -179,6 +185,9 @@ def get_live_dividend_yield(ticker: str) -> float:
     """
     Fetches the live forward dividend yield for a ticker using yfinance.
 
+    Successful fetches are cached per ticker for 15 minutes, so repeated
+    workflow runs do not query yfinance again. Failures are not cached.
+
     Parameters
     ----------
     ticker : str
@@ -189,12 +198,19 @@ def get_live_dividend_yield(ticker: str) -> float:
     float
         The associated div or zero.
     """
+    cached = _dividend_cache.get(ticker)
+    if cached is not None and time.monotonic() - cached[0] < _DIVIDEND_TTL_SECONDS:
+        return cached[1]
+
     print(f"Fetching live dividend yield for {ticker}...")
     try:
         t = yf.Ticker(ticker)
         dividend_yield = t.info.get("dividendYield")
-        return float(dividend_yield / 100 or 0.0)
+        q = float(dividend_yield / 100 or 0.0)
     except Exception as e:
         # Handle cases where the ticker is invalid or yfinance fails
         print(f"  -> FAILED to fetch dividend yield for {ticker}. Error: {e}")
         return 0.0
+
+    _dividend_cache[ticker] = (time.monotonic(), q)
+    return q
@@ -6,6 +6,7 @@ from typing import Any
 import numpy as np
 
 from optpricing.models.base import CF, BaseModel, ParamValidator
+from optpricing.models.cf_kernels import heston_cf_grid_kernel, heston_cf_kernel
 from optpricing.models.heston import HestonModel
 from optpricing.models.merton_jump import MertonJumpModel
 
@@ -114,28 +115,32 @@ class BatesModel(BaseModel):
         # Risk-neutral compensator for the jump part
         compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
 
-        def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            # Heston part (with drift adjusted for jump compensator)
-            d = np.sqrt(
-                (rho * vol_of_vol * u * 1j - kappa) ** 2
-                - (vol_of_vol**2) * (-u * 1j - u**2)
-            )
-            g = (kappa - rho * vol_of_vol * u * 1j - d) / (
-                kappa - rho * vol_of_vol * u * 1j + d
-            )
-            C = (r - q - compensator) * u * 1j * t + (kappa * theta / vol_of_vol**2) * (
-                (kappa - rho * vol_of_vol * u * 1j - d) * t
-                - 2 * np.log((1 - g * np.exp(-d * t)) / (1 - g))
+        # Heston part, with the drift adjusted for the jump compensator
+        log_spot = np.log(spot)
+        # Plain floats keep a single compiled specialisation of the kernel
+        args = tuple(
+            map(
+                float,
+                (t, log_spot, r - compensator, q, v0, kappa, theta, rho, vol_of_vol),
             )
-            D = ((kappa - rho * vol_of_vol * u * 1j - d) / vol_of_vol**2) * (
-                (1 - np.exp(-d * t)) / (1 - g * np.exp(-d * t))
-            )
-            heston_part = np.exp(C + D * v0 + 1j * u * np.log(spot))
+        )
+
+        # Merton jump constants, computed once per maturity
+        lam_t = lambda_ * t
+        i_mu_j = 1j * mu_j
+        half_sigma_j2 = 0.5 * sigma_j**2
+
+        def phi(u: np.ndarray | complex) -> np.ndarray | complex:
+            if np.ndim(u) == 0:
+                heston_part = heston_cf_kernel(complex(u), *args)
+            else:
+                nodes = np.asarray(u, dtype=np.complex128)
+                heston_part = heston_cf_grid_kernel(nodes.ravel(), *args).reshape(
+                    nodes.shape
+                )
 
             # Merton jump part
-            jump_part = np.exp(
-                lambda_ * t * (np.exp(1j * u * mu_j - 0.5 * u**2 * sigma_j**2) - 1)
-            )
+            jump_part = np.exp(lam_t * (np.exp(i_mu_j * u - half_sigma_j2 * u**2) - 1))
 
             return heston_part * jump_part
 
@@ -171,12 +176,12 @@ class BatesModel(BaseModel):
             # Evolve log-spot (Heston part + jump compensator)
             s_drift = (r - q - 0.5 * v_t_pos - compensator) * dt
             next_log_s = log_s_t + s_drift + v_sqrt * dw_s
-            # Add jumps
-            paths_with_jumps = np.where(jump_counts > 0)[0]
-            for path_idx in paths_with_jumps:
-                num_jumps = jump_counts[path_idx]
-                jump_size = np.sum(rng.normal(loc=mu_j, scale=sigma_j, size=num_jumps))
-                next_log_s[path_idx] += jump_size
+            # Add jumps: a sum of n normal jumps is one normal draw per path
+            paths_with_jumps = np.flatnonzero(jump_counts > 0)
+            num_jumps = jump_counts[paths_with_jumps]
+            next_log_s[paths_with_jumps] += rng.normal(
+                loc=num_jumps * mu_j, scale=np.sqrt(num_jumps) * sigma_j
+            )
             return next_log_s, np.maximum(v_t_next, 0)
 
         return stepper
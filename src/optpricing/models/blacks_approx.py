@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import math
 from typing import Any
 
 import numpy as np
 
 from optpricing.models.base import BaseModel, ParamValidator
-from optpricing.models.bsm import BSMModel
+from optpricing.models.bsm import BSMModel, bsm_price_vectorized
 
 __doc__ = """
 Defines Black's (1975) approximation for pricing an American call option
@@ -96,33 +95,32 @@ class BlacksApproxModel(BaseModel):
                 "BlacksApproxModel requires non-empty 'discrete_dividends'."
             )
 
+        divs = np.asarray(discrete_dividends, dtype=np.float64)
+        div_times = np.asarray(ex_div_times, dtype=np.float64)
+        pv_divs = divs * np.exp(-r * div_times)
+        before_expiry = div_times < t
+
         # Value of holding until maturity T
-        pv_all_divs = sum(
-            D * math.exp(-r * tD)
-            for D, tD in zip(discrete_dividends, ex_div_times)
-            if tD < t
-        )
-        S_adj_T = spot - pv_all_divs
+        S_adj_T = spot - pv_divs[before_expiry].sum()
         price_hold_to_maturity = self.bsm_solver.price_closed_form(
             spot=S_adj_T, strike=strike, r=r, q=0, t=t, call=True
         )
 
-        # Value of exercising just before each ex-dividend date
-        prices_early_exercise = []
-        for i, t_i in enumerate(ex_div_times):
-            if t_i >= t:
-                continue
-            pv_divs_before_i = sum(
-                discrete_dividends[j] * math.exp(-r * ex_div_times[j]) for j in range(i)
-            )
-            S_adj_i = spot - pv_divs_before_i
-            price_at_t_i = self.bsm_solver.price_closed_form(
-                spot=S_adj_i, strike=strike, r=r, q=0, t=t_i, call=True
-            )
-            prices_early_exercise.append(price_at_t_i)
-
-        max_early_price = max(prices_early_exercise) if prices_early_exercise else 0.0
-        return max(price_hold_to_maturity, max_early_price)
+        # Value of exercising just before each ex-dividend date, priced in a
+        # single vectorized pass over all candidate exercise dates
+        if not before_expiry.any():
+            return price_hold_to_maturity
+        pv_divs_before = np.concatenate(([0.0], np.cumsum(pv_divs)[:-1]))
+        prices_early_exercise = bsm_price_vectorized(
+            spot - pv_divs_before[before_expiry],
+            strike,
+            r,
+            0.0,
+            div_times[before_expiry],
+            self.params["sigma"],
+            True,
+        )
+        return max(price_hold_to_maturity, float(prices_early_exercise.max()))
 
     #  Abstract Method Implementations
     def _cf_impl(self, *args: Any, **kwargs: Any) -> Any:
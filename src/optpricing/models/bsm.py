@@ -1,17 +1,232 @@
 from __future__ import annotations
 
+import math
 from collections.abc import Callable
+from functools import lru_cache
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 
 from optpricing.models.base import CF, BaseModel, ParamValidator, PDECoeffs
+from optpricing.models.closed_form_kernels import (
+    _INV_SQRT_2PI,
+    bsm_greeks_kernel,
+    bsm_price_kernel,
+)
 
 __doc__ = """
 Defines the Black-Scholes-Merton (BSM) model for pricing European options.
 """
 
 
+def _norm_pdf(x: np.ndarray | float) -> np.ndarray | float:
+    """Standard normal density, without `scipy.stats` dispatch overhead."""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def _all_scalar(*values: object) -> bool:
+    """True if every value is a plain Python (or NumPy) real scalar."""
+    return all(isinstance(x, float | int | np.number) for x in values)
+
+
+@lru_cache(maxsize=256)
+def _bsm_greeks_pair(
+    spot: float,
+    strike: float,
+    r: float,
+    q: float,
+    t: float,
+    sigma: float,
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """
+    Memoized scalar price and Greeks for both the call and the put.
+
+    The call leg comes from the JIT-compiled kernel and the put leg from
+    put-call parity, so a call and a put on the same strike and maturity
+    (and every Greek of either) share one evaluation.
+    """
+    call = bsm_greeks_kernel(spot, strike, r, q, t, sigma, True)
+    price, delta, gamma, vega, theta, rho = call
+    df_div = math.exp(-q * t)
+    disc_strike = strike * math.exp(-r * t)
+    put = (
+        price - spot * df_div + disc_strike,
+        delta - df_div,
+        gamma,
+        vega,
+        theta + r * disc_strike - q * spot * df_div,
+        rho - t * disc_strike,
+    )
+    return call, put
+
+
+def _bsm_core(
+    spot: np.ndarray | float,
+    strike: np.ndarray | float,
+    r: np.ndarray | float,
+    q: np.ndarray | float,
+    t: np.ndarray | float,
+    sigma: np.ndarray | float,
+) -> tuple[np.ndarray | float, np.ndarray | float, np.ndarray | float]:
+    """
+    Shared Black-Scholes-Merton intermediates, `(sqrt_t, d1, d2)`.
+
+    Works element-wise on scalars or broadcastable arrays, so the price and
+    every analytic greek are built from a single evaluation of `d1` and `d2`.
+    """
+    sqrt_t = np.sqrt(t)
+    sig_sqrt_t = sigma * sqrt_t
+    d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * t) / sig_sqrt_t
+    return sqrt_t, d1, d1 - sig_sqrt_t
+
+
+def bsm_price_vectorized(
+    spot: np.ndarray | float,
+    strike: np.ndarray | float,
+    r: np.ndarray | float,
+    q: np.ndarray | float,
+    t: np.ndarray | float,
+    sigma: np.ndarray | float,
+    call: np.ndarray | bool = True,
+) -> np.ndarray:
+    """
+    Vectorized Black-Scholes-Merton prices for a batch of European options.
+
+    All inputs are broadcast against each other, so a whole strike slice (or
+    a full chain) is priced in a single pass of NumPy ufuncs.
+
+    Parameters
+    ----------
+    spot : np.ndarray | float
+        The current price(s) of the underlying asset.
+    strike : np.ndarray | float
+        The strike price(s) of the options.
+    r : np.ndarray | float
+        The continuously compounded risk-free rate(s).
+    q : np.ndarray | float
+        The continuously compounded dividend yield(s).
+    t : np.ndarray | float
+        The time(s) to maturity, in years.
+    sigma : np.ndarray | float
+        The volatility (or volatilities).
+    call : np.ndarray | bool, optional
+        True for calls, False for puts; may be a boolean array. Defaults to True.
+
+    Returns
+    -------
+    np.ndarray
+        A contiguous float64 array of option prices with the broadcast shape.
+    """
+    # At least 1-d, so the ufuncs below always return writable buffers
+    spot, strike, r, q, t, sigma, call = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(x, dtype=np.float64))
+            for x in (spot, strike, r, q, t, sigma)
+        ),
+        np.atleast_1d(np.asarray(call, dtype=bool)),
+    )
+    # Same algebra as _bsm_core, written into a few reused buffers so a large
+    # chain does not allocate a fresh temporary for every intermediate
+    sig_sqrt_t = np.sqrt(t)
+    sig_sqrt_t *= sigma
+    d1 = np.divide(spot, strike)
+    np.log(d1, out=d1)
+    drift = np.multiply(sigma, sigma)
+    drift *= 0.5
+    drift += r
+    drift -= q
+    drift *= t
+    d1 += drift
+    d1 /= sig_sqrt_t
+    d2 = np.subtract(d1, sig_sqrt_t)
+
+    # Put-call sign flip keeps a single ndtr evaluation per leg
+    sign = np.where(call, 1.0, -1.0)
+    d1 *= sign
+    d2 *= sign
+    ndtr(d1, out=d1)
+    ndtr(d2, out=d2)
+
+    # Reuse the drift and vol buffers for the two discounted legs
+    price = np.multiply(q, t, out=drift)
+    np.negative(price, out=price)
+    np.exp(price, out=price)
+    price *= spot
+    price *= d1
+    strike_leg = np.multiply(r, t, out=sig_sqrt_t)
+    np.negative(strike_leg, out=strike_leg)
+    np.exp(strike_leg, out=strike_leg)
+    strike_leg *= strike
+    strike_leg *= d2
+    price -= strike_leg
+    price *= sign
+    return np.ascontiguousarray(price)
+
+
+def bsm_greeks_vectorized(
+    spot: np.ndarray | float,
+    strike: np.ndarray | float,
+    r: np.ndarray | float,
+    q: np.ndarray | float,
+    t: np.ndarray | float,
+    sigma: np.ndarray | float,
+    call: np.ndarray | bool = True,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized Black-Scholes-Merton price and Greeks for a batch of options.
+
+    The price, delta, gamma, vega, theta and rho of every option are derived
+    from one evaluation of `d1`, `d2`, the two discount factors, two `ndtr`
+    calls and one density, instead of one pass per metric.
+
+    Parameters
+    ----------
+    spot : np.ndarray | float
+        The current price(s) of the underlying asset.
+    strike : np.ndarray | float
+        The strike price(s) of the options.
+    r : np.ndarray | float
+        The continuously compounded risk-free rate(s).
+    q : np.ndarray | float
+        The continuously compounded dividend yield(s).
+    t : np.ndarray | float
+        The time(s) to maturity, in years.
+    sigma : np.ndarray | float
+        The volatility (or volatilities).
+    call : np.ndarray | bool, optional
+        True for calls, False for puts; may be a boolean array. Defaults to True.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Arrays with the broadcast shape, keyed by 'price', 'delta', 'gamma',
+        'vega', 'theta' and 'rho'.
+    """
+    spot, strike, r, q, t, sigma, call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (spot, strike, r, q, t, sigma)),
+        np.asarray(call, dtype=bool),
+    )
+    sqrt_t, d1, d2 = _bsm_core(spot, strike, r, q, t, sigma)
+
+    df_div = np.exp(-q * t)
+    fwd_spot = spot * df_div
+    disc_strike = strike * np.exp(-r * t)
+    sign = np.where(call, 1.0, -1.0)
+    cdf_d1 = ndtr(sign * d1)
+    cdf_d2 = ndtr(sign * d2)
+    pdf_d1 = _norm_pdf(d1)
+
+    return {
+        "price": sign * (fwd_spot * cdf_d1 - disc_strike * cdf_d2),
+        "delta": sign * df_div * cdf_d1,
+        "gamma": df_div * pdf_d1 / (spot * sigma * sqrt_t),
+        "vega": fwd_spot * pdf_d1 * sqrt_t,
+        "theta": -fwd_spot * pdf_d1 * sigma / (2 * sqrt_t)
+        + sign * (q * fwd_spot * cdf_d1 - r * disc_strike * cdf_d2),
+        "rho": sign * t * disc_strike * cdf_d2,
+    }
+
+
 class BSMModel(BaseModel):
     """
     Black-Scholes-Merton (BSM) model for pricing European options.
@@ -75,6 +290,9 @@ class BSMModel(BaseModel):
         """
         Computes the Black-Scholes-Merton price in closed form.
 
+        Scalar inputs are dispatched to a JIT-compiled kernel; array inputs
+        fall back to `bsm_price_vectorized`.
+
         Parameters
         ----------
         spot : float
@@ -96,18 +314,61 @@ class BSMModel(BaseModel):
             The price of the European option.
         """
         sigma = self.params["sigma"]
-        sqrt_t = np.sqrt(t)
-        d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
-        d2 = d1 - sigma * sqrt_t
+        if _all_scalar(spot, strike, r, q, t):
+            return bsm_price_kernel(
+                float(spot), float(strike), float(r), float(q), float(t), sigma, call
+            )
 
-        df_div = np.exp(-q * t)
-        df_rate = np.exp(-r * t)
+        return bsm_price_vectorized(spot, strike, r, q, t, sigma, call)
 
-        if call:
-            price = spot * df_div * norm.cdf(d1) - strike * df_rate * norm.cdf(d2)
-        else:
-            price = strike * df_rate * norm.cdf(-d2) - spot * df_div * norm.cdf(-d1)
-        return price
+    def _scalar_greeks(
+        self,
+        spot: float,
+        strike: float,
+        r: float,
+        q: float,
+        t: float,
+        call: bool,
+    ) -> tuple[float, float, float, float, float, float] | None:
+        """
+        Price and Greeks from the memoized JIT-compiled kernel for scalars.
+
+        Returns None for array inputs, which take the NumPy path instead.
+        """
+        if not _all_scalar(spot, strike, r, q, t, call):
+            return None
+        call_leg, put_leg = _bsm_greeks_pair(
+            float(spot),
+            float(strike),
+            float(r),
+            float(q),
+            float(t),
+            float(self.params["sigma"]),
+        )
+        return call_leg if call else put_leg
+
+    def price_and_greeks_analytic(
+        self,
+        *,
+        spot: float,
+        strike: float,
+        r: float,
+        q: float,
+        t: float,
+        call: bool = True,
+    ) -> dict[str, float]:
+        """
+        Analytic price and Greeks for the BSM model from one shared evaluation.
+
+        Returns a dictionary keyed by 'price', 'delta', 'gamma', 'vega',
+        'theta' and 'rho'. Array inputs are evaluated element-wise.
+        """
+        scalar = self._scalar_greeks(spot, strike, r, q, t, call)
+        if scalar is None:
+            return bsm_greeks_vectorized(
+                spot, strike, r, q, t, self.params["sigma"], call
+            )
+        return dict(zip(("price", "delta", "gamma", "vega", "theta", "rho"), scalar))
 
     def delta_analytic(
         self,
@@ -120,12 +381,13 @@ class BSMModel(BaseModel):
         call: bool = True,
     ) -> float:
         """Analytic delta for the BSM model."""
+        scalar = self._scalar_greeks(spot, strike, r, q, t, call)
+        if scalar is not None:
+            return scalar[1]
         sigma = self.params["sigma"]
-        d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * t) / (
-            sigma * np.sqrt(t)
-        )
+        _, d1, _ = _bsm_core(spot, strike, r, q, t, sigma)
         df_div = np.exp(-q * t)
-        return df_div * norm.cdf(d1) if call else -df_div * norm.cdf(-d1)
+        return df_div * ndtr(d1) if call else -df_div * ndtr(-d1)
 
     def gamma_analytic(
         self,
@@ -137,11 +399,13 @@ class BSMModel(BaseModel):
         t: float,
     ) -> float:
         """Analytic gamma for the BSM model."""
+        scalar = self._scalar_greeks(spot, strike, r, q, t, True)
+        if scalar is not None:
+            return scalar[2]
         sigma = self.params["sigma"]
-        sqrt_t = np.sqrt(t)
-        d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+        sqrt_t, d1, _ = _bsm_core(spot, strike, r, q, t, sigma)
         df_div = np.exp(-q * t)
-        return df_div * norm.pdf(d1) / (spot * sigma * sqrt_t)
+        return df_div * _norm_pdf(d1) / (spot * sigma * sqrt_t)
 
     def vega_analytic(
         self,
@@ -153,10 +417,12 @@ class BSMModel(BaseModel):
         t: float,
     ) -> float:
         """Analytic vega for the BSM model."""
+        scalar = self._scalar_greeks(spot, strike, r, q, t, True)
+        if scalar is not None:
+            return scalar[3]
         sigma = self.params["sigma"]
-        sqrt_t = np.sqrt(t)
-        d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
-        return spot * np.exp(-q * t) * norm.pdf(d1) * sqrt_t
+        sqrt_t, d1, _ = _bsm_core(spot, strike, r, q, t, sigma)
+        return spot * np.exp(-q * t) * _norm_pdf(d1) * sqrt_t
 
     def theta_analytic(
         self,
@@ -169,17 +435,18 @@ class BSMModel(BaseModel):
         call: bool = True,
     ) -> float:
         """Analytic theta for the BSM model."""
+        scalar = self._scalar_greeks(spot, strike, r, q, t, call)
+        if scalar is not None:
+            return scalar[4]
         sigma = self.params["sigma"]
-        sqrt_t = np.sqrt(t)
-        d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
-        d2 = d1 - sigma * sqrt_t
-        term1 = -spot * np.exp(-q * t) * norm.pdf(d1) * sigma / (2 * sqrt_t)
+        sqrt_t, d1, d2 = _bsm_core(spot, strike, r, q, t, sigma)
+        term1 = -spot * np.exp(-q * t) * _norm_pdf(d1) * sigma / (2 * sqrt_t)
         if call:
-            term2 = q * spot * np.exp(-q * t) * norm.cdf(d1)
-            term3 = -r * strike * np.exp(-r * t) * norm.cdf(d2)
+            term2 = q * spot * np.exp(-q * t) * ndtr(d1)
+            term3 = -r * strike * np.exp(-r * t) * ndtr(d2)
         else:
-            term2 = -q * spot * np.exp(-q * t) * norm.cdf(-d1)
-            term3 = r * strike * np.exp(-r * t) * norm.cdf(-d2)
+            term2 = -q * spot * np.exp(-q * t) * ndtr(-d1)
+            term3 = r * strike * np.exp(-r * t) * ndtr(-d2)
         return term1 + term2 + term3
 
     def rho_analytic(
@@ -193,11 +460,13 @@ class BSMModel(BaseModel):
         call: bool = True,
     ) -> float:
         """Analytic rho for the BSM model."""
+        scalar = self._scalar_greeks(spot, strike, r, q, t, call)
+        if scalar is not None:
+            return scalar[5]
         sigma = self.params["sigma"]
-        sqrt_t = np.sqrt(t)
-        d2 = (np.log(spot / strike) + (r - q - 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+        _, _, d2 = _bsm_core(spot, strike, r, q, t, sigma)
         df_rate = np.exp(-r * t)
-        return strike * t * df_rate * (norm.cdf(d2) if call else -norm.cdf(-d2))
+        return strike * t * df_rate * (ndtr(d2) if call else -ndtr(-d2))
 
     def _cf_impl(
         self,
@@ -230,10 +499,12 @@ class BSMModel(BaseModel):
         sigma = self.params["sigma"]
         drift = r - q - 0.5 * sigma**2
 
+        # Constants of the closure, computed once per maturity
+        log_fwd = np.log(spot) + drift * t
+        half_var_t = 0.5 * sigma**2 * t
+
         def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            mean_component = 1j * u * (np.log(spot) + drift * t)
-            variance_component = -0.5 * (u**2) * (sigma**2) * t
-            return np.exp(mean_component + variance_component)
+            return np.exp(1j * u * log_fwd - half_var_t * u**2)
 
         return phi
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
+from scipy.stats import ncx2
 
 from optpricing.models.base import BaseModel, ParamValidator
 
@@ -76,8 +77,6 @@ class CEVModel(BaseModel):
         np.ndarray
             An array of simulated terminal spot prices.
         """
-        from scipy.stats import ncx2
-
         p = self.params
         sigma, gamma = p["sigma"], p["gamma"]
 
@@ -92,11 +92,17 @@ class CGMYModel(BaseModel):
         CF
             The characteristic function.
         """
-        compensator = np.log(self.raw_cf(t=1.0)(-1j))
+        # log E[exp(X_1)], read straight off the exponent
+        compensator = self._raw_exponent(t=1.0)(-1j)
         drift = r - q - np.real(compensator)
 
+        # Built once per maturity, not on every evaluation of phi
+        raw_exponent = self._raw_exponent(t=t)
+        log_fwd = np.log(spot) + drift * t
+
         def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            return self.raw_cf(t=t)(u) * np.exp(1j * u * (np.log(spot) + drift * t))
+            # Drift and jump exponents share a single exp
+            return np.exp(raw_exponent(u) + 1j * u * log_fwd)
 
         return phi
 
@@ -117,20 +123,52 @@ class CGMYModel(BaseModel):
         Callable
             The raw characteristic function.
         """
-        p = self.params
-        C, G, M, Y = p["C"], p["G"], p["M"], p["Y"]
+        raw_exponent = self._raw_exponent(t=t)
 
         def phi_raw(u: np.ndarray | complex) -> np.ndarray | complex:
-            term = (
-                C
-                * t
-                * gamma_func(-Y)
-                * ((M - 1j * u) ** Y - M**Y + (G + 1j * u) ** Y - G**Y)
-            )
-            return np.exp(term)
+            return np.exp(raw_exponent(u))
 
         return phi_raw
 
+    def _raw_exponent(self, *, t: float) -> Callable:
+        """
+        Returns the log of the raw CF, t * psi(u), as a closure.
+
+        gamma(-Y) has poles at Y = 0 and Y = 1, where the power bracket also
+        vanishes. There the exponent is the finite limit, the Y-derivative of
+        the bracket (with the sign of the pole's residue), in log form.
+        """
+        p = self.params
+        C, G, M, Y = p["C"], p["G"], p["M"], p["Y"]
+        ct = C * t
+
+        if np.isclose(Y, 1.0):
+            base = M * np.log(M) + G * np.log(G)
+
+            def exponent_y1(u: np.ndarray | complex) -> np.ndarray | complex:
+                m_iu, g_iu = M - 1j * u, G + 1j * u
+                return ct * (m_iu * np.log(m_iu) + g_iu * np.log(g_iu) - base)
+
+            return exponent_y1
+
+        if np.isclose(Y, 0.0):
+
+            def exponent_y0(u: np.ndarray | complex) -> np.ndarray | complex:
+                iu = 1j * u
+                return -ct * (np.log(1 - iu / M) + np.log(1 + iu / G))
+
+            return exponent_y0
+
+        # gamma(-Y) and the u-independent powers are constants of the closure
+        scale = ct * gamma_func(-Y)
+        base = M**Y + G**Y
+
+        def exponent(u: np.ndarray | complex) -> np.ndarray | complex:
+            iu = 1j * u
+            return scale * ((M - iu) ** Y + (G + iu) ** Y - base)
+
+        return exponent
+
     def sample_terminal_log_return(
         self,
         T: float,
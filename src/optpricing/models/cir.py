@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numpy as np
+
 from optpricing.models.base import BaseModel, ParamValidator
 
 __doc__ = """
@@ -43,9 +45,9 @@ class CIRModel(BaseModel):
         self,
         *,
         spot: float,
-        t: float,
+        t: float | np.ndarray,
         **_: Any,
-    ) -> float:
+    ) -> float | np.ndarray:
         """
         Calculates the price of a Zero-Coupon Bond.
 
@@ -56,27 +58,29 @@ class CIRModel(BaseModel):
         ----------
         spot : float
             The initial short rate, r0.
-        t : float
-            The maturity of the bond, in years.
+        t : float | np.ndarray
+            The maturity of the bond, in years. An array of maturities prices
+            a whole discount curve in one call.
 
         Returns
         -------
-        float
-            The price of the zero-coupon bond.
+        float | np.ndarray
+            The price(s) of the zero-coupon bond(s).
         """
         r0, T = spot, t
         p = self.params
         kappa, theta, sigma = p["kappa"], p["theta"], p["sigma"]
 
         gamma = math.sqrt(kappa**2 + 2 * sigma**2)
-        exp_gamma_T = math.exp(gamma * T)
+        # exp(gamma * T) - 1 without the cancellation at short maturities
+        growth = np.expm1(gamma * T)
 
-        den = (gamma + kappa) * (exp_gamma_T - 1) + 2 * gamma
-        B = 2 * (exp_gamma_T - 1) / den
-        A_log_base = (2 * gamma * math.exp((kappa + gamma) * T / 2)) / den
+        den = (gamma + kappa) * growth + 2 * gamma
+        B = 2 * growth / den
+        A_log_base = (2 * gamma * np.exp((kappa + gamma) * T / 2)) / den
         A_log_power = (2 * kappa * theta) / sigma**2
 
-        price = (A_log_base**A_log_power) * math.exp(-B * r0)
+        price = (A_log_base**A_log_power) * np.exp(-B * r0)
         return price
 
     #  Abstract Method Implementations
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import math
+
+import numba
+import numpy as np
+
+__doc__ = """
+This module contains JIT-compiled (`numba`) kernels for scalar closed-form
+pricing. They avoid the per-call dispatch overhead of `scipy.stats.norm` when
+a single option (or a short series of options) is priced at a time, and a
+fused loop prices a whole BSM chain without NumPy temporaries.
+"""
+
+_INV_SQRT_2 = 0.7071067811865476
+_INV_SQRT_2PI = 0.3989422804014327
+# Phi(-8.5) < 1e-17, so beyond this the normal CDF rounds to 0 or 1
+_CDF_SATURATION = 8.5
+
+
+# Docstring for _norm_cdf
+"""
+Standard normal CDF expressed through the complementary error function.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def _norm_cdf(x):
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+# Docstring for bsm_price_kernel
+"""
+JIT-compiled kernel for the scalar Black-Scholes-Merton price of a European
+call or put with continuous dividend yield q. Deep in- or out-of-the-money
+options, where both CDFs saturate, are priced without evaluating erfc.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def bsm_price_kernel(
+    spot,
+    strike,
+    r,
+    q,
+    t,
+    sigma,
+    call,
+):
+    sqrt_t = math.sqrt(t)
+    sig_sqrt_t = sigma * sqrt_t
+    d1 = (math.log(spot / strike) + (r - q + 0.5 * sigma * sigma) * t) / sig_sqrt_t
+    d2 = d1 - sig_sqrt_t
+    fwd_spot = spot * math.exp(-q * t)
+    disc_strike = strike * math.exp(-r * t)
+    # Deep in the wings both CDFs are 0 or 1 to double precision: skip erfc
+    if d2 > _CDF_SATURATION:
+        return fwd_spot - disc_strike if call else 0.0
+    if d1 < -_CDF_SATURATION:
+        return 0.0 if call else disc_strike - fwd_spot
+    if call:
+        return fwd_spot * _norm_cdf(d1) - disc_strike * _norm_cdf(d2)
+    return disc_strike * _norm_cdf(-d2) - fwd_spot * _norm_cdf(-d1)
+
+
+# Docstring for bsm_chain_kernel
+"""
+JIT-compiled kernel pricing a whole option chain under Black-Scholes-Merton.
+Strikes, rates, maturities and call flags are per-option arrays while spot,
+dividend yield and volatility are shared. Each option is priced by the scalar
+kernel inside one fused, parallel loop, so no intermediate arrays are built.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
+def bsm_chain_kernel(
+    spot,
+    strikes,
+    r,
+    q,
+    t,
+    sigma,
+    call,
+):
+    n = strikes.shape[0]
+    out = np.empty(n)
+    for i in numba.prange(n):
+        out[i] = bsm_price_kernel(spot, strikes[i], r[i], q, t[i], sigma, call[i])
+    return out
+
+
+# Docstring for bsm_greeks_kernel
+"""
+JIT-compiled kernel for the scalar Black-Scholes-Merton price and Greeks.
+Returns `(price, delta, gamma, vega, theta, rho)`, all built from a single
+evaluation of d1, d2, the discount factors, two CDFs and one density.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def bsm_greeks_kernel(
+    spot,
+    strike,
+    r,
+    q,
+    t,
+    sigma,
+    call,
+):
+    sqrt_t = math.sqrt(t)
+    sig_sqrt_t = sigma * sqrt_t
+    d1 = (math.log(spot / strike) + (r - q + 0.5 * sigma * sigma) * t) / sig_sqrt_t
+    d2 = d1 - sig_sqrt_t
+    df_div = math.exp(-q * t)
+    fwd_spot = spot * df_div
+    disc_strike = strike * math.exp(-r * t)
+    sign = 1.0 if call else -1.0
+    cdf_d1 = _norm_cdf(sign * d1)
+    cdf_d2 = _norm_cdf(sign * d2)
+    pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+
+    price = sign * (fwd_spot * cdf_d1 - disc_strike * cdf_d2)
+    delta = sign * df_div * cdf_d1
+    gamma = df_div * pdf_d1 / (spot * sig_sqrt_t)
+    vega = fwd_spot * pdf_d1 * sqrt_t
+    theta = -fwd_spot * pdf_d1 * sigma / (2.0 * sqrt_t) + sign * (
+        q * fwd_spot * cdf_d1 - r * disc_strike * cdf_d2
+    )
+    rho = sign * t * disc_strike * cdf_d2
+    return price, delta, gamma, vega, theta, rho
+
+
+# Docstring for merton_series_kernel
+"""
+JIT-compiled kernel for Merton's closed-form price as a Poisson-weighted sum
+of BSM prices. Everything that does not depend on the jump count n is hoisted
+out of the series: the log-moneyness, forward spot and base discount factor
+are computed once, the per-term discount factor is updated multiplicatively,
+and the Poisson log-weights are accumulated incrementally instead of calling
+`lgamma` per term. The series is truncated once the weights become negligible
+past the mean. Without jumps the series is the plain BSM price, returned
+directly: the weights would need log(0), which is undefined under fastmath.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def merton_series_kernel(
+    spot,
+    strike,
+    r,
+    q,
+    t,
+    sigma,
+    lambda_,
+    mu_j,
+    sigma_j,
+    max_sum_terms,
+    call,
+):
+    if lambda_ == 0.0:
+        return bsm_price_kernel(spot, strike, r, q, t, sigma, call)
+
+    jump_mean = mu_j + 0.5 * sigma_j * sigma_j
+    k = math.exp(jump_mean) - 1.0
+    y_mul = lambda_ * (1.0 + k) * t
+    log_y_mul = math.log(y_mul)
+    r_base = r - lambda_ * k
+
+    # n-independent pieces of the BSM terms
+    log_moneyness = math.log(spot / strike) + (r_base - q) * t
+    fwd_spot = spot * math.exp(-q * t)
+    disc_strike = strike * math.exp(-r_base * t)
+    disc_step = math.exp(-jump_mean)
+    diff_var = sigma * sigma * t
+    jump_var = sigma_j * sigma_j
+
+    total_price = 0.0
+    log_weight = -y_mul
+    for n in range(max_sum_terms):
+        if n > 0:
+            log_weight += log_y_mul - math.log(n)
+            disc_strike *= disc_step
+            log_moneyness += jump_mean
+        weight = math.exp(log_weight)
+        # Terminate sum early if weights become negligible
+        if weight < 1e-12 and n > y_mul:
+            break
+
+        sig_sqrt_t = math.sqrt(max(diff_var + n * jump_var, 1e-12 * t))
+        d1 = log_moneyness / sig_sqrt_t + 0.5 * sig_sqrt_t
+        d2 = d1 - sig_sqrt_t
+        if call:
+            price = fwd_spot * _norm_cdf(d1) - disc_strike * _norm_cdf(d2)
+        else:
+            price = disc_strike * _norm_cdf(-d2) - fwd_spot * _norm_cdf(-d1)
+        total_price += weight * price
+
+    return total_price
+
+
+# Docstring for bsm_implied_vol_kernel
+"""
+JIT-compiled kernel for the Black-Scholes-Merton implied volatility.
+
+The price is normalised to an undiscounted out-of-the-money option on the
+forward (via put-call parity), which keeps the full time value available at
+every strike. A Corrado-Miller rational guess, with a Manaster-Koehler
+fallback, seeds safeguarded Halley (second-order Householder) iterations: a
+step that leaves the current bracket is replaced by bisection. Returns NaN if
+the price violates the no-arbitrage bounds or the iteration does not converge.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def bsm_implied_vol_kernel(
+    price,
+    spot,
+    strike,
+    r,
+    q,
+    t,
+    call,
+    low,
+    high,
+    tol,
+    max_iter,
+):
+    fwd = spot * math.exp((r - q) * t)
+    undiscounted = price * math.exp(r * t)
+    # theta = +1 prices an OTM call, theta = -1 an OTM put
+    theta = 1.0 if strike >= fwd else -1.0
+    if call and theta < 0.0:
+        undiscounted -= fwd - strike
+    elif not call and theta > 0.0:
+        undiscounted += fwd - strike
+
+    upper_bound = fwd if theta > 0.0 else strike
+    if undiscounted <= 0.0 or undiscounted >= upper_bound:
+        return math.nan
+
+    sqrt_t = math.sqrt(t)
+    log_moneyness = math.log(fwd / strike)
+
+    # Corrado-Miller (1996) rational approximation, in terms of the call price
+    call_price = undiscounted if theta > 0.0 else undiscounted + fwd - strike
+    half_moneyness = 0.5 * (fwd - strike)
+    excess = call_price - half_moneyness
+    radicand = excess * excess - 4.0 * half_moneyness * half_moneyness / math.pi
+    sigma = 0.0
+    if radicand > 0.0:
+        total_vol = math.sqrt(2.0 * math.pi) * (excess + math.sqrt(radicand))
+        sigma = total_vol / ((fwd + strike) * sqrt_t)
+    if not (low < sigma < high):
+        # Manaster-Koehler (1982) starting point
+        sigma = math.sqrt(2.0 * abs(log_moneyness) / t)
+        if not (low < sigma < high):
+            sigma = 0.5 * (low + high)
+
+    for _ in range(max_iter):
+        sig_sqrt_t = sigma * sqrt_t
+        d1 = log_moneyness / sig_sqrt_t + 0.5 * sig_sqrt_t
+        d2 = d1 - sig_sqrt_t
+        model = theta * (fwd * _norm_cdf(theta * d1) - strike * _norm_cdf(theta * d2))
+        diff = model - undiscounted
+
+        # Option prices increase with sigma, so diff tightens the bracket
+        if diff > 0.0:
+            high = sigma
+        else:
+            low = sigma
+
+        vega = fwd * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI * sqrt_t
+        new_sigma = -1.0
+        if vega > 1e-300:
+            newton = diff / vega
+            halley = 1.0 - 0.5 * newton * d1 * d2 / sigma
+            # Fall back to a plain Newton step when the correction is unstable
+            step = newton / halley if halley > 0.5 else newton
+            new_sigma = sigma - step
+        if not (low < new_sigma < high):
+            new_sigma = 0.5 * (low + high)
+
+        if abs(new_sigma - sigma) < tol:
+            return new_sigma
+        sigma = new_sigma
+
+    return math.nan
+
+
+# Docstring for bsm_implied_vol_chain_kernel
+"""
+JIT-compiled kernel inverting a whole option chain for BSM implied
+volatilities. Prices, strikes, rates, maturities and call flags are
+per-option arrays; each option runs the scalar Halley solver inside one
+parallel loop, so no NumPy temporaries are created per iteration.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
+def bsm_implied_vol_chain_kernel(
+    prices,
+    spot,
+    strikes,
+    r,
+    q,
+    t,
+    call,
+    low,
+    high,
+    tol,
+    max_iter,
+):
+    n = prices.shape[0]
+    out = np.empty(n)
+    for i in numba.prange(n):
+        out[i] = bsm_implied_vol_kernel(
+            prices[i],
+            spot,
+            strikes[i],
+            r[i],
+            q,
+            t[i],
+            call[i],
+            low,
+            high,
+            tol,
+            max_iter,
+        )
+    return out
@@ -6,6 +6,7 @@ from typing import Any
 import numpy as np
 
 from optpricing.models.base import CF, BaseModel, ParamValidator
+from optpricing.models.cf_kernels import heston_cf_grid_kernel, heston_cf_kernel
 
 __doc__ = """
 Defines the Heston stochastic volatility model.
@@ -142,22 +143,16 @@ class HestonModel(BaseModel):
             p["vol_of_vol"],
         )
 
+        log_spot = np.log(spot)
+        # Plain floats keep a single compiled specialisation of the kernel
+        args = tuple(map(float, (t, log_spot, r, q, v0, kappa, theta, rho, vol_of_vol)))
+
         def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            d = np.sqrt(
-                (rho * vol_of_vol * u * 1j - kappa) ** 2
-                - (vol_of_vol**2) * (-u * 1j - u**2)
-            )
-            g = (kappa - rho * vol_of_vol * u * 1j - d) / (
-                kappa - rho * vol_of_vol * u * 1j + d
-            )
-            C = (r - q) * u * 1j * t + (kappa * theta / vol_of_vol**2) * (
-                (kappa - rho * vol_of_vol * u * 1j - d) * t
-                - 2 * np.log((1 - g * np.exp(-d * t)) / (1 - g))
-            )
-            D = ((kappa - rho * vol_of_vol * u * 1j - d) / vol_of_vol**2) * (
-                (1 - np.exp(-d * t)) / (1 - g * np.exp(-d * t))
-            )
-            return np.exp(C + D * v0 + 1j * u * np.log(spot))
+            # One compiled call per node (or per grid) instead of NumPy dispatch
+            if np.ndim(u) == 0:
+                return heston_cf_kernel(complex(u), *args)
+            nodes = np.asarray(u, dtype=np.complex128)
+            return heston_cf_grid_kernel(nodes.ravel(), *args).reshape(nodes.shape)
 
         return phi
 
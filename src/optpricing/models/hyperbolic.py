@@ -84,8 +84,12 @@ class HyperbolicModel(BaseModel):
         compensator = np.log(self.raw_cf(t=1.0)(-1j))  # E[exp(X_1)] = phi_raw(-i)
         drift = r - q - compensator
 
+        # Built once per maturity, not on every evaluation of phi
+        phi_raw = self.raw_cf(t=t)
+        log_fwd = np.log(spot) + drift * t
+
         def phi(u: np.ndarray | complex):
-            return self.raw_cf(t=t)(u) * np.exp(1j * u * (np.log(spot) + drift * t))
+            return phi_raw(u) * np.exp(1j * u * log_fwd)
 
         return phi
 
@@ -108,14 +112,16 @@ class HyperbolicModel(BaseModel):
         """
         p = self.params
         alpha, beta, delta, mu = p["alpha"], p["beta"], p["delta"], p["mu"]
-        gamma_0 = np.sqrt(alpha**2 - beta**2)
+        alpha2 = alpha**2
+        gamma_0 = np.sqrt(alpha2 - beta**2)
+        mu_t, delta_t = mu * t, delta * t
+        # The Bessel value at gamma_0 does not depend on u
+        kv_0 = kv(1, delta_t * gamma_0)
 
         def phi_raw(u: np.ndarray | complex) -> np.ndarray | complex:
-            gamma_u = np.sqrt(alpha**2 - (beta + 1j * u) ** 2)
-            term1 = np.exp(1j * u * mu * t)
-            term2 = (gamma_0 / gamma_u) ** t * (
-                kv(1, delta * t * gamma_u) / kv(1, delta * t * gamma_0)
-            )
+            gamma_u = np.sqrt(alpha2 - (beta + 1j * u) ** 2)
+            term1 = np.exp(1j * u * mu_t)
+            term2 = (gamma_0 / gamma_u) ** t * (kv(1, delta_t * gamma_u) / kv_0)
             return term1 * term2
 
         return phi_raw
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import cmath
 from typing import Any
 
 import numpy as np
 
 from optpricing.models.base import CF, BaseModel, ParamValidator
+from optpricing.models.cf_kernels import kou_cf_grid_kernel
 
 __doc__ = """
 Defines the Kou double-exponential jump-diffusion model.
@@ -125,16 +127,37 @@ class KouModel(BaseModel):
         )
         drift = r - q - 0.5 * sigma**2 - compensator
 
+        # Constants of the closure, computed once per maturity as plain Python
+        # numbers, so a single node is evaluated without NumPy scalar dispatch
+        log_fwd = float(np.log(spot) + drift * t)
+        half_var_t = float(0.5 * sigma**2 * t)
+        lam_t = float(lambda_ * t)
+        up_weight, down_weight = float(p_up * eta1), float((1 - p_up) * eta2)
+        eta1, eta2 = float(eta1), float(eta2)
+
         def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            # BSM component
-            bsm_part = 1j * u * (np.log(spot) + drift * t) - 0.5 * u**2 * sigma**2 * t
+            if not isinstance(u, complex | float):
+                # A grid goes through one fused, compiled sweep
+                nodes = np.asarray(u, dtype=np.complex128)
+                out = kou_cf_grid_kernel(
+                    nodes.ravel(),
+                    log_fwd,
+                    half_var_t,
+                    lam_t,
+                    up_weight,
+                    down_weight,
+                    eta1,
+                    eta2,
+                )
+                return out.reshape(nodes.shape)
+            # cmath for one node (adaptive quadrature)
+            iu = 1j * u
             # Jump component
-            phi_jump = (p_up * eta1 / (eta1 - 1j * u)) + (
-                (1 - p_up) * eta2 / (eta2 + 1j * u)
+            phi_jump = up_weight / (eta1 - iu) + down_weight / (eta2 + iu)
+            # BSM and jump components share a single exponent
+            return cmath.exp(
+                iu * log_fwd - half_var_t * u * u + lam_t * (phi_jump - 1.0)
             )
-            jump_part = lambda_ * t * (phi_jump - 1)
-
-            return np.exp(bsm_part + jump_part)
 
         return phi
 
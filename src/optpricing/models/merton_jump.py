@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import math
+import cmath
 from typing import Any
 
 import numpy as np
-from scipy.special import factorial
 
 from optpricing.models.base import CF, BaseModel, ParamValidator
 from optpricing.models.bsm import BSMModel
+from optpricing.models.cf_kernels import merton_cf_grid_kernel
+from optpricing.models.closed_form_kernels import merton_series_kernel
 
 __doc__ = """
 Defines the Merton jump-diffusion model.
@@ -98,6 +99,8 @@ class MertonJumpModel(BaseModel):
         """
         Merton's closed-form solution as a sum of BSM prices.
 
+        The Poisson-weighted series is evaluated by a JIT-compiled kernel.
+
         Parameters
         ----------
         spot : float
@@ -118,36 +121,20 @@ class MertonJumpModel(BaseModel):
         float
             The price of the European option.
         """
-        lambda_ = self.params["lambda"]
-        mu_j = self.params["mu_j"]
-        sigma_j = self.params["sigma_j"]
-        max_sum_terms = int(self.params["max_sum_terms"])
-
-        k = math.exp(mu_j + 0.5 * sigma_j**2) - 1
-        lambda_prime = lambda_ * (1 + k)
-        y_mul = lambda_prime * t
-
-        interval = np.arange(max_sum_terms)
-        weights = np.exp(-y_mul) * (y_mul**interval) / factorial(interval)
-
-        r_n = r - lambda_ * k + (interval * (mu_j + 0.5 * sigma_j**2)) / t
-        sigma_n_sq = self.params["sigma"] ** 2 + (interval * sigma_j**2) / t
-        sigma_n = np.sqrt(np.maximum(sigma_n_sq, 1e-12))
-
-        total_price = 0.0
-        for i in range(max_sum_terms):
-            # Terminate sum early if weights become negligible
-            if weights[i] < 1e-12 and i > lambda_prime * t:
-                break
-
-            temp_bsm_solver = self.bsm_solver.with_params(sigma=sigma_n[i])
-
-            price_term = temp_bsm_solver.price_closed_form(
-                spot=spot, strike=strike, r=r_n[i], q=q, t=t, call=call
-            )
-            total_price += weights[i] * price_term
-
-        return total_price
+        p = self.params
+        return merton_series_kernel(
+            float(spot),
+            float(strike),
+            float(r),
+            float(q),
+            float(t),
+            p["sigma"],
+            p["lambda"],
+            p["mu_j"],
+            p["sigma_j"],
+            int(p["max_sum_terms"]),
+            bool(call),
+        )
 
     def _cf_impl(
         self,
@@ -182,15 +169,28 @@ class MertonJumpModel(BaseModel):
         drift = r - q - 0.5 * sigma**2
         compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
 
+        # Constants of the closure, computed once per maturity as plain Python
+        # numbers, so a single node is evaluated without NumPy scalar dispatch
+        log_fwd = float(np.log(spot) + (drift - compensator) * t)
+        i_log_fwd = 1j * log_fwd
+        half_var_t = float(0.5 * sigma**2 * t)
+        lam_t = float(lambda_ * t)
+        mu_j = float(mu_j)
+        i_mu_j = 1j * mu_j
+        half_sigma_j2 = float(0.5 * sigma_j**2)
+
         def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            bsm_part = (
-                1j * u * (np.log(spot) + (drift - compensator) * t)
-                - 0.5 * u**2 * sigma**2 * t
-            )
-            jump_part = (
-                lambda_ * t * (np.exp(1j * u * mu_j - 0.5 * u**2 * sigma_j**2) - 1)
-            )
-            return np.exp(bsm_part + jump_part)
+            if not isinstance(u, complex | float):
+                # A grid goes through one fused, compiled sweep
+                nodes = np.asarray(u, dtype=np.complex128)
+                out = merton_cf_grid_kernel(
+                    nodes.ravel(), log_fwd, half_var_t, lam_t, mu_j, half_sigma_j2
+                )
+                return out.reshape(nodes.shape)
+            # cmath for one node (adaptive quadrature), as a single exponent
+            u2 = u * u
+            jump_part = lam_t * (cmath.exp(i_mu_j * u - half_sigma_j2 * u2) - 1.0)
+            return cmath.exp(i_log_fwd * u - half_var_t * u2 + jump_part)
 
         return phi
 
@@ -210,13 +210,13 @@ class MertonJumpModel(BaseModel):
         ) -> np.ndarray:
             drift_term = (r - q - 0.5 * sigma**2 - compensator) * dt
             next_log_s = log_s_t + drift_term + sigma * dw_t
-            paths_with_jumps = np.where(jump_counts > 0)[0]
-            for path_idx in paths_with_jumps:
-                num_jumps_on_path = jump_counts[path_idx]
-                total_jump_size = np.sum(
-                    rng.normal(loc=mu_j, scale=sigma_j, size=num_jumps_on_path)
-                )
-                next_log_s[path_idx] += total_jump_size
+            # n i.i.d. N(mu_j, sigma_j^2) jumps sum to N(n*mu_j, n*sigma_j^2),
+            # so every jumping path is served by one vectorized draw
+            paths_with_jumps = np.flatnonzero(jump_counts > 0)
+            num_jumps = jump_counts[paths_with_jumps]
+            next_log_s[paths_with_jumps] += rng.normal(
+                loc=num_jumps * mu_j, scale=np.sqrt(num_jumps) * sigma_j
+            )
             return next_log_s
 
         return stepper
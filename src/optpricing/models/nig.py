@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import cmath
 from collections.abc import Callable
 from typing import Any
 
 import numpy as np
+from scipy.stats import invgauss
 
 from optpricing.models.base import CF, BaseModel, ParamValidator
 
@@ -86,17 +88,22 @@ class NIGModel(BaseModel):
         )
         drift = r - q + compensator
 
+        # Constants of the closure, computed once per maturity as plain Python
+        # numbers, so a single node is evaluated without NumPy scalar dispatch
+        log_fwd = float(np.log(spot) + drift * t)
+        delta_t = float(delta * t)
+        alpha2, beta = float(alpha**2), float(beta)
+        gamma_0 = float(np.sqrt(alpha2 - beta**2))
+
         def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            term1 = 1j * u * (np.log(spot) + drift * t)
-            term2 = (
-                delta
-                * t
-                * (
-                    np.sqrt(alpha**2 - beta**2)
-                    - np.sqrt(alpha**2 - (beta + 1j * u) ** 2)
-                )
-            )
-            return np.exp(term1 + term2)
+            # cmath for one node (adaptive quadrature), NumPy for a grid
+            if isinstance(u, complex | float):
+                sqrt, exp = cmath.sqrt, cmath.exp
+            else:
+                sqrt, exp = np.sqrt, np.exp
+            term1 = 1j * u * log_fwd
+            term2 = delta_t * (gamma_0 - sqrt(alpha2 - (beta + 1j * u) ** 2))
+            return exp(term1 + term2)
 
         return phi
 
@@ -159,8 +166,6 @@ class NIGModel(BaseModel):
         np.ndarray
             An array of simulated terminal log-returns.
         """
-        from scipy.stats import invgauss
-
         p = self.params
         alpha, beta, delta = p["alpha"], p["beta"], p["delta"]
         mu_ig = delta * T / np.sqrt(alpha**2 - beta**2)
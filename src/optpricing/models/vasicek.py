@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import math
 from typing import Any
 
+import numpy as np
+
 from optpricing.models.base import BaseModel, ParamValidator
 
 __doc__ = """
@@ -44,9 +45,9 @@ class VasicekModel(BaseModel):
         self,
         *,
         spot: float,
-        t: float,
+        t: float | np.ndarray,
         **_: Any,
-    ) -> float:
+    ) -> float | np.ndarray:
         """
         Calculates the price of a Zero-Coupon Bond.
 
@@ -57,24 +58,26 @@ class VasicekModel(BaseModel):
         ----------
         spot : float
             The initial short rate, r0.
-        t : float
-            The maturity of the bond, in years.
+        t : float | np.ndarray
+            The maturity of the bond, in years. An array of maturities prices
+            a whole discount curve in one call.
 
         Returns
         -------
-        float
-            The price of the zero-coupon bond.
+        float | np.ndarray
+            The price(s) of the zero-coupon bond(s).
         """
         r0, T = spot, t
         p = self.params
         kappa, theta, sigma = p["kappa"], p["theta"], p["sigma"]
 
-        B = (1 / kappa) * (1 - math.exp(-kappa * T))
+        # expm1 keeps B accurate where kappa * T is small and 1 - exp cancels
+        B = -np.expm1(-kappa * T) / kappa
         A_log = (theta - sigma**2 / (2 * kappa**2)) * (B - T) - (
             sigma**2 / (4 * kappa)
         ) * B**2
 
-        price = math.exp(A_log - B * r0)
+        price = np.exp(A_log - B * r0)
         return price
 
     #  Abstract Method Implementations
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import cmath
 from collections.abc import Callable
 from typing import Any
 
@@ -100,11 +101,29 @@ class VarianceGammaModel(BaseModel):
         CF
             The characteristic function.
         """
-        compensator = np.log(self.raw_cf(t=1.0)(-1j))
+        p = self.params
+        sigma, nu, theta = p["sigma"], p["nu"], p["theta"]
+        theta_nu = float(theta * nu)
+        half_var_nu = float(0.5 * sigma**2 * nu)
+        power = float(-t / nu)
+
+        # log E[exp(X_1)]: at u = -i the base of the power is the real number
+        # 1 - theta * nu - sigma^2 * nu / 2, so no complex power is needed
+        compensator = -cmath.log(1.0 - theta_nu - half_var_nu) / nu
         drift = r - q - compensator
 
+        # Built once per maturity, not on every evaluation of phi
+        phi_raw = self.raw_cf(t=t)
+        i_log_fwd = 1j * complex(np.log(spot) + drift * t)
+
         def phi(u: np.ndarray | complex) -> np.ndarray | complex:
-            return self.raw_cf(t=t)(u) * np.exp(1j * u * (np.log(spot) + drift * t))
+            if isinstance(u, complex | float):
+                # One node (adaptive quadrature): the power as exp(power * log)
+                # shares its exp with the drift
+                base = 1.0 - 1j * u * theta_nu + half_var_nu * u * u
+                return cmath.exp(power * cmath.log(base) + i_log_fwd * u)
+            # A grid keeps NumPy's power, cheaper than a complex log array
+            return phi_raw(u) * np.exp(i_log_fwd * u)
 
         return phi
 
@@ -128,8 +147,13 @@ class VarianceGammaModel(BaseModel):
         p = self.params
         sigma, nu, theta = p["sigma"], p["nu"], p["theta"]
 
+        # Plain Python numbers keep single-node evaluation off NumPy scalars
+        theta_nu = float(theta * nu)
+        half_var_nu = float(0.5 * sigma**2 * nu)
+        power = float(-t / nu)
+
         def phi_raw(u: np.ndarray | complex) -> np.ndarray | complex:
-            return (1 - 1j * u * theta * nu + 0.5 * u**2 * sigma**2 * nu) ** (-t / nu)
+            return (1 - 1j * u * theta_nu + half_var_nu * u * u) ** power
 
         return phi_raw
 
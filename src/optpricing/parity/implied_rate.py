@@ -3,8 +3,6 @@ from __future__ import annotations
 import math
 from typing import Any
 
-from scipy.optimize import brentq
-
 from optpricing.models.base import BaseModel
 
 __doc__ = """
@@ -42,7 +40,11 @@ class ImpliedRateModel(BaseModel):
         **_: Any,
     ) -> float:
         """
-        Solves for the implied risk-free rate using a root-finding algorithm.
+        Solves put-call parity for the implied risk-free rate in closed form.
+
+        The parity relation is linear in the discount factor `exp(-rT)`, so
+        the rate follows directly from a single logarithm; no iterative
+        root search is needed.
 
         Parameters
         ----------
@@ -67,33 +69,19 @@ class ImpliedRateModel(BaseModel):
         Raises
         ------
         ValueError
-            If a root cannot be bracketed within a reasonable range.
+            If no positive discount factor satisfies parity (an arbitrage in
+            the inputs) or the maturity is not positive.
         """
-        discounted_spot = spot * math.exp(-q * t)
-        price_difference = call_price - put_price
-
-        def objective_func(
-            r: float,
-        ) -> float:
-            """The put-call parity equation rearranged to equal zero."""
-            return discounted_spot - strike * math.exp(-r * t) - price_difference
-
-        # Attempt to find a bracket for the root
-        low, high = -0.5, 0.5
-        f_low, f_high = objective_func(low), objective_func(high)
-
-        for _ in range(10):  # Try up to 10 times to expand the bracket
-            if f_low * f_high < 0:
-                break
-            low -= 0.5
-            high += 0.5
-            f_low, f_high = objective_func(low), objective_func(high)
-        else:
+        # Parity is linear in the discount factor: K*exp(-rT) = S*exp(-qT) - (C - P)
+        discounted_strike = spot * math.exp(-q * t) - (call_price - put_price)
+        if t <= 0.0 or discounted_strike <= 0.0 or strike <= 0.0:
             raise ValueError(
-                "Unable to bracket a root for implied rate. Check input for arbitrage."
+                "No implied rate: parity needs K*exp(-rT) = S*exp(-qT) - (C - P) > 0, "
+                f"K > 0 and t > 0, got S*exp(-qT) - (C - P) = {discounted_strike:.6g}, "
+                f"K = {strike:.6g}, t = {t:.6g}. Check input for arbitrage."
             )
 
-        return brentq(objective_func, low, high, xtol=1e-9, maxiter=100)
+        return -math.log(discounted_strike / strike) / t
 
     # Abstract Method Implementations
     def _cf_impl(
@@ -8,7 +8,15 @@ import numpy as np
 
 from optpricing.atoms import Option, OptionType, Rate, Stock
 from optpricing.models import BaseModel, SABRJumpModel, SABRModel
-from optpricing.techniques.base import BaseTechnique, GreekMixin, IVMixin, PricingResult
+from optpricing.techniques.base import (
+    BaseTechnique,
+    GreekMixin,
+    IVMixin,
+    PricingResult,
+    double_exponential_jump_sizes,
+    make_rng,
+    normal_jump_sizes,
+)
 
 from .kernels.american_mc_kernels import longstaff_schwartz_pricer
 from .kernels.path_kernels import (
@@ -46,7 +54,7 @@ class AmericanMonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
         self.n_paths = n_paths
         self.n_steps = n_steps
         self.antithetic = antithetic
-        self.rng = np.random.default_rng(seed)
+        self.rng = make_rng(seed)
         self.lsm_degree = lsm_degree
 
     def price(
@@ -177,20 +185,38 @@ class AmericanMonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
         else:
             sim_params["log_s0"] = math.log(S0)
 
-        # Generate standard normal draws (z) first, then scale by sqrt(dt)
+        # Draw all standard normals in one bulk call, then scale by sqrt(dt)
         if model.has_variance_process:
-            z1 = self.rng.standard_normal(size=(num_draws, self.n_steps))
-            z2 = self.rng.standard_normal(size=(num_draws, self.n_steps))
-            sim_params["dw1"] = z1 * math.sqrt(dt)
-            sim_params["dw2"] = z2 * math.sqrt(dt)
+            z = self.rng.standard_normal(size=(2, num_draws, self.n_steps))
+            z *= math.sqrt(dt)
+            sim_params["dw1"], sim_params["dw2"] = z[0], z[1]
         else:
             z = self.rng.standard_normal(size=(num_draws, self.n_steps))
-            sim_params["dw"] = z * math.sqrt(dt)
+            z *= math.sqrt(dt)
+            sim_params["dw"] = z
 
         if model.has_jumps:
-            sim_params["jump_counts"] = self.rng.poisson(
+            jump_counts = self.rng.poisson(
                 lam=model.params["lambda"] * dt, size=(num_draws, self.n_steps)
             )
+            # The parallel kernels take pre-drawn jumps, so seeds reproduce
+            if kernel is kou_path_kernel:
+                sim_params["jump_sizes"] = double_exponential_jump_sizes(
+                    self.rng,
+                    jump_counts,
+                    kernel_params["p_up"],
+                    kernel_params["eta1"],
+                    kernel_params["eta2"],
+                )
+            elif kernel is sabr_jump_path_kernel:
+                sim_params["jump_counts"] = jump_counts
+            else:
+                sim_params["jump_sizes"] = normal_jump_sizes(
+                    self.rng,
+                    jump_counts,
+                    kernel_params["mu_j"],
+                    kernel_params["sigma_j"],
+                )
 
         paths = kernel(**sim_params)
 
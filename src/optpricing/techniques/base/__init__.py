@@ -9,7 +9,12 @@ from .greek_mixin import GreekMixin
 from .iv_mixin import IVMixin
 from .lattice_technique import LatticeTechnique
 from .pricing_result import PricingResult
-from .random_utils import crn
+from .random_utils import (
+    crn,
+    double_exponential_jump_sizes,
+    make_rng,
+    normal_jump_sizes,
+)
 
 __all__ = [
     "BaseTechnique",
@@ -18,4 +23,7 @@ __all__ = [
     "LatticeTechnique",
     "PricingResult",
     "crn",
+    "double_exponential_jump_sizes",
+    "make_rng",
+    "normal_jump_sizes",
 ]
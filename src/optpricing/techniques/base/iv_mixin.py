@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -22,7 +23,9 @@ class IVMixin:
     root-finding algorithm.
 
     This implementation uses Brent's method for speed and precision, with a
-    fallback to a more robust Secant method if the initial search fails.
+    fallback to a more robust Secant method if the initial search fails. The
+    search is warm-started from a rational approximation of the implied
+    volatility, so Brent's method usually runs on a narrow bracket.
     """
 
     def implied_volatility(
@@ -35,11 +38,19 @@ class IVMixin:
         low: float = 1e-6,
         high: float = 5.0,
         tol: float = 1e-6,
+        initial_sigma: float | None = None,
         **kwargs: Any,
     ) -> float:
         """
         Calculates the implied volatility for a given option price.
 
+        The root search starts from `initial_sigma` (or, if not given, the
+        Corrado-Miller approximation). When the price crosses the target
+        within 10% of that guess, Brent's method runs on this narrow bracket;
+        otherwise it searches the full `[low, high]` range. A supplied
+        `initial_sigma` that already reproduces `target_price` (e.g. when the
+        target came from the same model) is returned without a search.
+
         Parameters
         ----------
         option : Option
@@ -59,6 +70,10 @@ class IVMixin:
             The upper bound for the volatility search, by default 5.0.
         tol : float, optional
             The tolerance for the root-finding algorithm, by default 1e-6.
+        initial_sigma : float | None, optional
+            A starting guess for the volatility, e.g. a known model volatility.
+            Returned as is if it prices the option at `target_price`.
+            Defaults to None, which uses the Corrado-Miller approximation.
 
         Returns
         -------
@@ -66,30 +81,96 @@ class IVMixin:
             The implied volatility, or `np.nan` if the search fails.
         """
         bsm_solver_model = BSMModel(params={"sigma": 0.3})
+        evaluated: dict[float, float] = {}
 
         def bsm_price_minus_target(vol: float) -> float:
+            # Memoized, so the bracket probes are reused by the root finder
+            if vol in evaluated:
+                return evaluated[vol]
             current_bsm_model = bsm_solver_model.with_params(sigma=vol)
             try:
                 with np.errstate(all="ignore"):
                     price = self.price(option, stock, current_bsm_model, rate).price
-                if not np.isfinite(price):
-                    return 1e6
-                return price - target_price
+                diff = price - target_price if np.isfinite(price) else 1e6
             except (ZeroDivisionError, OverflowError):
-                return 1e6
+                diff = 1e6
+            evaluated[vol] = diff
+            return diff
+
+        guess_given = initial_sigma is not None
+        if not guess_given:
+            initial_sigma = self._initial_vol_guess(option, stock, rate, target_price)
+
+        a, b = low, high
+        if low < initial_sigma < high:
+            if guess_given:
+                # The target was priced at this volatility, nothing to solve
+                try:
+                    if abs(bsm_price_minus_target(initial_sigma)) <= 1e-12 * max(
+                        1.0, abs(target_price)
+                    ):
+                        return initial_sigma
+                except (TypeError, ValueError):
+                    pass
+            lo_probe = max(low, 0.9 * initial_sigma)
+            hi_probe = min(high, initial_sigma / 0.9)
+            try:
+                f_lo = bsm_price_minus_target(lo_probe)
+                f_hi = bsm_price_minus_target(hi_probe)
+                if f_lo * f_hi < 0:
+                    a, b = lo_probe, hi_probe
+            except (TypeError, ValueError):  # unusable probes, keep the full range
+                pass
+        else:
+            initial_sigma = 0.2
 
         try:
             # First, try the fast and precise Brent's method
-            iv = brentq(bsm_price_minus_target, low, high, xtol=tol, disp=False)
+            iv = brentq(bsm_price_minus_target, a, b, xtol=tol, disp=False)
         except (ValueError, RuntimeError):
             try:
                 # If brentq fails, fall back to the slower Secant method
-                iv = self._secant_iv(bsm_price_minus_target, 0.2, tol, 100)
+                iv = self._secant_iv(bsm_price_minus_target, initial_sigma, tol, 100)
             except (ValueError, RuntimeError):
                 iv = np.nan
 
         return iv
 
+    @staticmethod
+    def _initial_vol_guess(
+        option: Option,
+        stock: Stock,
+        rate: Rate,
+        target_price: float,
+    ) -> float:
+        """
+        Corrado-Miller (1996) approximation of the BSM implied volatility.
+
+        Puts are mapped to calls by put-call parity. Where the approximation
+        is undefined, the Manaster-Koehler point `sqrt(2|log(F/K)|/T)` is
+        returned instead; the caller checks the result against its bounds.
+        """
+        T = option.maturity
+        r = rate.get_rate(T)
+        try:
+            fwd_spot = stock.spot * math.exp(-stock.dividend * T)
+            disc_strike = option.strike * math.exp(-r * T)
+            call_price = target_price
+            if option.option_type.sign < 0:
+                call_price += fwd_spot - disc_strike
+            half_moneyness = 0.5 * (fwd_spot - disc_strike)
+            excess = call_price - half_moneyness
+            radicand = excess**2 - half_moneyness**2 * (4.0 / math.pi)
+            if radicand > 0.0:
+                return (
+                    math.sqrt(2.0 * math.pi)
+                    * (excess + math.sqrt(radicand))
+                    / ((fwd_spot + disc_strike) * math.sqrt(T))
+                )
+            return math.sqrt(2.0 * abs(math.log(fwd_spot / disc_strike)) / T)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return math.nan
+
     @staticmethod
     def _secant_iv(
         fn: Any,
@@ -7,7 +7,7 @@ Defines a simple data container for pricing results.
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PricingResult:
     """
     A container for the results of a pricing operation.
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from optpricing.atoms import Option, OptionType, Rate, Stock, ZeroCouponBond
 from optpricing.models import BaseModel
+from optpricing.models.closed_form_kernels import bsm_implied_vol_kernel
 from optpricing.techniques.base import BaseTechnique, GreekMixin, IVMixin, PricingResult
 
 __doc__ = """
@@ -132,6 +135,120 @@ class ClosedFormTechnique(BaseTechnique, GreekMixin, IVMixin):
         price = model.price_closed_form(**base_params)
         return PricingResult(price=price)
 
+    def price_and_greeks(
+        self,
+        option: Option,
+        stock: Stock,
+        model: BaseModel,
+        rate: Rate,
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """
+        Computes the price and all first-order Greeks in one call.
+
+        If the model provides `price_and_greeks_analytic`, every metric is
+        derived from a single shared evaluation of the closed form. Otherwise
+        the price and each Greek are computed by the individual methods.
+
+        Parameters
+        ----------
+        option : Option
+            The option contract.
+        stock : Stock
+            The underlying asset's properties.
+        model : BaseModel
+            The financial model to use. Must have `has_closed_form=True`.
+        rate : Rate
+            The risk-free rate structure.
+
+        Returns
+        -------
+        dict[str, float]
+            The metrics keyed by 'price', 'delta', 'gamma', 'vega', 'theta'
+            and 'rho'.
+        """
+        if self.use_analytic_greeks and hasattr(model, "price_and_greeks_analytic"):
+            return model.price_and_greeks_analytic(
+                spot=stock.spot,
+                strike=option.strike,
+                r=rate.get_rate(option.maturity),
+                q=stock.dividend,
+                t=option.maturity,
+                call=(option.option_type is OptionType.CALL),
+            )
+        return {
+            "price": self.price(option, stock, model, rate, **kwargs).price,
+            "delta": self.delta(option, stock, model, rate, **kwargs),
+            "gamma": self.gamma(option, stock, model, rate, **kwargs),
+            "vega": self.vega(option, stock, model, rate, **kwargs),
+            "theta": self.theta(option, stock, model, rate, **kwargs),
+            "rho": self.rho(option, stock, model, rate, **kwargs),
+        }
+
+    def implied_volatility(
+        self,
+        option: Option,
+        stock: Stock,
+        model: BaseModel,
+        rate: Rate,
+        target_price: float,
+        low: float = 1e-6,
+        high: float = 5.0,
+        tol: float = 1e-6,
+        **kwargs: Any,
+    ) -> float:
+        """
+        Overrides IVMixin to invert the BSM closed form directly.
+
+        Since this technique prices BSM in closed form, the implied volatility
+        is found by a JIT-compiled rational-guess plus Halley solver instead of
+        a generic root search over repeated `price` calls. If the kernel
+        cannot invert the price, the root-finding fallback from `IVMixin` is
+        used.
+
+        Parameters
+        ----------
+        option : Option
+            The option contract.
+        stock : Stock
+            The underlying asset's properties.
+        model : BaseModel
+            Unused; IV is always calculated relative to the BSM model.
+        rate : Rate
+            The risk-free rate structure.
+        target_price : float
+            The market price of the option for which to find the IV.
+        low : float, optional
+            The lower bound for the volatility search, by default 1e-6.
+        high : float, optional
+            The upper bound for the volatility search, by default 5.0.
+        tol : float, optional
+            The tolerance on the volatility, by default 1e-6.
+
+        Returns
+        -------
+        float
+            The implied volatility, or `np.nan` if the search fails.
+        """
+        iv = bsm_implied_vol_kernel(
+            float(target_price),
+            float(stock.spot),
+            float(option.strike),
+            float(rate.get_rate(option.maturity)),
+            float(stock.dividend),
+            float(option.maturity),
+            option.option_type is OptionType.CALL,
+            low,
+            high,
+            tol,
+            100,
+        )
+        if np.isfinite(iv):
+            return iv
+        return super().implied_volatility(
+            option, stock, model, rate, target_price, low, high, tol, **kwargs
+        )
+
     def delta(
         self,
         option: Option,
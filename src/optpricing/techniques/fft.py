@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -15,6 +16,40 @@ dampened, risk-neutral option price, following the Carr-Madan formula.
 """
 
 
+@lru_cache(maxsize=64)
+def _carr_madan_nodes(
+    n_points: int,
+    eta: float,
+    alpha: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Memoized frequency nodes and node-only factors of the Carr-Madan FFT.
+
+    Everything here depends on the grid (N, eta) and the dampening alpha, not
+    on the model, so a calibration that reprices the same grid only
+    evaluates the CF and the FFT. Returns the log-strike grid, the shifted CF
+    nodes u - i(alpha + 1), and the Simpson-weighted, phase-shifted inverse
+    of the Carr-Madan denominator. The arrays are read-only.
+    """
+    lambda_ = (2 * math.pi) / (n_points * eta)
+    b = (n_points * lambda_) / 2.0
+    k_grid = -b + lambda_ * np.arange(n_points)
+
+    # Simpson's rule weights
+    w = np.ones(n_points)
+    w[1:-1:2], w[2:-2:2] = 4, 2
+    weights = w * eta / 3.0
+
+    u = np.arange(n_points) * eta
+    cf_nodes = u - 1j * (alpha + 1)
+    denominator = alpha**2 + alpha - u**2 + 1j * u * (2 * alpha + 1)
+    node_factor = np.exp(1j * u * b) * weights / denominator
+
+    for arr in (k_grid, cf_nodes, node_factor):
+        arr.flags.writeable = False
+    return k_grid, cf_nodes, node_factor
+
+
 class FFTTechnique(BaseTechnique, GreekMixin, IVMixin):
     """
     Fast Fourier Transform (FFT) pricer based on the Carr-Madan formula,
@@ -46,6 +81,8 @@ class FFTTechnique(BaseTechnique, GreekMixin, IVMixin):
         self.base_eta = float(eta)
         self.alpha_user = alpha
         self._cached_results: dict[str, Any] = {}
+        self._grid_cache_key: tuple | None = None
+        self._grid_cache: tuple[np.ndarray, np.ndarray] | None = None
 
     def _price_and_greeks(
         self,
@@ -76,42 +113,7 @@ class FFTTechnique(BaseTechnique, GreekMixin, IVMixin):
         S0, K, T = stock.spot, option.strike, option.maturity
         r, q = rate.get_rate(T), stock.dividend
 
-        vol_proxy = self._get_vol_proxy(model, kwargs)
-
-        if self.alpha_user is not None:
-            alpha = self.alpha_user
-        elif vol_proxy is None:
-            alpha = 1.75
-        else:
-            alpha = 1.0 + 0.5 * vol_proxy * math.sqrt(T)
-
-        eta = (
-            self.base_eta * max(1.0, vol_proxy * math.sqrt(T))
-            if vol_proxy is not None
-            else self.base_eta
-        )
-
-        lambda_ = (2 * math.pi) / (self.N * eta)
-        b = (self.N * lambda_) / 2.0
-        k_grid = -b + lambda_ * np.arange(self.N)
-
-        # Simpson's rule weights
-        w = np.ones(self.N)
-        w[1:-1:2], w[2:-2:2] = 4, 2
-        weights = w * eta / 3.0
-
-        phi = model.cf(t=T, spot=S0, r=r, q=q, **kwargs)
-
-        u = np.arange(self.N) * eta
-        discount = math.exp(-r * T)
-        numerator = phi(u - 1j * (alpha + 1))
-        denominator = alpha**2 + alpha - u**2 + 1j * u * (2 * alpha + 1)
-        psi = discount * numerator / denominator
-
-        fft_input = psi * np.exp(1j * u * b) * weights
-        fft_vals = np.fft.fft(fft_input).real
-
-        call_price_grid = np.exp(-alpha * k_grid) / math.pi * fft_vals
+        k_grid, call_price_grid = self._call_price_grid(S0, T, r, q, model, **kwargs)
 
         # Interpolate to find the results at the target strike
         k_target = math.log(K)
@@ -156,6 +158,71 @@ class FFTTechnique(BaseTechnique, GreekMixin, IVMixin):
         )
         return PricingResult(price=self._cached_results["price"])
 
+    def _call_price_grid(
+        self,
+        S0: float,
+        T: float,
+        r: float,
+        q: float,
+        model: BaseModel,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the log-strike grid and the Carr-Madan call prices on it.
+
+        The grid depends only on the model, the underlying and the maturity, so
+        the last one is cached: pricing further strikes (or the put) on the same
+        slice reduces to an interpolation, with no new CF evaluations or FFT.
+        """
+        # A snapshot of the params, so an in-place update misses the cache
+        key = (
+            type(model),
+            tuple(sorted(model.params.items())),
+            S0,
+            T,
+            r,
+            q,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            if key == self._grid_cache_key and self._grid_cache is not None:
+                return self._grid_cache
+        except (TypeError, ValueError):  # incomparable inputs, skip the cache
+            key = None
+
+        vol_proxy = self._get_vol_proxy(model, kwargs)
+
+        if self.alpha_user is not None:
+            alpha = self.alpha_user
+        elif vol_proxy is None:
+            alpha = 1.75
+        else:
+            alpha = 1.0 + 0.5 * vol_proxy * math.sqrt(T)
+
+        eta = (
+            self.base_eta * max(1.0, vol_proxy * math.sqrt(T))
+            if vol_proxy is not None
+            else self.base_eta
+        )
+
+        k_grid, cf_nodes, node_factor = _carr_madan_nodes(
+            self.N, float(eta), float(alpha)
+        )
+
+        phi = model.cf(t=T, spot=S0, r=r, q=q, **kwargs)
+
+        # Only the CF depends on the model; the node factors are memoized
+        fft_input = phi(cf_nodes) * node_factor
+        fft_input *= math.exp(-r * T)
+        fft_vals = np.fft.fft(fft_input).real
+
+        call_price_grid = np.exp(-alpha * k_grid) / math.pi * fft_vals
+
+        if key is not None:
+            self._grid_cache_key = key
+            self._grid_cache = (k_grid, call_price_grid)
+        return k_grid, call_price_grid
+
     @staticmethod
     def _get_vol_proxy(
         model: BaseModel,
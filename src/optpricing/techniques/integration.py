@@ -23,7 +23,8 @@ class IntegrationTechnique(BaseTechnique, GreekMixin, IVMixin):
     options. It is particularly useful for models where a closed-form solution
     is unavailable but the CF is known (e.g., Heston, Bates, VG, NIG).
 
-    It provides an analytic delta as a "free" byproduct of the pricing calculation.
+    It provides an analytic delta and gamma as "free" byproducts of the pricing
+    calculation.
     """
 
     def __init__(
@@ -53,6 +54,7 @@ class IntegrationTechnique(BaseTechnique, GreekMixin, IVMixin):
         self.epsabs = epsabs
         self.epsrel = epsrel
         self._cached_results: dict[str, Any] = {}
+        self._cache_key: tuple | None = None
 
     def _price_and_delta(
         self,
@@ -84,17 +86,19 @@ class IntegrationTechnique(BaseTechnique, GreekMixin, IVMixin):
         r, q = rate.get_rate(T), stock.dividend
         phi = model.cf(t=T, spot=S, r=r, q=q, **kwargs)
         k_log = np.log(K)
+        phi_minus_i = phi(-1j)
 
-        def integrand_p2(u):
-            """Calculates the integrand for P2."""
-            return (np.exp(-1j * u * k_log) * phi(u)).imag / u
-
-        def integrand_p1(u):
-            """Calculates the integrand for P1."""
-            return (np.exp(-1j * u * k_log) * phi(u - 1j)).imag / u
+        def integrand(u):
+            """Stacks the P1, P2 and dP1/dlog(S) integrands at a shared node."""
+            kernel = np.exp(-1j * u * k_log)
+            shifted = kernel * phi(u - 1j)
+            return np.array(
+                [shifted.imag / u, (kernel * phi(u)).imag / u, shifted.real]
+            )
 
-        integral_p2, _ = integrate.quad(
-            integrand_p2,
+        # One adaptive pass evaluates every integrand on the same nodes
+        (integral_p1, integral_p2, integral_dp1), _ = integrate.quad_vec(
+            integrand,
             1e-15,
             self.upper_bound,
             limit=self.limit,
@@ -102,37 +106,27 @@ class IntegrationTechnique(BaseTechnique, GreekMixin, IVMixin):
             epsrel=self.epsrel,
         )
 
-        phi_minus_i = phi(-1j)
-        if np.abs(phi_minus_i) < 1e-12:
-            P1 = np.nan
-        else:
-            integral_p1, _ = integrate.quad(
-                integrand_p1,
-                1e-15,
-                self.upper_bound,
-                limit=self.limit,
-                epsabs=self.epsabs,
-                epsrel=self.epsrel,
-            )
-            P1 = 0.5 + integral_p1 / (
-                np.pi * np.real(phi_minus_i)
-            )  # Use real part of denominator
-
         P2 = 0.5 + integral_p2 / np.pi
-
-        if np.isnan(P1):
-            price, delta = np.nan, np.nan
+        if np.abs(phi_minus_i) < 1e-12:
+            price, delta, gamma = np.nan, np.nan, np.nan
         else:
-            df_S = S * np.exp(-q * T)
+            # Use real part of denominator
+            norm_p1 = np.pi * np.real(phi_minus_i)
+            P1 = 0.5 + integral_p1 / norm_p1
+            df_div = np.exp(-q * T)
+            df_S = S * df_div
             df_K = K * np.exp(-r * T)
             if option.option_type is OptionType.CALL:
                 price = df_S * P1 - df_K * P2
-                delta = np.exp(-q * T) * P1
+                delta = df_div * P1
             else:
                 price = df_K * (1 - P2) - df_S * (1 - P1)
-                delta = np.exp(-q * T) * (P1 - 1.0)
+                delta = df_div * (P1 - 1.0)
+            # The CF depends on spot only through exp(iu log S), so
+            # dP1/dS = (1/S) * (1/pi) * int Re(e^{-iuk} phi(u - i)) du / phi(-i)
+            gamma = df_div * (integral_dp1 / norm_p1) / S
 
-        return {"price": price, "delta": delta}
+        return {"price": price, "delta": delta, "gamma": gamma}
 
     def price(
         self,
@@ -143,7 +137,7 @@ class IntegrationTechnique(BaseTechnique, GreekMixin, IVMixin):
         **kwargs: Any,
     ) -> PricingResult:
         """
-        Calculates the option price and caches the 'free' analytic delta.
+        Calculates the option price and caches the 'free' analytic delta and gamma.
 
         Parameters
         ----------
@@ -164,6 +158,7 @@ class IntegrationTechnique(BaseTechnique, GreekMixin, IVMixin):
         self._cached_results = self._price_and_delta(
             option, stock, model, rate, **kwargs
         )
+        self._cache_key = self._greek_cache_key(option, stock, model, rate, kwargs)
         return PricingResult(price=self._cached_results["price"])
 
     def delta(
@@ -196,12 +191,79 @@ class IntegrationTechnique(BaseTechnique, GreekMixin, IVMixin):
         float
             Delta of the option.
         """
-        if not self._cached_results:
-            self.price(option, stock, model, rate, **kwargs)
-
-        delta_val = self._cached_results.get("delta")
+        delta_val = self._cached_greek("delta", option, stock, model, rate, **kwargs)
         if delta_val is not None and not np.isnan(delta_val):
             return delta_val
         else:
             # Fallback to finite difference if analytic delta failed
             return super().delta(option, stock, model, rate, **kwargs)
+
+    def gamma(
+        self,
+        option: Option,
+        stock: Stock,
+        model: BaseModel,
+        rate: Rate,
+        **kwargs: Any,
+    ) -> float:
+        """
+        Returns the 'free' gamma calculated during the pricing call.
+
+        The spot derivative of the P1 integrand is integrated alongside the
+        price, so no extra pricing calls are needed. Falls back to the numerical
+        finite difference method from `GreekMixin` if the analytic value failed.
+
+        Parameters
+        ----------
+        option : Option
+            The option contract to be priced.
+        stock : Stock
+            The underlying asset's properties.
+        model : BaseModel
+            The financial model to use. Must support a characteristic function.
+        rate : Rate
+            The risk-free rate structure.
+
+        Returns
+        -------
+        float
+            Gamma of the option.
+        """
+        gamma_val = self._cached_greek("gamma", option, stock, model, rate, **kwargs)
+        if gamma_val is not None and not np.isnan(gamma_val):
+            return gamma_val
+        else:
+            return super().gamma(option, stock, model, rate, **kwargs)
+
+    def _cached_greek(
+        self,
+        name: str,
+        option: Option,
+        stock: Stock,
+        model: BaseModel,
+        rate: Rate,
+        **kwargs: Any,
+    ) -> float | None:
+        """Returns a cached byproduct, repricing first if the inputs changed."""
+        key = self._greek_cache_key(option, stock, model, rate, kwargs)
+        if not self._cached_results or key != self._cache_key:
+            self.price(option, stock, model, rate, **kwargs)
+        return self._cached_results.get(name)
+
+    @staticmethod
+    def _greek_cache_key(
+        option: Option,
+        stock: Stock,
+        model: BaseModel,
+        rate: Rate,
+        kwargs: dict[str, Any],
+    ) -> tuple:
+        """Cache key with a snapshot of the params, not the mutable model."""
+        return (
+            option,
+            stock,
+            type(model),
+            tuple(sorted(model.params.items())),
+            rate,
+            tuple(sorted(kwargs.items())),
+        )
@@ -11,6 +11,10 @@ JIT-compiled Longstaff-Schwartz pricing algorithm.
 """
 Prices an American option using the Longstaff-Schwartz algorithm.
 
+The payoff is evaluated inline from a put/call sign, and each regression is
+solved from normal equations accumulated in one pass over the in-the-money
+paths, so no per-step design matrices or masked copies are allocated.
+
 Parameters
 ----------
 stock_paths : np.ndarray
@@ -44,41 +48,54 @@ def longstaff_schwartz_pricer(
 ) -> float:
     n_paths, n_steps_plus_1 = stock_paths.shape
     n_steps = n_steps_plus_1 - 1
+    n_basis = degree + 1
+    sign = 1.0 if is_call else -1.0
+    disc = np.exp(-r * dt)
+    inv_k = 1.0 / K
 
-    if is_call:
-        cashflow = np.maximum(stock_paths[:, -1] - K, 0.0)
-    else:
-        cashflow = np.maximum(K - stock_paths[:, -1], 0.0)
+    cashflow = np.maximum(sign * (stock_paths[:, -1] - K), 0.0)
+    itm_idx = np.empty(n_paths, dtype=np.int64)
+    powers = np.empty(n_basis)
 
     for i in range(n_steps - 1, 0, -1):
-        cashflow = cashflow * np.exp(-r * dt)
-        stock_price_at_t = stock_paths[:, i]
-
-        if is_call:
-            intrinsic_value = np.maximum(stock_price_at_t - K, 0.0)
-        else:
-            intrinsic_value = np.maximum(K - stock_price_at_t, 0.0)
-
-        in_the_money_mask = intrinsic_value > 0
-        if np.any(in_the_money_mask):
-            x = stock_price_at_t[in_the_money_mask]
-            y = cashflow[in_the_money_mask]
+        # Discount and collect the in-the-money paths in a single scan
+        n_itm = 0
+        for j in range(n_paths):
+            cashflow[j] *= disc
+            if sign * (stock_paths[j, i] - K) > 0.0:
+                itm_idx[n_itm] = j
+                n_itm += 1
+        if n_itm == 0:
+            continue
 
-            X = np.ones((len(x), degree + 1))
-            for d in range(1, degree + 1):
-                X[:, d] = x**d
+        # Accumulate the normal equations directly, without forming the
+        # design matrix; spots are scaled by 1/K to keep them well conditioned
+        gram = np.zeros((n_basis, n_basis))
+        rhs = np.zeros(n_basis)
+        for c in range(n_itm):
+            j = itm_idx[c]
+            x = stock_paths[j, i] * inv_k
+            powers[0] = 1.0
+            for d in range(1, n_basis):
+                powers[d] = powers[d - 1] * x
+            for a in range(n_basis):
+                rhs[a] += powers[a] * cashflow[j]
+                for b in range(n_basis):
+                    gram[a, b] += powers[a] * powers[b]
 
-            try:
-                beta = np.linalg.inv(X.T @ X) @ (X.T @ y)
-                continuation_value = X @ beta
+        try:
+            beta = np.linalg.solve(gram, rhs)
+        except:
+            continue
 
-                exercise_mask = intrinsic_value[in_the_money_mask] > continuation_value
-                cashflow[in_the_money_mask] = np.where(
-                    exercise_mask,
-                    intrinsic_value[in_the_money_mask],
-                    cashflow[in_the_money_mask],
-                )
-            except:
-                pass
+        for c in range(n_itm):
+            j = itm_idx[c]
+            x = stock_paths[j, i] * inv_k
+            continuation_value = beta[degree]
+            for d in range(degree - 1, -1, -1):
+                continuation_value = continuation_value * x + beta[d]
+            intrinsic_value = sign * (stock_paths[j, i] - K)
+            if intrinsic_value > continuation_value:
+                cashflow[j] = intrinsic_value
 
-    return np.mean(cashflow * np.exp(-r * dt))
+    return np.mean(cashflow) * disc
@@ -3,15 +3,195 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numba
 import numpy as np
 
 __doc__ = """
 This module contains the low-level implementations for various lattice-based
 option pricing algorithms. These functions are designed to be pure and operate
-on numerical inputs.
+on numerical inputs; the backward-induction loops are JIT-compiled with `numba`.
 """
 
 
+# Docstring for _binomial_rollback_kernel
+"""
+JIT-compiled backward induction on a recombining binomial tree.
+
+The value vector is updated in place from the low node upwards, which is safe
+because node j at step i only reads nodes j and j + 1 of step i + 1. Returns
+the root value and the step-1 and step-2 node values used for delta and gamma.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def _binomial_rollback_kernel(values, spots, strike, sign, p_up, p_down, inv_d, is_am):
+    n = values.shape[0] - 1
+    price_up = price_down = price_uu = price_ud = price_dd = 0.0
+    for i in range(n - 1, -1, -1):
+        if i == 1:
+            price_uu, price_ud, price_dd = values[2], values[1], values[0]
+        elif i == 0:
+            price_up, price_down = values[1], values[0]
+        for j in range(i + 1):
+            value = p_down * values[j] + p_up * values[j + 1]
+            if is_am:
+                spots[j] *= inv_d
+                value = max(value, sign * (spots[j] - strike), 0.0)
+            values[j] = value
+    return values[0], price_up, price_down, price_uu, price_ud, price_dd
+
+
+# Docstring for _binomial_european_kernel
+"""
+JIT-compiled closed form for the node values of a European binomial tree.
+
+The value at node j of step 2 is the Binomial(N - 2, p) expectation of the
+terminal payoffs j .. j + N - 2, discounted over N - 2 steps, so the three
+step-2 nodes share one weight vector and cost O(N) instead of an O(N^2)
+rollback. The weights start at the mode and are extended outwards with the
+pmf ratio, so the tails underflow harmlessly to zero. The step-1 nodes and
+the root then follow from two ordinary backward steps.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def _binomial_european_kernel(payoff, p, disc, n):
+    steps = n - 2
+    q = 1.0 - p
+    ratio = p / q
+    mode = min(int((steps + 1) * p), steps)
+    weight = math.exp(
+        math.lgamma(steps + 1.0)
+        - math.lgamma(mode + 1.0)
+        - math.lgamma(steps - mode + 1.0)
+        + mode * math.log(p)
+        + (steps - mode) * math.log(q)
+        + steps * math.log(disc)
+    )
+    weights = np.zeros(steps + 1)
+    weights[mode] = weight
+    w = weight
+    for k in range(mode + 1, steps + 1):
+        w *= ratio * (steps - k + 1) / k
+        weights[k] = w
+    w = weight
+    for k in range(mode, 0, -1):
+        w *= k / (ratio * (steps - k + 1))
+        weights[k - 1] = w
+
+    price_dd = price_ud = price_uu = 0.0
+    for k in range(steps + 1):
+        price_dd += weights[k] * payoff[k]
+        price_ud += weights[k] * payoff[k + 1]
+        price_uu += weights[k] * payoff[k + 2]
+    p_up, p_down = disc * p, disc * q
+    price_up = p_down * price_ud + p_up * price_uu
+    price_down = p_down * price_dd + p_up * price_ud
+    price = p_down * price_down + p_up * price_up
+    return price, price_up, price_down, price_uu, price_ud, price_dd
+
+
+# Docstring for _trinomial_rollback_kernel
+"""
+JIT-compiled backward induction on a recombining trinomial tree.
+
+The spots at step i are the central 2i + 1 nodes of the terminal grid, so the
+early-exercise values are read straight from the terminal payoff. Returns the
+root value and the three step-1 node values.
+"""
+
+
+@numba.jit(nopython=True, fastmath=True, cache=True)
+def _trinomial_rollback_kernel(values, exercise, p_up, p_mid, p_down, is_am):
+    n = (values.shape[0] - 1) // 2
+    price_up = price_mid = price_down = 0.0
+    for i in range(n - 1, -1, -1):
+        if i == 0:
+            price_up, price_mid, price_down = values[2], values[1], values[0]
+        offset = n - i
+        for j in range(2 * i + 1):
+            value = p_down * values[j] + p_mid * values[j + 1] + p_up * values[j + 2]
+            if is_am:
+                value = max(value, exercise[offset + j])
+            values[j] = value
+    return values[0], price_up, price_mid, price_down
+
+
+def _binomial_rollback(
+    S0: float,
+    K: float,
+    u: float,
+    d: float,
+    p: float,
+    disc: float,
+    N: int,
+    is_call: bool,
+    is_am: bool,
+) -> dict[str, Any]:
+    """
+    Backward induction shared by the binomial pricers.
+
+    Builds the terminal spots and payoff once, then hands the in-place
+    rollback to the JIT-compiled `_binomial_rollback_kernel`. European trees
+    skip the rollback: every node value is a binomial expectation of the
+    terminal payoff, see `_binomial_european_kernel`.
+
+    Parameters
+    ----------
+    S0 : float
+        Initial asset price.
+    K : float
+        Strike price.
+    u : float
+        Up-move factor.
+    d : float
+        Down-move factor.
+    p : float
+        Risk-neutral probability of an up-move.
+    disc : float
+        One-step discount factor.
+    N : int
+        Number of steps in the tree.
+    is_call : bool
+        True for a call option, False for a put.
+    is_am : bool
+        True for an American option, False for European.
+
+    Returns
+    -------
+    dict[str, Any]
+        A dictionary containing the option price and node values for Greek calcs.
+    """
+    sign = 1.0 if is_call else -1.0
+    j = np.arange(N + 1, dtype=np.float64)
+    spots = S0 * np.power(u, j) * np.power(d, N - j)
+    values = np.maximum(sign * (spots - K), 0.0)
+    if not is_am and N >= 2 and 0.0 < p < 1.0:
+        price, price_up, price_down, price_uu, price_ud, price_dd = (
+            _binomial_european_kernel(values, p, disc, N)
+        )
+    else:
+        p_up, p_down = disc * p, disc * (1.0 - p)
+        price, price_up, price_down, price_uu, price_ud, price_dd = (
+            _binomial_rollback_kernel(
+                values, spots, float(K), sign, p_up, p_down, 1.0 / d, bool(is_am)
+            )
+        )
+    return {
+        "price": price,
+        "price_up": price_up,
+        "price_down": price_down,
+        "price_uu": price_uu,
+        "price_ud": price_ud,
+        "price_dd": price_dd,
+        "spot_up": S0 * u,
+        "spot_down": S0 * d,
+        "spot_uu": S0 * u * u,
+        "spot_ud": S0 * u * d,
+        "spot_dd": S0 * d * d,
+    }
+
+
 def _crr_pricer(
     S0: float,
     K: float,
@@ -59,39 +239,7 @@ def _crr_pricer(
     d = 1.0 / u
     disc = math.exp(-r * dt)
     p = (math.exp((r - q) * dt) - d) / (u - d)
-    j = np.arange(N + 1)
-    payoff = np.where(
-        is_call,
-        np.maximum(S0 * u**j * d ** (N - j) - K, 0.0),
-        np.maximum(K - S0 * u**j * d ** (N - j), 0.0),
-    )
-    for i in range(N - 1, -1, -1):
-        if i == 1:
-            price_uu, price_ud, price_dd = payoff[2], payoff[1], payoff[0]
-        elif i == 0:
-            price_up, price_down = payoff[1], payoff[0]
-        payoff = disc * (p * payoff[1:] + (1 - p) * payoff[:-1])
-        if is_am:
-            stock_prices = S0 * u ** np.arange(i + 1) * d ** (i - np.arange(i + 1))
-            early_exercise = np.where(
-                is_call,
-                np.maximum(stock_prices - K, 0.0),
-                np.maximum(K - stock_prices, 0.0),
-            )
-            payoff = np.maximum(payoff, early_exercise)
-    return {
-        "price": payoff[0],
-        "price_up": price_up,
-        "price_down": price_down,
-        "price_uu": price_uu,
-        "price_ud": price_ud,
-        "price_dd": price_dd,
-        "spot_up": S0 * u,
-        "spot_down": S0 * d,
-        "spot_uu": S0 * u * u,
-        "spot_ud": S0 * u * d,
-        "spot_dd": S0 * d * d,
-    }
+    return _binomial_rollback(S0, K, u, d, p, disc, N, is_call, is_am)
 
 
 def _lr_pricer(
@@ -160,39 +308,7 @@ def _lr_pricer(
     u = math.exp((r - q) * dt) * (p_d1 / p_d2)
     d = (math.exp((r - q) * dt) - p_d2 * u) / (1 - p_d2)
     p = p_d2
-    j = np.arange(N + 1)
-    payoff = np.where(
-        is_call,
-        np.maximum(S0 * u**j * d ** (N - j) - K, 0.0),
-        np.maximum(K - S0 * u**j * d ** (N - j), 0.0),
-    )
-    for i in range(N - 1, -1, -1):
-        if i == 1:
-            price_uu, price_ud, price_dd = payoff[2], payoff[1], payoff[0]
-        elif i == 0:
-            price_up, price_down = payoff[1], payoff[0]
-        payoff = disc * (p * payoff[1:] + (1 - p) * payoff[:-1])
-        if is_am:
-            stock_prices = S0 * u ** np.arange(i + 1) * d ** (i - np.arange(i + 1))
-            early_exercise = np.where(
-                is_call,
-                np.maximum(stock_prices - K, 0.0),
-                np.maximum(K - stock_prices, 0.0),
-            )
-            payoff = np.maximum(payoff, early_exercise)
-    return {
-        "price": payoff[0],
-        "price_up": price_up,
-        "price_down": price_down,
-        "price_uu": price_uu,
-        "price_ud": price_ud,
-        "price_dd": price_dd,
-        "spot_up": S0 * u,
-        "spot_down": S0 * d,
-        "spot_uu": S0 * u * u,
-        "spot_ud": S0 * u * d,
-        "spot_dd": S0 * d * d,
-    }
+    return _binomial_rollback(S0, K, u, d, p, disc, N, is_call, is_am)
 
 
 def _peizer_pratt(z: float, N: int) -> float:
@@ -256,27 +372,16 @@ def _topm_pricer(
     pu = 0.5 * ((vol**2 * dt + drift_term**2) / dx**2 + drift_term / dx)
     pd = 0.5 * ((vol**2 * dt + drift_term**2) / dx**2 - drift_term / dx)
     pm = 1.0 - pu - pd
-    j = np.arange(-N, N + 1)
-    payoff = np.where(
-        is_call,
-        np.maximum(S0 * np.exp(j * dx) - K, 0.0),
-        np.maximum(K - S0 * np.exp(j * dx), 0.0),
+    sign = 1.0 if is_call else -1.0
+    spots = S0 * np.exp(np.arange(-N, N + 1, dtype=np.float64) * dx)
+    values = np.maximum(sign * (spots - K), 0.0)
+    exercise = values.copy()
+    p_up, p_mid, p_down = disc * pu, disc * pm, disc * pd
+    price, price_up, price_mid, price_down = _trinomial_rollback_kernel(
+        values, exercise, p_up, p_mid, p_down, bool(is_am)
     )
-    for i in range(N - 1, -1, -1):
-        if i == 0:
-            price_up, price_mid, price_down = payoff[2], payoff[1], payoff[0]
-        payoff = disc * (pu * payoff[2:] + pm * payoff[1:-1] + pd * payoff[:-2])
-        if is_am:
-            j_inner = np.arange(-i, i + 1)
-            stock_prices = S0 * np.exp(j_inner * dx)
-            early_exercise = np.where(
-                is_call,
-                np.maximum(stock_prices - K, 0.0),
-                np.maximum(K - stock_prices, 0.0),
-            )
-            payoff = np.maximum(payoff, early_exercise)
     return {
-        "price": payoff[0],
+        "price": price,
         "price_up": price_up,
         "price_mid": price_mid,
         "price_down": price_down,
@@ -37,10 +37,14 @@ def bsm_kernel(
 # Docstring for heston_kernel
 """
 JIT-compiled kernel for Heston SDE simulation (Full Truncation).
+
+Each path keeps its log-spot and variance as two scalar registers and walks
+its own contiguous row of shocks, so the state never round-trips through
+strided (n_paths,) temporaries. Paths run in parallel (`numba.prange`).
 """
 
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
 def heston_kernel(
     n_paths,
     n_steps,
@@ -56,25 +60,27 @@ def heston_kernel(
     dw1,
     dw2,
 ):
-    log_s = np.full(n_paths, log_s0)
-    v = np.full(n_paths, v0)
+    log_s = np.empty(n_paths)
     rho_bar = np.sqrt(1 - rho**2)
+    drift = (r - q) * dt
 
-    for i in range(n_steps):
-        z1 = dw1[:, i]
-        z2 = dw2[:, i]
-
-        correlated_z2 = rho * z1 + rho_bar * z2
+    for j in numba.prange(n_paths):
+        x = log_s0
+        v = v0
+        for i in range(n_steps):
+            z1 = dw1[j, i]
+            correlated_z2 = rho * z1 + rho_bar * dw2[j, i]
 
-        v_pos = np.maximum(v, 0)
-        v_sqrt = np.sqrt(v_pos)
+            v_pos = max(v, 0.0)
+            v_sqrt = np.sqrt(v_pos)
 
-        # Evolve log-spot with the first independent draw
-        log_s += (r - q - 0.5 * v_pos) * dt + v_sqrt * z1
+            # Evolve log-spot with the first independent draw
+            x += drift - 0.5 * v_pos * dt + v_sqrt * z1
 
-        # Evolve variance with the correlated draw
-        v += kappa * (theta - v_pos) * dt + vol_of_vol * v_sqrt * correlated_z2
-        v = np.maximum(v, 0)  # Apply reflection to variance
+            # Evolve variance with the correlated draw
+            v += kappa * (theta - v_pos) * dt + vol_of_vol * v_sqrt * correlated_z2
+            v = max(v, 0.0)  # Apply reflection to variance
+        log_s[j] = x
 
     return log_s
 
@@ -82,10 +88,16 @@ def heston_kernel(
 # Docstring for merton_kernel
 """
 JIT-compiled kernel for Merton Jump-Diffusion SDE simulation.
+
+Paths are independent, so the outer loop runs in parallel over paths
+(`numba.prange`) and each thread walks the contiguous row of shocks for its
+path. The summed log-jump of each step is drawn beforehand from the seeded
+generator (`normal_jump_sizes`), so the result does not depend on numba's
+per-thread random states.
 """
 
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
 def merton_kernel(
     n_paths,
     n_steps,
@@ -98,22 +110,16 @@ def merton_kernel(
     sigma_j,
     dt,
     dw,
-    jump_counts,
+    jump_sizes,
 ):
-    log_s = np.full(n_paths, log_s0)
+    log_s = np.empty(n_paths)
     compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
     drift = (r - q - 0.5 * sigma**2 - compensator) * dt
-    for i in range(n_steps):
-        log_s += drift + sigma * dw[:, i]
-        jumps_this_step = jump_counts[:, i]
-        if np.any(jumps_this_step > 0):
-            num_jumps = np.sum(jumps_this_step)
-            jump_sizes = np.random.normal(mu_j, sigma_j, num_jumps)
-            jump_idx = 0
-            for path_idx in range(n_paths):
-                for _ in range(jumps_this_step[path_idx]):
-                    log_s[path_idx] += jump_sizes[jump_idx]
-                    jump_idx += 1
+    for path_idx in numba.prange(n_paths):
+        x = log_s0
+        for i in range(n_steps):
+            x += drift + sigma * dw[path_idx, i] + jump_sizes[path_idx, i]
+        log_s[path_idx] = x
 
     return log_s
 
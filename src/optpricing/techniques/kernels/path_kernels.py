@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 import numba
 import numpy as np
 
@@ -11,10 +13,15 @@ JIT-compiled kernel for American option pricing via Monte Carlo.
 # Docstring for bsm_path_kernel
 """
 JIT-compiled kernel for BSM SDE that returns the full path matrix.
+
+The log-price is a random walk, so each path is accumulated in log space
+along its own (contiguous) row of shocks and written out with one scalar
+`exp` per node, avoiding strided column access and temporary arrays. Paths are
+independent, so the outer loop runs in parallel (`numba.prange`).
 """
 
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
 def bsm_path_kernel(
     n_paths: int,
     n_steps: int,
@@ -25,23 +32,28 @@ def bsm_path_kernel(
     dt: float,
     dw: np.ndarray,
 ) -> np.ndarray:
-    paths = np.zeros((n_paths, n_steps + 1))
-    paths[:, 0] = np.exp(log_s0)
-    log_s = np.full(n_paths, log_s0)
+    paths = np.empty((n_paths, n_steps + 1))
+    s0 = math.exp(log_s0)
     drift = (r - q - 0.5 * sigma**2) * dt
-    for i in range(n_steps):
-        log_s += drift + sigma * dw[:, i]
-        paths[:, i + 1] = np.exp(log_s)
+    for j in numba.prange(n_paths):
+        log_s = log_s0
+        paths[j, 0] = s0
+        for i in range(n_steps):
+            log_s += drift + sigma * dw[j, i]
+            paths[j, i + 1] = math.exp(log_s)
     return paths
 
 
 # Docstring for heston_path_kernel
 """
 JIT-compiled kernel for Heston SDE that returns the full path matrix.
+
+Like `bsm_path_kernel`, each path carries its log-spot and variance as scalars
+along its own row of shocks, with one scalar `exp` per node.
 """
 
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
 def heston_path_kernel(
     n_paths: int,
     n_steps: int,
@@ -57,33 +69,42 @@ def heston_path_kernel(
     dw1: np.ndarray,
     dw2: np.ndarray,
 ) -> np.ndarray:
-    paths = np.zeros((n_paths, n_steps + 1))
-    paths[:, 0] = np.exp(log_s0)
-    log_s = np.full(n_paths, log_s0)
-    v = np.full(n_paths, v0)
-    rho_bar = np.sqrt(1 - rho**2)
-
-    for i in range(n_steps):
-        z1, z2 = dw1[:, i], dw2[:, i]
-        correlated_z2 = rho * z1 + rho_bar * z2
-        v_pos = np.maximum(v, 0)
-        v_sqrt = np.sqrt(v_pos)
-
-        log_s += (r - q - 0.5 * v_pos) * dt + v_sqrt * z1
-        v = np.maximum(
-            0, v + kappa * (theta - v_pos) * dt + vol_of_vol * v_sqrt * correlated_z2
-        )
-        paths[:, i + 1] = np.exp(log_s)
+    paths = np.empty((n_paths, n_steps + 1))
+    s0 = math.exp(log_s0)
+    rho_bar = math.sqrt(1 - rho**2)
+    drift = (r - q) * dt
+
+    for j in numba.prange(n_paths):
+        log_s = log_s0
+        v = v0
+        paths[j, 0] = s0
+        for i in range(n_steps):
+            z1 = dw1[j, i]
+            correlated_z2 = rho * z1 + rho_bar * dw2[j, i]
+            v_pos = max(v, 0.0)
+            v_sqrt = math.sqrt(v_pos)
+
+            log_s += drift - 0.5 * v_pos * dt + v_sqrt * z1
+            v = max(
+                0.0,
+                v + kappa * (theta - v_pos) * dt + vol_of_vol * v_sqrt * correlated_z2,
+            )
+            paths[j, i + 1] = math.exp(log_s)
     return paths
 
 
 # Docstring for merton_path_kernel
 """
 JIT-compiled kernel for Merton SDE that returns the full path matrix.
+
+Each path is accumulated in log space along its own row, adding the
+pre-drawn log-jump of each step (`normal_jump_sizes`), with one scalar `exp`
+per node. Drawing the jumps outside the parallel loop keeps seeded prices
+reproducible, since numba's random states are per-thread.
 """
 
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
 def merton_path_kernel(
     n_paths: int,
     n_steps: int,
@@ -96,38 +117,34 @@ def merton_path_kernel(
     sigma_j: float,
     dt: float,
     dw: np.ndarray,
-    jump_counts: np.ndarray,
+    jump_sizes: np.ndarray,
 ) -> np.ndarray:
-    paths = np.zeros((n_paths, n_steps + 1))
-    paths[:, 0] = np.exp(log_s0)
-    log_s = np.full(n_paths, log_s0)
-    compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
+    paths = np.empty((n_paths, n_steps + 1))
+    s0 = math.exp(log_s0)
+    compensator = lambda_ * (math.exp(mu_j + 0.5 * sigma_j**2) - 1)
     drift = (r - q - 0.5 * sigma**2 - compensator) * dt
 
-    for i in range(n_steps):
-        log_s += drift + sigma * dw[:, i]
-        jumps_this_step = jump_counts[:, i]
-        if np.any(jumps_this_step > 0):
-            num_jumps = np.sum(jumps_this_step)
-            jump_sizes = np.random.normal(mu_j, sigma_j, num_jumps)
-            jump_idx = 0
-            for path_idx in range(n_paths):
-                if jumps_this_step[path_idx] > 0:
-                    log_s[path_idx] += np.sum(
-                        jump_sizes[jump_idx : jump_idx + jumps_this_step[path_idx]]
-                    )
-                    jump_idx += jumps_this_step[path_idx]
-        paths[:, i + 1] = np.exp(log_s)
+    for j in numba.prange(n_paths):
+        log_s = log_s0
+        paths[j, 0] = s0
+        for i in range(n_steps):
+            log_s += drift + sigma * dw[j, i]
+            log_s += jump_sizes[j, i]
+            paths[j, i + 1] = math.exp(log_s)
     return paths
 
 
 # Docstring for bates_path_kernel
 """
 JIT-compiled kernel for Bates SDE that returns the full path matrix.
+
+Each path carries its log-spot and variance as scalars along its own row of
+shocks, adding the pre-drawn log-jump of each step, with one scalar `exp` per
+node.
 """
 
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
 def bates_path_kernel(
     n_paths: int,
     n_steps: int,
@@ -145,38 +162,31 @@ def bates_path_kernel(
     dt: float,
     dw1: np.ndarray,
     dw2: np.ndarray,
-    jump_counts: np.ndarray,
+    jump_sizes: np.ndarray,
 ) -> np.ndarray:
-    paths = np.zeros((n_paths, n_steps + 1))
-    paths[:, 0] = np.exp(log_s0)
-    log_s = np.full(n_paths, log_s0)
-    v = np.full(n_paths, v0)
-    compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
-    rho_bar = np.sqrt(1 - rho**2)
-
-    for i in range(n_steps):
-        z1, z2 = dw1[:, i], dw2[:, i]
-        correlated_z2 = rho * z1 + rho_bar * z2
-        v_pos = np.maximum(v, 0)
-        v_sqrt = np.sqrt(v_pos)
-
-        log_s += (r - q - 0.5 * v_pos - compensator) * dt + v_sqrt * z1
-        v = np.maximum(
-            0, v + kappa * (theta - v_pos) * dt + vol_of_vol * v_sqrt * correlated_z2
-        )
-
-        jumps_this_step = jump_counts[:, i]
-        if np.any(jumps_this_step > 0):
-            num_jumps = np.sum(jumps_this_step)
-            jump_sizes = np.random.normal(mu_j, sigma_j, num_jumps)
-            jump_idx = 0
-            for path_idx in range(n_paths):
-                if jumps_this_step[path_idx] > 0:
-                    log_s[path_idx] += np.sum(
-                        jump_sizes[jump_idx : jump_idx + jumps_this_step[path_idx]]
-                    )
-                    jump_idx += jumps_this_step[path_idx]
-        paths[:, i + 1] = np.exp(log_s)
+    paths = np.empty((n_paths, n_steps + 1))
+    s0 = math.exp(log_s0)
+    compensator = lambda_ * (math.exp(mu_j + 0.5 * sigma_j**2) - 1)
+    rho_bar = math.sqrt(1 - rho**2)
+    drift = (r - q - compensator) * dt
+
+    for j in numba.prange(n_paths):
+        log_s = log_s0
+        v = v0
+        paths[j, 0] = s0
+        for i in range(n_steps):
+            z1 = dw1[j, i]
+            correlated_z2 = rho * z1 + rho_bar * dw2[j, i]
+            v_pos = max(v, 0.0)
+            v_sqrt = math.sqrt(v_pos)
+
+            log_s += drift - 0.5 * v_pos * dt + v_sqrt * z1
+            v = max(
+                0.0,
+                v + kappa * (theta - v_pos) * dt + vol_of_vol * v_sqrt * correlated_z2,
+            )
+            log_s += jump_sizes[j, i]
+            paths[j, i + 1] = math.exp(log_s)
     return paths
 
 
@@ -275,10 +285,14 @@ def sabr_jump_path_kernel(
 # Docstring for kou_path_kernel
 """
 JIT-compiled kernel for Kou SDE that returns the full path matrix.
+
+Each path is accumulated in log space along its own row, adding the
+pre-drawn log-jump of each step (`double_exponential_jump_sizes`), with one
+scalar `exp` per node.
 """
 
 
-@numba.jit(nopython=True, fastmath=True, cache=True)
+@numba.jit(nopython=True, fastmath=True, cache=True, parallel=True)
 def kou_path_kernel(
     n_paths: int,
     n_steps: int,
@@ -292,33 +306,20 @@ def kou_path_kernel(
     eta2: float,
     dt: float,
     dw: np.ndarray,
-    jump_counts: np.ndarray,
+    jump_sizes: np.ndarray,
 ) -> np.ndarray:
-    paths = np.zeros((n_paths, n_steps + 1))
-    paths[:, 0] = np.exp(log_s0)
-    log_s = np.full(n_paths, log_s0)
+    paths = np.empty((n_paths, n_steps + 1))
+    s0 = math.exp(log_s0)
     compensator = lambda_ * (
         (p_up * eta1 / (eta1 - 1)) + ((1 - p_up) * eta2 / (eta2 + 1)) - 1
     )
     drift = (r - q - 0.5 * sigma**2 - compensator) * dt
 
-    for i in range(n_steps):
-        log_s += drift + sigma * dw[:, i]
-        jumps_this_step = jump_counts[:, i]
-        if np.any(jumps_this_step > 0):
-            num_total_jumps = np.sum(jumps_this_step)
-            up_or_down = np.random.random(num_total_jumps)
-            up_jumps = np.random.exponential(1.0 / eta1, num_total_jumps)
-            down_jumps = -np.random.exponential(1.0 / eta2, num_total_jumps)
-            all_jumps = np.where(up_or_down < p_up, up_jumps, down_jumps)
-
-            jump_idx = 0
-            for path_idx in range(n_paths):
-                num_jumps_on_path = jumps_this_step[path_idx]
-                if num_jumps_on_path > 0:
-                    log_s[path_idx] += np.sum(
-                        all_jumps[jump_idx : jump_idx + num_jumps_on_path]
-                    )
-                    jump_idx += num_jumps_on_path
-        paths[:, i + 1] = np.exp(log_s)
+    for j in numba.prange(n_paths):
+        log_s = log_s0
+        paths[j, 0] = s0
+        for i in range(n_steps):
+            log_s += drift + sigma * dw[j, i]
+            log_s += jump_sizes[j, i]
+            paths[j, i + 1] = math.exp(log_s)
     return paths
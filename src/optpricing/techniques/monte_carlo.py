@@ -5,10 +5,19 @@ from collections.abc import Callable
 from typing import Any
 
 import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
 
-from optpricing.atoms import Option, OptionType, Rate, Stock
+from optpricing.atoms import Option, Rate, Stock
 from optpricing.models import BaseModel
-from optpricing.techniques.base import BaseTechnique, GreekMixin, IVMixin, PricingResult
+from optpricing.techniques.base import (
+    BaseTechnique,
+    GreekMixin,
+    IVMixin,
+    PricingResult,
+    make_rng,
+    normal_jump_sizes,
+)
 
 from .kernels.mc_kernels import (
     bates_kernel,
@@ -39,6 +48,9 @@ class MonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
         n_paths: int = 20_000,
         n_steps: int = 100,
         antithetic: bool = True,
+        control_variate: bool = False,
+        quasi_random: bool = False,
+        reuse_samples: bool = False,
         seed: int | None = None,
     ):
         """
@@ -52,6 +64,18 @@ class MonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
             The number of time steps in each path, by default 100.
         antithetic : bool, optional
             Whether to use antithetic variates for variance reduction, by default True.
+        control_variate : bool, optional
+            Whether to use the terminal spot, whose risk-neutral mean is the
+            forward, as a control variate, by default False.
+        quasi_random : bool, optional
+            Whether to draw the BSM terminal shocks from a scrambled Sobol
+            sequence instead of pseudo-random normals, by default False. The
+            number of draws is rounded up to the next power of two (per
+            antithetic half), since only whole base-2 blocks are balanced.
+        reuse_samples : bool, optional
+            Whether to keep the last set of terminal spots and reuse it when the
+            next option has the same model, underlying, rate and maturity (e.g.
+            the put after the call), by default False.
         seed : int | None, optional
             Seed for the random number generator for reproducibility, by default None.
         """
@@ -60,7 +84,12 @@ class MonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
         self.n_paths = n_paths
         self.n_steps = n_steps
         self.antithetic = antithetic
-        self.rng = np.random.default_rng(seed)
+        self.control_variate = control_variate
+        self.quasi_random = quasi_random
+        self.reuse_samples = reuse_samples
+        self.rng = make_rng(seed)
+        self._sample_cache_key: tuple | None = None
+        self._sample_cache: tuple[np.ndarray, bool, bool] | None = None
 
     def price(
         self,
@@ -96,24 +125,87 @@ class MonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
         if not (model.supports_sde or getattr(model, "is_pure_levy", False)):
             raise TypeError(f"Model '{model.name}' does not support simulation.")
 
-        S0, K, T = stock.spot, option.strike, option.maturity
+        S0, T = stock.spot, option.maturity
         r, q = rate.get_rate(T), stock.dividend
 
+        ST, use_control, paired = self._terminal_spots(model, S0, r, q, T, **kwargs)
+
+        payoff = option.payoff(ST)
+        if use_control:
+            forward = S0 * math.exp((r - q) * T)
+            if paired:
+                # Antithetic halves are stacked; regress on the pair averages
+                half = len(ST) // 2
+                payoff = 0.5 * (payoff[:half] + payoff[half:])
+                ST = 0.5 * (ST[:half] + ST[half:])
+            payoff = self._apply_control_variate(payoff, ST, forward)
+        price = float(np.mean(payoff) * math.exp(-r * T))
+        return PricingResult(price=price)
+
+    def _terminal_spots(
+        self,
+        model: BaseModel,
+        S0: float,
+        r: float,
+        q: float,
+        T: float,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray, bool, bool]:
+        """
+        Simulates the terminal spots with the method the model supports.
+
+        Returns the samples together with whether the control variate applies
+        and whether the samples are stacked antithetic pairs. With
+        `reuse_samples`, the last draw is kept: the terminal law depends only
+        on the model, underlying, rate and maturity, so a call and a put on
+        the same slice share one simulation (and satisfy parity path by path).
+        """
+        key = None
+        if self.reuse_samples:
+            key = (type(model), dict(model.params), S0, T, r, q, kwargs)
+            try:
+                if key == self._sample_cache_key and self._sample_cache is not None:
+                    return self._sample_cache
+            except (TypeError, ValueError):  # incomparable inputs, skip the cache
+                key = None
+
         # Dispatch to the correct simulation method
+        use_control, paired = self.control_variate, False
         if getattr(model, "has_exact_sampler", False):
             ST = model.sample_terminal_spot(S0, r, T, self.n_paths)
+            # The exact samplers carry their own drift, so skip the control
+            use_control = False
         elif getattr(model, "is_pure_levy", False):
             ST = self._simulate_levy_terminal(model, S0, r, q, T)
         else:
             ST = self._simulate_sde_path(model, S0, r, q, T, **kwargs)
+            paired = self.antithetic and not getattr(model, "is_local_vol", False)
+
+        if key is not None:
+            self._sample_cache_key = key
+            self._sample_cache = (ST, use_control, paired)
+        return ST, use_control, paired
+
+    @staticmethod
+    def _apply_control_variate(
+        payoff: np.ndarray,
+        ST: np.ndarray,
+        forward: float,
+    ) -> np.ndarray:
+        """
+        Adjusts the payoffs with the terminal spot as a control variate.
 
-        payoff = (
-            np.maximum(ST - K, 0)
-            if option.option_type is OptionType.CALL
-            else np.maximum(K - ST, 0)
-        )
-        price = float(np.mean(payoff) * math.exp(-r * T))
-        return PricingResult(price=price)
+        Under the risk-neutral measure `E[S_T]` equals the forward, so
+        `S_T - forward` has zero mean and the optimal coefficient
+        `beta = cov(payoff, S_T) / var(S_T)` is estimated from the same sample.
+        """
+        control = ST - forward
+        centered = control - control.mean()
+        var = np.dot(centered, centered)
+        if not np.isfinite(var) or var <= 0.0:
+            return payoff
+        beta = np.dot(payoff - payoff.mean(), centered) / var
+        return payoff - beta * control
 
     def _get_sde_kernel_and_params(
         self,
@@ -212,6 +304,8 @@ class MonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
         kernel, kernel_params = self._get_sde_kernel_and_params(
             model, r, q, dt, **kwargs
         )
+        if kernel is bsm_kernel:
+            return self._simulate_gbm_terminal(S0, r, q, kernel_params["sigma"], T)
 
         sim_params = {"n_paths": num_draws, "n_steps": self.n_steps, **kernel_params}
         if getattr(model, "is_sabr", False):
@@ -219,25 +313,34 @@ class MonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
         else:
             sim_params["log_s0"] = math.log(S0)
 
+        # Draw all shocks in one bulk call and scale them in place
+        sqrt_dt = math.sqrt(dt)
         if model.has_variance_process:
-            dw_v = self.rng.standard_normal(size=(num_draws, self.n_steps)) * math.sqrt(
-                dt
-            )
-            dw_uncorr = self.rng.standard_normal(
-                size=(num_draws, self.n_steps)
-            ) * math.sqrt(dt)
+            dw = self.rng.standard_normal(size=(2, num_draws, self.n_steps))
+            dw *= sqrt_dt
+            dw_v, dw_corr = dw[0], dw[1]
             rho = model.params.get("rho", 0)
-            sim_params["dw1"] = rho * dw_v + math.sqrt(1 - rho**2) * dw_uncorr
+            dw_corr *= math.sqrt(1 - rho**2)
+            dw_corr += rho * dw_v
+            sim_params["dw1"] = dw_corr
             sim_params["dw2"] = dw_v
         else:
-            sim_params["dw"] = self.rng.standard_normal(
-                size=(num_draws, self.n_steps)
-            ) * math.sqrt(dt)
+            dw = self.rng.standard_normal(size=(num_draws, self.n_steps))
+            dw *= sqrt_dt
+            sim_params["dw"] = dw
 
         if model.has_jumps:
             sim_params["jump_counts"] = self.rng.poisson(
                 lam=model.params["lambda"] * dt, size=(num_draws, self.n_steps)
             )
+            if kernel is merton_kernel:
+                # The parallel kernel takes pre-drawn jumps, so seeds reproduce
+                sim_params["jump_sizes"] = normal_jump_sizes(
+                    self.rng,
+                    sim_params.pop("jump_counts"),
+                    kernel_params["mu_j"],
+                    kernel_params["sigma_j"],
+                )
 
         if getattr(model, "is_local_vol", False):
             sim_params["vol_surface_func"] = model.params["vol_surface"]
@@ -256,6 +359,38 @@ class MonteCarloTechnique(BaseTechnique, GreekMixin, IVMixin):
 
         return ST if getattr(model, "is_sabr", False) else np.exp(ST)
 
+    def _simulate_gbm_terminal(
+        self,
+        S0: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> np.ndarray:
+        """
+        Samples the BSM terminal spot exactly from a single normal per path.
+
+        Geometric Brownian motion has a lognormal terminal law, so European
+        payoffs need neither the time grid nor the full matrix of shocks.
+        With `quasi_random`, the shocks are the inverse-normal transform of a
+        one-dimensional scrambled Sobol sequence, whose error for smooth
+        payoffs decays close to `1/N` rather than `1/sqrt(N)`. The number of
+        Sobol draws is rounded up to the next power of two.
+        """
+        num_draws = self.n_paths // 2 if self.antithetic else self.n_paths
+        if self.quasi_random:
+            # Round up to a whole base-2 block and use all of it; a truncated
+            # Sobol block loses its balance properties
+            sobol = qmc.Sobol(d=1, scramble=True, seed=self.rng)
+            u = sobol.random_base2(m=max(num_draws - 1, 1).bit_length())
+            z = ndtri(u[:, 0])
+        else:
+            z = self.rng.standard_normal(num_draws)
+        if self.antithetic:
+            z = np.concatenate([z, -z])
+        drift = (r - q - 0.5 * sigma**2) * T
+        return S0 * np.exp(drift + sigma * math.sqrt(T) * z)
+
     def _simulate_levy_terminal(
         self,
         model: BaseModel,
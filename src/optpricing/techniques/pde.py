@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
-from scipy.linalg import solve_banded
+from scipy.linalg.lapack import dgttrf, dgttrs
 
 from optpricing.atoms import Option, OptionType, Rate, Stock
 from optpricing.models import BaseModel, BSMModel
@@ -67,17 +67,28 @@ class PDETechnique(BaseTechnique, GreekMixin, IVMixin):
         alpha = 0.25 * dt * (sigma**2 * j**2 - (r - q) * j)
         beta = -0.5 * dt * (sigma**2 * j**2 + r)
         gamma = 0.25 * dt * (sigma**2 * j**2 + (r - q) * j)
-        LHS = np.zeros((3, M - 1))
-        LHS[0, 1:], LHS[1, :], LHS[2, :-1] = -gamma[:-1], 1 - beta, -alpha[1:]
+        # The implicit operator is constant in time: LU-factorize it once and
+        # only back-substitute at each step
+        lu = dgttrf(-alpha[1:], 1 - beta, -gamma[:-1])
+        if lu[-1] != 0:
+            raise np.linalg.LinAlgError("Crank-Nicolson matrix is singular.")
+        dl, d, du, du2, ipiv = lu[:-1]
         V = np.maximum(S_vec - K, 0) if is_call else np.maximum(K - S_vec, 0)
+        # Time-invariant pieces of the explicit half-step and the boundaries
+        one_plus_beta = 1 + beta
+        disc_strike = K * np.exp(-r * (T - dt * np.arange(1, N + 1)))
+        rhs, tmp = np.empty(M - 1), np.empty(M - 1)
         for i in range(1, N + 1):
-            rhs = alpha * V[:-2] + (1 + beta) * V[1:-1] + gamma * V[2:]
-            time_to_expiry = T - i * dt
+            # rhs = alpha * V[:-2] + (1 + beta) * V[1:-1] + gamma * V[2:],
+            # accumulated in preallocated buffers
+            np.multiply(alpha, V[:-2], out=rhs)
+            rhs += np.multiply(one_plus_beta, V[1:-1], out=tmp)
+            rhs += np.multiply(gamma, V[2:], out=tmp)
             if is_call:
-                rhs[-1] += gamma[-1] * (S_max - K * np.exp(-r * time_to_expiry))
+                rhs[-1] += gamma[-1] * (S_max - disc_strike[i - 1])
             else:
-                rhs[0] += alpha[0] * (K * np.exp(-r * time_to_expiry))
-            V[1:-1] = solve_banded((1, 1), LHS, rhs, overwrite_b=True)
+                rhs[0] += alpha[0] * disc_strike[i - 1]
+            V[1:-1], _ = dgttrs(dl, d, du, du2, ipiv, rhs, overwrite_b=True)
 
         # Grid-based Greeks
         j0 = int(S0 / dS)
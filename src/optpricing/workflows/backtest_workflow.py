@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 
 import pandas as pd
 
@@ -47,7 +49,8 @@ class BacktestWorkflow:
 
         It fetches available dates, then for each calibration/evaluation pair,
         it runs a `DailyWorkflow` to calibrate the model and then evaluates
-        the out-of-sample RMSE on the next day's data.
+        the out-of-sample RMSE on the next day's data. The evaluation snapshot
+        is read in a background thread while the calibration runs.
         """
         available_dates = get_available_snapshot_dates(self.ticker)
         if len(available_dates) < 2:
@@ -57,60 +60,83 @@ class BacktestWorkflow:
             )
             return
 
-        for i in range(len(available_dates) - 1):
-            calib_date, eval_date = available_dates[i], available_dates[i + 1]
-
-            logger.info(
-                "--- Processing Period: Calibrate on %s, Evaluate on %s ---",
-                calib_date,
-                eval_date,
-            )
-
-            calib_data = load_market_snapshot(self.ticker, calib_date)
-            eval_data = load_market_snapshot(self.ticker, eval_date)
-            if calib_data is None or eval_data is None:
-                continue
-
-            # Run a daily workflow to get the calibrated model
-            calib_workflow = DailyWorkflow(
-                market_data=calib_data, model_config=self.model_config
-            )
-            calib_workflow.run()
-
-            if calib_workflow.results["Status"] != "Success":
-                logger.warning(
-                    "Calibration failed. Skipping evaluation for this period."
+        load = partial(load_market_snapshot, self.ticker)
+        # One background reader: the next snapshot is read from disk while
+        # the current period calibrates, holding at most one frame ahead
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            eval_data = load(available_dates[0])
+            for i in range(len(available_dates) - 1):
+                calib_date, eval_date = available_dates[i], available_dates[i + 1]
+
+                logger.info(
+                    "--- Processing Period: Calibrate on %s, Evaluate on %s ---",
+                    calib_date,
+                    eval_date,
                 )
-                continue
-
-            calibrated_model = self.model_config["model_class"](
-                params=calib_workflow.results["Calibrated Params"]
-            )
 
-            eval_workflow = DailyWorkflow(
-                market_data=eval_data,
-                model_config=self.model_config,
-            )
-            eval_workflow._prepare_for_evaluation()
-
-            rmse = eval_workflow._evaluate_rmse(
-                calibrated_model, eval_workflow.stock, eval_workflow.rate
-            )
-
-            logger.info(
-                "Out-of-Sample RMSE for %s on %s: %.4f",
-                self.model_config["name"],
-                eval_date,
-                rmse,
-            )
+                # Each evaluation day is the next period's calibration day, so
+                # every snapshot is read from disk only once
+                calib_data, pending_eval = eval_data, reader.submit(load, eval_date)
+                eval_data = self._run_period(calib_data, pending_eval, eval_date)
+
+    def _run_period(
+        self,
+        calib_data: pd.DataFrame | None,
+        pending_eval: Future,
+        eval_date: str,
+    ) -> pd.DataFrame | None:
+        """
+        Calibrates on one snapshot and evaluates on the next.
 
-            self.results.append(
-                {
-                    "Eval Date": eval_date,
-                    "Model": self.model_config["name"],
-                    "Out-of-Sample RMSE": rmse,
-                }
-            )
+        The evaluation snapshot is awaited only once it is needed, and is
+        returned so the caller can calibrate the following period on it.
+        """
+        if calib_data is None:
+            return pending_eval.result()
+
+        # Run a daily workflow to get the calibrated model
+        calib_workflow = DailyWorkflow(
+            market_data=calib_data, model_config=self.model_config
+        )
+        calib_workflow.run()
+
+        eval_data = pending_eval.result()
+        if eval_data is None:
+            return None
+
+        if calib_workflow.results["Status"] != "Success":
+            logger.warning("Calibration failed. Skipping evaluation for this period.")
+            return eval_data
+
+        calibrated_model = self.model_config["model_class"](
+            params=calib_workflow.results["Calibrated Params"]
+        )
+
+        eval_workflow = DailyWorkflow(
+            market_data=eval_data,
+            model_config=self.model_config,
+        )
+        eval_workflow._prepare_for_evaluation()
+
+        rmse = eval_workflow._evaluate_rmse(
+            calibrated_model, eval_workflow.stock, eval_workflow.rate
+        )
+
+        logger.info(
+            "Out-of-Sample RMSE for %s on %s: %.4f",
+            self.model_config["name"],
+            eval_date,
+            rmse,
+        )
+
+        self.results.append(
+            {
+                "Eval Date": eval_date,
+                "Model": self.model_config["name"],
+                "Out-of-Sample RMSE": rmse,
+            }
+        )
+        return eval_data
 
     def save_results(self):
         """
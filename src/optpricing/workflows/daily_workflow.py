@@ -112,14 +112,9 @@ class DailyWorkflow:
             original_count = len(self.market_data)
             min_moneyness, max_moneyness = 0.85, 1.15
 
-            calibration_data = (
-                self.market_data[
-                    (self.market_data["strike"] / spot >= min_moneyness)
-                    & (self.market_data["strike"] / spot <= max_moneyness)
-                ]
-                .copy()
-                .reset_index(drop=True)
-            )
+            moneyness = self.market_data["strike"].to_numpy(dtype=float) / spot
+            liquid = (moneyness >= min_moneyness) & (moneyness <= max_moneyness)
+            calibration_data = self.market_data[liquid].reset_index(drop=True)
             _data_msg = f"{len(calibration_data)} of {original_count} options"
             logger.info(f"  -> Using {_data_msg} for calibration.")
 
@@ -204,14 +199,13 @@ class DailyWorkflow:
         rate: Rate,
     ) -> float:
         """Calculates the RMSE of a given model against the full market data."""
-        eval_data = self.market_data.reset_index(drop=True)
-
+        # The pricer reads the columns as arrays, so no re-indexed copy is needed
         model_prices = price_options_vectorized(
-            options_df=eval_data,
+            options_df=self.market_data,
             stock=stock,
             model=model,
             rate=rate,
         )
 
-        errors = model_prices - eval_data["marketPrice"].to_numpy()
+        errors = model_prices - self.market_data["marketPrice"].to_numpy(dtype=float)
         return np.sqrt(np.mean(np.square(errors)))
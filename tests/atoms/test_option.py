@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from optpricing.atoms import ExerciseStyle, Option, OptionType
@@ -59,3 +60,19 @@ def test_option_parity_counterpart():
     call_again = put_option.parity_counterpart()
     assert call_again.option_type == OptionType.CALL
     assert call_again == call_option
+
+
+def test_option_payoff():
+    """
+    Tests the vectorized payoff for both call and put options.
+    """
+    spots = np.array([80.0, 100.0, 120.0])
+    call_option = Option(strike=100, maturity=1.0, option_type=OptionType.CALL)
+    put_option = call_option.parity_counterpart()
+
+    np.testing.assert_array_equal(call_option.payoff(spots), [0.0, 0.0, 20.0])
+    np.testing.assert_array_equal(put_option.payoff(spots), [20.0, 0.0, 0.0])
+    assert call_option.payoff(120.0) == 20.0
+    assert put_option.payoff(90.0) == 10.0
+    # The input spots must not be modified by the in-place evaluation
+    np.testing.assert_array_equal(spots, [80.0, 100.0, 120.0])
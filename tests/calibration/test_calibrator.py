@@ -1,11 +1,13 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from optpricing.atoms import Rate, Stock
 from optpricing.calibration import Calibrator
 from optpricing.models import BSMModel
+from optpricing.models.bsm import bsm_price_vectorized
 
 
 @pytest.fixture
@@ -46,6 +48,28 @@ def test_objective_function(setup):
     assert error == pytest.approx(0.2030255)
 
 
+def test_objective_memoizes_exact_repeats(setup):
+    """
+    Tests that an exact repeat of a parameter vector is not priced again.
+    """
+    calibrator = setup
+    args = (["sigma"], {})
+
+    with (
+        patch("optpricing.calibration.calibrator.print"),
+        patch.object(
+            calibrator, "_price_all", wraps=calibrator._price_all
+        ) as price_all,
+    ):
+        first = calibrator._objective_function(np.array([0.2]), *args)
+        again = calibrator._objective_function(np.array([0.2]), *args)
+        other = calibrator._objective_function(np.array([0.3]), *args)
+
+    assert again == first
+    assert other != first
+    assert price_all.call_count == 2
+
+
 @patch("optpricing.calibration.calibrator.print")
 @patch("optpricing.calibration.calibrator.minimize")
 def test_fit_multivariate(mock_minimize, mock_print, setup):
@@ -74,6 +98,102 @@ def test_fit_multivariate(mock_minimize, mock_print, setup):
     assert result["other"] == pytest.approx(0.1)
 
 
+@patch("optpricing.calibration.calibrator.print")
+@patch("optpricing.calibration.calibrator.minimize")
+def test_fit_forwards_method_and_jacobian(mock_minimize, mock_print, setup):
+    """
+    Tests that the optimizer method and a user gradient reach `minimize`.
+    """
+    calibrator = setup
+
+    fake_result = MagicMock()
+    fake_result.x = [0.2, 0.1]
+    fake_result.fun = 0.1234
+    mock_minimize.return_value = fake_result
+
+    def gradient(values, names, frozen):
+        return [0.0, 0.0]
+
+    calibrator.fit(
+        {"sigma": 0.2, "other": 0.1},
+        {"sigma": (0.01, 1), "other": (0, 1)},
+        method="SLSQP",
+        jac=gradient,
+    )
+
+    _, kwargs = mock_minimize.call_args
+    assert kwargs["method"] == "SLSQP"
+    assert kwargs["jac"] is gradient
+    assert kwargs["args"] == (["sigma", "other"], {})
+
+
+@patch("optpricing.calibration.calibrator.print")
+@patch("optpricing.calibration.calibrator.minimize")
+def test_fit_solver_options(mock_minimize, mock_print, setup):
+    """
+    Tests that derivative-free methods get explicit stopping tolerances and
+    that user options take precedence.
+    """
+    calibrator = setup
+
+    fake_result = MagicMock()
+    fake_result.x = [0.2, 0.1]
+    fake_result.fun = 0.1234
+    mock_minimize.return_value = fake_result
+
+    guess, bounds = {"sigma": 0.2, "other": 0.1}, {"sigma": (0.01, 1), "other": (0, 1)}
+
+    calibrator.fit(guess, bounds)
+    assert mock_minimize.call_args.kwargs["options"] is None
+
+    calibrator.fit(guess, bounds, method="Powell")
+    assert mock_minimize.call_args.kwargs["options"] == {"xtol": 1e-6, "ftol": 1e-8}
+
+    calibrator.fit(guess, bounds, method="Powell", options={"maxiter": 50})
+    assert mock_minimize.call_args.kwargs["options"] == {"maxiter": 50}
+
+
+@patch("optpricing.calibration.calibrator.print")
+@patch("optpricing.calibration.calibrator.least_squares")
+def test_fit_least_squares(mock_least_squares, mock_print, setup):
+    """
+    Tests that the 'trf' method fits the residual vector with least_squares.
+    """
+    calibrator = setup
+
+    fake_result = MagicMock()
+    fake_result.x = [0.25, 0.5]
+    fake_result.cost = 0.01
+    mock_least_squares.return_value = fake_result
+
+    result = calibrator.fit(
+        {"sigma": 0.2, "other": 0.1},
+        {"sigma": (0.01, 1), "other": (0, None)},
+        method="trf",
+        options={"max_nfev": 20},
+    )
+
+    args, kwargs = mock_least_squares.call_args
+    assert args[0] == calibrator._residual_function
+    assert kwargs["method"] == "trf"
+    assert kwargs["bounds"] == ([0.01, 0], [1, np.inf])
+    assert kwargs["max_nfev"] == 20
+    assert result == {"sigma": 0.25, "other": 0.5}
+
+
+def test_residual_function(setup):
+    """
+    Tests that the residuals are model minus market prices.
+    """
+    calibrator = setup
+    with patch("optpricing.calibration.calibrator.print"):
+        residuals = calibrator._residual_function(np.array([0.2]), ["sigma"], {})
+        error = calibrator._objective_function(np.array([0.2]), ["sigma"], {})
+
+    assert residuals.shape == (1,)
+    assert np.dot(residuals, residuals) == pytest.approx(error)
+
+
 @patch("optpricing.calibration.calibrator.print")
 @patch("optpricing.calibration.calibrator.minimize_scalar")
 def test_fit_scalar(mock_minimize_scalar, mock_print, setup):
@@ -97,3 +217,44 @@ def test_fit_scalar(mock_minimize_scalar, mock_print, setup):
     assert kwargs["bounds"] == (0.01, 1)
 
     assert result["sigma"] == pytest.approx(0.42)
+
+
+def test_weighted_residuals():
+    """
+    Tests that explicit and vega weights scale the residuals per quote.
+    """
+    model = BSMModel(params={"sigma": 0.2})
+    stock, rate = Stock(spot=100), Rate(rate=0.05)
+    market_data = pd.DataFrame(
+        {
+            "strike": [80.0, 100.0, 120.0],
+            "maturity": [1.0, 1.0, 1.0],
+            "optionType": ["put", "call", "call"],
+        }
+    )
+    market_data["marketPrice"] = bsm_price_vectorized(
+        100.0,
+        market_data["strike"].to_numpy(),
+        0.05,
+        0.0,
+        1.0,
+        0.25,
+        market_data["optionType"].to_numpy() == "call",
+    )
+
+    with patch("optpricing.calibration.calibrator.print"):
+        plain = Calibrator(model, market_data, stock, rate)
+        doubled = Calibrator(model, market_data, stock, rate, weights=np.full(3, 2.0))
+        vega = Calibrator(model, market_data, stock, rate, weights="vega")
+        args = (np.array([0.2]), ["sigma"], {})
+        r_plain = plain._residual_function(*args)
+        np.testing.assert_allclose(doubled._residual_function(*args), 2 * r_plain)
+        assert doubled._objective_function(*args) == pytest.approx(
+            4 * plain._objective_function(*args)
+        )
+
+        # A price residual over vega is roughly the implied-vol gap, 0.05
+        np.testing.assert_allclose(vega._residual_function(*args), -0.05, rtol=0.2)
+
+    with pytest.raises(ValueError, match="Unknown weighting scheme"):
+        Calibrator(model, market_data, stock, rate, weights="delta")
@@ -45,3 +45,71 @@ def test_bsm_iv_solver(setup):
     implied_vols = solver.solve(target_prices, options, stock, rate)
 
     np.testing.assert_allclose(implied_vols, target_vols, atol=1e-3)
+
+
+def test_bsm_iv_solver_mixed_slice_and_bounds():
+    """
+    Tests a mixed call/put slice, and that arbitrage-violating prices give NaN.
+    """
+    options = pd.DataFrame(
+        {
+            "strike": [80.0, 100.0, 120.0, 100.0],
+            "maturity": [0.5, 0.5, 0.5, 0.5],
+            "optionType": ["put", "call", "call", "call"],
+        }
+    )
+    stock = Stock(spot=100, dividend=0.01)
+    rate = Rate(rate=0.03)
+    target_vols = np.array([0.30, 0.20, 0.18, 0.20])
+
+    target_prices = np.array(
+        [
+            BSMModel(params={"sigma": vol}).price_closed_form(
+                spot=100.0,
+                strike=k,
+                r=0.03,
+                q=0.01,
+                t=0.5,
+                call=(kind == "call"),
+            )
+            for vol, k, kind in zip(
+                target_vols, options["strike"], options["optionType"]
+            )
+        ]
+    )
+    target_prices[-1] = 150.0  # Above the spot: no volatility can match it
+
+    implied_vols = BSMIVSolver(tolerance=1e-10).solve(
+        target_prices, options, stock, rate
+    )
+
+    np.testing.assert_allclose(implied_vols[:3], target_vols[:3], atol=1e-6)
+    assert np.isnan(implied_vols[3])
+
+
+def test_bsm_iv_solver_warm_start_converges_quickly(setup):
+    """
+    Tests that the Corrado-Miller starting point lets a near-the-money slice
+    converge within a handful of Newton steps.
+    """
+    options, stock, rate = setup
+
+    target_vols = np.array([0.35, 0.60, 0.90])
+    target_prices = np.array(
+        [
+            BSMModel(params={"sigma": vol}).price_closed_form(
+                spot=stock.spot,
+                strike=options.loc[i, "strike"],
+                r=rate.get_rate(options.loc[i, "maturity"]),
+                q=stock.dividend,
+                t=options.loc[i, "maturity"],
+                call=True,
+            )
+            for i, vol in enumerate(target_vols)
+        ]
+    )
+
+    solver = BSMIVSolver(max_iter=3)
+    implied_vols = solver.solve(target_prices, options, stock, rate)
+
+    np.testing.assert_allclose(implied_vols, target_vols, atol=1e-4)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
 from scipy.stats import norm
 
 from optpricing.atoms import Rate, Stock
-from optpricing.calibration.vectorized_pricer import price_options_vectorized
-from optpricing.models import BSMModel
+from optpricing.calibration import vectorized_pricer
+from optpricing.calibration.vectorized_pricer import (
+    ChainLayout,
+    price_options_vectorized,
+)
+from optpricing.models import BSMModel, MertonJumpModel
 
 
 def bsm_closed_form(
@@ -73,3 +79,197 @@ def test_price_options_vectorized(setup_vectorized_test):
 
     assert len(vectorized_prices) == len(expected_prices)
     np.testing.assert_allclose(vectorized_prices, expected_prices, rtol=1e-5)
+
+
+def test_bsm_chain_skips_integration(setup_vectorized_test):
+    """
+    Tests that a BSM chain spanning several maturities is priced in closed
+    form without any numerical integration.
+    """
+    _, stock, model, rate = setup_vectorized_test
+    options_df = pd.DataFrame(
+        {
+            "strike": [90.0, 100.0, 110.0, 100.0],
+            "maturity": [0.5, 1.0, 0.5, 2.0],
+            "optionType": ["put", "call", "call", "put"],
+        }
+    )
+
+    with patch.object(vectorized_pricer.integrate, "quad_vec") as quad_vec:
+        prices = price_options_vectorized(options_df, stock, model, rate)
+    quad_vec.assert_not_called()
+
+    expected = [
+        bsm_closed_form(
+            stock.spot,
+            row.strike,
+            row.maturity,
+            rate.get_rate(row.maturity),
+            stock.dividend,
+            model.params["sigma"],
+            row.optionType == "call",
+        )
+        for row in options_df.itertuples()
+    ]
+    np.testing.assert_allclose(prices, expected, rtol=1e-10)
+
+
+def test_integral_pricer_matches_merton_closed_form(setup_vectorized_test):
+    """
+    Tests the Carr-Madan integration path against Merton's series solution.
+    """
+    options_df, stock, _, rate = setup_vectorized_test
+    model = MertonJumpModel(
+        params={
+            "sigma": 0.2,
+            "lambda": 0.5,
+            "mu_j": -0.1,
+            "sigma_j": 0.15,
+            "max_sum_terms": 100,
+        }
+    )
+
+    prices = price_options_vectorized(options_df, stock, model, rate)
+    expected = [
+        model.price_closed_form(
+            spot=stock.spot,
+            strike=row.strike,
+            r=rate.get_rate(row.maturity),
+            q=stock.dividend,
+            t=row.maturity,
+            call=row.optionType == "call",
+        )
+        for row in options_df.itertuples()
+    ]
+    np.testing.assert_allclose(prices, expected, rtol=1e-5)
+
+
+def test_integral_pricer_integrates_once_per_maturity(setup_vectorized_test):
+    """
+    Tests that both probabilities of a maturity slice share one integration.
+    """
+    _, stock, _, rate = setup_vectorized_test
+    model = MertonJumpModel(
+        params={
+            "sigma": 0.2,
+            "lambda": 0.5,
+            "mu_j": -0.1,
+            "sigma_j": 0.15,
+            "max_sum_terms": 100,
+        }
+    )
+    options_df = pd.DataFrame(
+        {
+            "strike": [90.0, 100.0, 110.0, 100.0],
+            "maturity": [0.5, 1.0, 0.5, 2.0],
+            "optionType": ["put", "call", "call", "put"],
+        }
+    )
+
+    quad_vec = vectorized_pricer.integrate.quad_vec
+    with patch.object(
+        vectorized_pricer.integrate, "quad_vec", side_effect=quad_vec
+    ) as spy:
+        prices = price_options_vectorized(options_df, stock, model, rate)
+    assert spy.call_count == 3
+
+    expected = [
+        model.price_closed_form(
+            spot=stock.spot,
+            strike=row.strike,
+            r=rate.get_rate(row.maturity),
+            q=stock.dividend,
+            t=row.maturity,
+            call=row.optionType == "call",
+        )
+        for row in options_df.itertuples()
+    ]
+    np.testing.assert_allclose(prices, expected, rtol=1e-5)
+
+
+def test_pricer_writes_into_out_buffer(setup_vectorized_test):
+    """
+    Tests that both pricing paths fill and return a preallocated buffer.
+    """
+    options_df, stock, model, rate = setup_vectorized_test
+    merton = MertonJumpModel(
+        params={
+            "sigma": 0.2,
+            "lambda": 0.5,
+            "mu_j": -0.1,
+            "sigma_j": 0.15,
+            "max_sum_terms": 100,
+        }
+    )
+    for m in (model, merton):
+        out = np.empty(len(options_df))
+        prices = price_options_vectorized(options_df, stock, m, rate, out=out)
+        assert prices is out
+        np.testing.assert_allclose(
+            out, price_options_vectorized(options_df, stock, m, rate)
+        )
+
+
+def test_fft_method_matches_integration(setup_vectorized_test):
+    """
+    Tests that the FFT strike sweep agrees with the integral pricer.
+    """
+    _, stock, _, rate = setup_vectorized_test
+    model = MertonJumpModel(
+        params={
+            "sigma": 0.2,
+            "lambda": 0.5,
+            "mu_j": -0.1,
+            "sigma_j": 0.15,
+            "max_sum_terms": 100,
+        }
+    )
+    options_df = pd.DataFrame(
+        {
+            "strike": [80.0, 90.0, 100.0, 110.0, 100.0, 120.0],
+            "maturity": [0.5, 0.5, 1.0, 0.5, 2.0, 2.0],
+            "optionType": ["put", "call", "call", "put", "put", "call"],
+        }
+    )
+
+    with patch.object(vectorized_pricer.integrate, "quad_vec") as quad_vec:
+        fft_prices = price_options_vectorized(
+            options_df, stock, model, rate, method="fft"
+        )
+    quad_vec.assert_not_called()
+
+    expected = price_options_vectorized(options_df, stock, model, rate)
+    np.testing.assert_allclose(fft_prices, expected, atol=5e-3)
+
+
+def test_unknown_method_raises(setup_vectorized_test):
+    """
+    Tests that an unsupported pricing method is rejected.
+    """
+    options_df, stock, model, rate = setup_vectorized_test
+    with pytest.raises(ValueError, match="Unknown pricing method"):
+        price_options_vectorized(options_df, stock, model, rate, method="cos")
+
+
+def test_prebuilt_layout_is_reused(setup_vectorized_test):
+    """
+    Tests that a prebuilt chain layout gives the same prices without being
+    rebuilt from the DataFrame.
+    """
+    _, stock, model, rate = setup_vectorized_test
+    options_df = pd.DataFrame(
+        {
+            "strike": [90.0, 100.0, 110.0, 100.0],
+            "maturity": [2.0, 0.5, 2.0, 0.5],
+            "optionType": ["put", "call", "call", "put"],
+        }
+    )
+    layout = ChainLayout.from_frame(options_df)
+    np.testing.assert_array_equal(layout.unique_maturities, [0.5, 2.0])
+    assert [g.tolist() for g in layout.groups] == [[1, 3], [0, 2]]
+
+    expected = price_options_vectorized(options_df, stock, model, rate)
+    with patch.object(ChainLayout, "from_frame") as from_frame:
+        prices = price_options_vectorized(options_df, stock, model, rate, layout=layout)
+    from_frame.assert_not_called()
+    np.testing.assert_allclose(prices, expected)
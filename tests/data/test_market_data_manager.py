@@ -191,3 +191,31 @@ def test_get_available_snapshot_dates_no_files(monkeypatch, tmp_path):
     monkeypatch.setattr(market_data_manager, "MARKET_SNAPSHOT_DIR", tmp_path)
     dates = market_data_manager.get_available_snapshot_dates("TEST")
     assert dates == []
+
+
+def test_get_live_dividend_yield_is_cached(monkeypatch, mock_yfinance_ticker):
+    """
+    Test that repeated dividend lookups for a ticker query yfinance once.
+    """
+    ticker_factory = MagicMock(return_value=mock_yfinance_ticker)
+    monkeypatch.setattr(market_data_manager, "yf", MagicMock(Ticker=ticker_factory))
+    monkeypatch.setattr(market_data_manager, "_dividend_cache", {})
+
+    first = market_data_manager.get_live_dividend_yield("TEST")
+    second = market_data_manager.get_live_dividend_yield("TEST")
+
+    assert first == second == pytest.approx(0.02)
+    ticker_factory.assert_called_once_with("TEST")
+
+
+def test_get_live_dividend_yield_failure_is_not_cached(monkeypatch):
+    """
+    Test that a failed dividend lookup is retried on the next call.
+    """
+    ticker_factory = MagicMock(side_effect=Exception("API Error"))
+    monkeypatch.setattr(market_data_manager, "yf", MagicMock(Ticker=ticker_factory))
+    monkeypatch.setattr(market_data_manager, "_dividend_cache", {})
+
+    assert market_data_manager.get_live_dividend_yield("TEST") == 0.0
+    assert market_data_manager.get_live_dividend_yield("TEST") == 0.0
+    assert ticker_factory.call_count == 2
@@ -97,3 +97,31 @@ def test_price_when_early_exercise_is_optimal(model):
         **PRICING_KWARGS, discrete_dividends=divs, ex_div_times=div_times
     )
     assert price == pytest.approx(expected_price)
+
+
+def test_price_with_multiple_dividends(model):
+    """
+    Tests a two-dividend schedule against a direct evaluation of every
+    exercise candidate.
+    """
+    divs = np.array([2.0, 6.0])
+    div_times = np.array([0.2, 0.4])
+    r, t = PRICING_KWARGS["r"], PRICING_KWARGS["t"]
+    spot, strike = PRICING_KWARGS["spot"], PRICING_KWARGS["strike"]
+    pv_divs = divs * np.exp(-r * div_times)
+
+    def _bsm(adj_spot, maturity):
+        return model.bsm_solver.price_closed_form(
+            spot=adj_spot, strike=strike, r=r, q=0, t=maturity, call=True
+        )
+
+    candidates = [
+        _bsm(spot - pv_divs.sum(), t),
+        _bsm(spot, div_times[0]),
+        _bsm(spot - pv_divs[0], div_times[1]),
+    ]
+
+    price = model.price_closed_form(
+        **PRICING_KWARGS, discrete_dividends=divs, ex_div_times=div_times
+    )
+    assert price == pytest.approx(max(candidates))
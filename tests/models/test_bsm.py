@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
-from optpricing.models import BSMModel
+from optpricing.models import BSMModel, bsm
+from optpricing.models.bsm import bsm_greeks_vectorized, bsm_price_vectorized
 
 # Common parameters for tests
 PARAMS = {"sigma": 0.2}
@@ -46,6 +49,46 @@ def test_put_call_parity(model):
     assert parity_lhs == pytest.approx(parity_rhs)
 
 
+def test_vectorized_price_matches_scalar(model):
+    """
+    Tests that the vectorized pricer agrees with the scalar closed form across
+    a strike slice with mixed calls and puts.
+    """
+    strikes = np.array([80.0, 95.0, 105.0, 120.0])
+    is_call = np.array([True, False, True, False])
+    _, _, r, q, T = PRICING_KWARGS.values()
+
+    prices = bsm_price_vectorized(100.0, strikes, r, q, T, PARAMS["sigma"], is_call)
+    expected = [
+        model.price_closed_form(spot=100.0, strike=k, r=r, q=q, t=T, call=bool(c))
+        for k, c in zip(strikes, is_call)
+    ]
+    assert prices.shape == strikes.shape
+    np.testing.assert_allclose(prices, expected, rtol=1e-10)
+
+
+def test_vectorized_price_scalar_and_grid_inputs(model):
+    """
+    Tests scalar inputs and a 2-D (maturity x strike) broadcast grid.
+    """
+    scalar = bsm_price_vectorized(**PRICING_KWARGS, sigma=PARAMS["sigma"], call=True)
+    assert scalar.shape == (1,)
+    assert scalar[0] == pytest.approx(
+        model.price_closed_form(**PRICING_KWARGS, call=True), rel=1e-12
+    )
+
+    strikes = np.array([90.0, 100.0, 110.0])
+    maturities = np.array([[0.25], [1.0]])
+    grid = bsm_price_vectorized(100.0, strikes, 0.05, 0.01, maturities, 0.2, False)
+    assert grid.shape == (2, 3)
+    assert grid[1, 2] == pytest.approx(
+        model.price_closed_form(
+            spot=100.0, strike=110.0, r=0.05, q=0.01, t=1.0, call=False
+        ),
+        rel=1e-12,
+    )
+
+
 def test_analytic_greeks(model):
     """
     Tests analytic greeks against known 'golden' values.
@@ -64,6 +107,52 @@ def test_analytic_greeks(model):
     )
 
 
+def test_vectorized_greeks_match_analytic(model):
+    """
+    Tests that the fused vectorized price and Greeks agree with the scalar
+    closed form and analytic Greeks for a mixed slice of calls and puts.
+    """
+    strikes = np.array([80.0, 95.0, 105.0, 120.0])
+    maturities = np.array([0.25, 0.5, 1.0, 2.0])
+    is_call = np.array([True, False, True, False])
+    _, _, r, q, _ = PRICING_KWARGS.values()
+
+    results = bsm_greeks_vectorized(
+        100.0, strikes, r, q, maturities, PARAMS["sigma"], is_call
+    )
+    for i, (k, t, c) in enumerate(zip(strikes, maturities, is_call)):
+        kw = {"spot": 100.0, "strike": k, "r": r, "q": q, "t": t}
+        call = bool(c)
+        expected = {
+            "price": model.price_closed_form(**kw, call=call),
+            "delta": model.delta_analytic(**kw, call=call),
+            "gamma": model.gamma_analytic(**kw),
+            "vega": model.vega_analytic(**kw),
+            "theta": model.theta_analytic(**kw, call=call),
+            "rho": model.rho_analytic(**kw, call=call),
+        }
+        for name, value in expected.items():
+            assert results[name][i] == pytest.approx(value, rel=1e-10), name
+
+
+def test_call_and_put_greeks_share_one_evaluation(model):
+    """
+    Tests that the scalar Greeks of a call and a put on the same strike and
+    maturity are served from a single memoized kernel evaluation.
+    """
+    bsm._bsm_greeks_pair.cache_clear()
+    with patch.object(bsm, "bsm_greeks_kernel", wraps=bsm.bsm_greeks_kernel) as kernel:
+        call_delta = model.delta_analytic(**PRICING_KWARGS, call=True)
+        put_delta = model.delta_analytic(**PRICING_KWARGS, call=False)
+        model.gamma_analytic(**PRICING_KWARGS)
+        model.vega_analytic(**PRICING_KWARGS)
+        model.rho_analytic(**PRICING_KWARGS, call=False)
+    kernel.assert_called_once()
+
+    _, _, _, q, T = PRICING_KWARGS.values()
+    assert call_delta - put_delta == pytest.approx(np.exp(-q * T))
+
+
 def test_characteristic_function(model):
     """
     Tests the characteristic function at u=0, where it should be 1.
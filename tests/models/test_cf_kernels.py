@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from optpricing.models import KouModel, MertonJumpModel
+from optpricing.models.cf_kernels import heston_cf_grid_kernel, heston_cf_kernel
+
+# t, log_spot, r, q, v0, kappa, theta, rho, vol_of_vol
+ARGS = (1.0, np.log(100.0), 0.05, 0.01, 0.04, 2.0, 0.04, -0.7, 0.5)
+
+
+def _heston_reference(u):
+    t, log_spot, r, q, v0, kappa, theta, rho, sigma = ARGS
+    d = np.sqrt((rho * sigma * u * 1j - kappa) ** 2 - sigma**2 * (-u * 1j - u**2))
+    g = (kappa - rho * sigma * u * 1j - d) / (kappa - rho * sigma * u * 1j + d)
+    C = (r - q) * u * 1j * t + (kappa * theta / sigma**2) * (
+        (kappa - rho * sigma * u * 1j - d) * t
+        - 2 * np.log((1 - g * np.exp(-d * t)) / (1 - g))
+    )
+    D = ((kappa - rho * sigma * u * 1j - d) / sigma**2) * (
+        (1 - np.exp(-d * t)) / (1 - g * np.exp(-d * t))
+    )
+    return np.exp(C + D * v0 + 1j * u * log_spot)
+
+
+@pytest.mark.parametrize("u", [0.5, 3.0, 2.0 - 1.5j, -4.0 + 0.25j])
+def test_heston_cf_kernel_matches_numpy_formula(u):
+    """
+    Tests the scalar Heston CF kernel against the NumPy closed form.
+    """
+    assert heston_cf_kernel(complex(u), *ARGS) == pytest.approx(
+        _heston_reference(u), rel=1e-10
+    )
+
+
+def test_heston_cf_grid_kernel_matches_scalar_kernel():
+    """
+    Tests that the grid kernel evaluates each node like the scalar kernel.
+    """
+    u = np.linspace(0.01, 50.0, 64) - 1.5j
+    grid = heston_cf_grid_kernel(u, *ARGS)
+    expected = np.array([heston_cf_kernel(x, *ARGS) for x in u])
+    np.testing.assert_allclose(grid, expected, rtol=1e-14)
+    np.testing.assert_allclose(grid, _heston_reference(u), rtol=1e-10)
+
+
+@pytest.mark.parametrize("model_class", [MertonJumpModel, KouModel])
+def test_jump_diffusion_cf_grid_kernels_match_scalar_path(model_class):
+    """
+    Tests that each compiled grid kernel agrees with the single-node CF path.
+    """
+    model = model_class(model_class.default_params)
+    phi = model.cf(t=0.5, spot=100.0, r=0.05, q=0.01)
+    u = np.linspace(0.01, 50.0, 64) - 1.5j
+    expected = np.array([phi(complex(x)) for x in u])
+    np.testing.assert_allclose(phi(u), expected, rtol=1e-12)
+    assert phi(u.reshape(8, 8)).shape == (8, 8)
@@ -41,6 +41,20 @@ def test_raw_characteristic_function(model):
     assert raw_cf(0) == pytest.approx(1.0)
 
 
+@pytest.mark.parametrize("y", [1.0, 0.0])
+def test_characteristic_function_at_gamma_poles(y):
+    """
+    Tests that the CF is finite at Y=1 and Y=0, where gamma(-Y) has a pole,
+    and continuous with nearby Y.
+    """
+    u = np.array([0.5, 1.3, 4.0])
+    cf = CGMYModel(params={**PARAMS, "Y": y}).cf(**CF_KWARGS)
+    nearby = CGMYModel(params={**PARAMS, "Y": y + 1e-4}).cf(**CF_KWARGS)
+    assert np.all(np.isfinite(cf(u)))
+    assert cf(-1j) == pytest.approx(CF_KWARGS["spot"] * np.exp(0.04))
+    np.testing.assert_allclose(cf(u), nearby(u), rtol=1e-4)
+
+
 def test_sampler_not_implemented_for_y_not_1(model):
     """
     Tests that the sampler raises an error if Y is not 1.
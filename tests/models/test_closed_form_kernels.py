@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from optpricing.models.bsm import bsm_greeks_vectorized, bsm_price_vectorized
+from optpricing.models.closed_form_kernels import (
+    bsm_chain_kernel,
+    bsm_greeks_kernel,
+    bsm_implied_vol_chain_kernel,
+    bsm_price_kernel,
+    merton_series_kernel,
+)
+
+S, K, R, Q, T, SIGMA = 100.0, 105.0, 0.05, 0.01, 1.0, 0.2
+
+
+def _bsm_reference(call: bool) -> float:
+    d1 = (np.log(S / K) + (R - Q + 0.5 * SIGMA**2) * T) / (SIGMA * np.sqrt(T))
+    d2 = d1 - SIGMA * np.sqrt(T)
+    if call:
+        return S * np.exp(-Q * T) * norm.cdf(d1) - K * np.exp(-R * T) * norm.cdf(d2)
+    return K * np.exp(-R * T) * norm.cdf(-d2) - S * np.exp(-Q * T) * norm.cdf(-d1)
+
+
+@pytest.mark.parametrize("call", [True, False])
+def test_bsm_price_kernel_matches_scipy(call):
+    """
+    Tests the JIT-compiled BSM kernel against the scipy reference formula.
+    """
+    price = bsm_price_kernel(S, K, R, Q, T, SIGMA, call)
+    assert price == pytest.approx(_bsm_reference(call), rel=1e-12)
+
+
+@pytest.mark.parametrize("call", [True, False])
+@pytest.mark.parametrize("strike", [20.0, 500.0])
+def test_bsm_price_kernel_deep_wings(call, strike):
+    """
+    Tests the saturated-CDF shortcut for deep in- and out-of-the-money options.
+    """
+    price = bsm_price_kernel(S, strike, R, Q, 0.1, SIGMA, call)
+    expected = bsm_price_vectorized(S, strike, R, Q, 0.1, SIGMA, call)[0]
+    assert price == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.parametrize("call", [True, False])
+def test_bsm_greeks_kernel_matches_vectorized(call):
+    """
+    Tests the JIT-compiled price-and-Greeks kernel against the NumPy version.
+    """
+    greeks = bsm_greeks_kernel(S, K, R, Q, T, SIGMA, call)
+    expected = bsm_greeks_vectorized(S, K, R, Q, T, SIGMA, call)
+    assert greeks[0] == pytest.approx(_bsm_reference(call), rel=1e-12)
+    for value, name in zip(greeks, ("price", "delta", "gamma", "vega", "theta", "rho")):
+        assert value == pytest.approx(float(expected[name]), rel=1e-10), name
+
+
+def test_bsm_chain_kernel_matches_vectorized():
+    """
+    Tests the fused chain kernel against the broadcasting NumPy pricer.
+    """
+    strikes = np.linspace(60.0, 140.0, 41)
+    rates = np.linspace(0.01, 0.05, 41)
+    maturities = np.linspace(0.05, 2.0, 41)
+    calls = np.arange(41) % 2 == 0
+
+    prices = bsm_chain_kernel(S, strikes, rates, Q, maturities, SIGMA, calls)
+    expected = bsm_price_vectorized(S, strikes, rates, Q, maturities, SIGMA, calls)
+    np.testing.assert_allclose(prices, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_bsm_implied_vol_chain_kernel_recovers_vols():
+    """
+    Tests that the chain IV kernel inverts a mixed chain and flags bad prices.
+    """
+    strikes = np.linspace(85.0, 115.0, 13)
+    rates = np.full(13, R)
+    maturities = np.linspace(0.25, 2.0, 13)
+    calls = np.arange(13) % 2 == 0
+    vols = np.linspace(0.15, 0.7, 13)
+    prices = bsm_price_vectorized(S, strikes, rates, Q, maturities, vols, calls)
+    prices[-1] = 2.0 * S  # Above every no-arbitrage bound
+
+    ivs = bsm_implied_vol_chain_kernel(
+        prices, S, strikes, rates, Q, maturities, calls, 1e-6, 5.0, 1e-10, 50
+    )
+    np.testing.assert_allclose(ivs[:-1], vols[:-1], atol=1e-8)
+    assert np.isnan(ivs[-1])
+
+
+def test_merton_series_kernel_reduces_to_bsm():
+    """
+    Tests that the Merton series collapses to BSM when jumps are negligible.
+    """
+    price = merton_series_kernel(S, K, R, Q, T, SIGMA, 1e-12, 0.0, 1e-6, 100, True)
+    assert price == pytest.approx(_bsm_reference(True), rel=1e-9)
+
+
+@pytest.mark.parametrize("call", [True, False])
+def test_merton_series_kernel_without_jumps_is_bsm(call):
+    """
+    Tests that lambda = 0 returns the BSM price instead of entering the
+    series, whose Poisson weights would need log(0).
+    """
+    price = merton_series_kernel(S, K, R, Q, T, SIGMA, 0.0, -0.1, 0.15, 100, call)
+    assert price == bsm_price_kernel(S, K, R, Q, T, SIGMA, call)
+    assert price == pytest.approx(_bsm_reference(call), rel=1e-9)
+
+
+def test_merton_series_kernel_large_jump_intensity():
+    """
+    Tests that the log-space Poisson weights stay stable when lambda*T is large
+    enough that factorial-based weights would overflow.
+    """
+    lam, t = 400.0, 2.0
+    call = merton_series_kernel(S, K, R, Q, t, SIGMA, lam, -0.01, 0.02, 2000, True)
+    put = merton_series_kernel(S, K, R, Q, t, SIGMA, lam, -0.01, 0.02, 2000, False)
+    assert np.isfinite(call) and np.isfinite(put)
+    parity_rhs = S * np.exp(-Q * t) - K * np.exp(-R * t)
+    assert call - put == pytest.approx(parity_rhs, abs=1e-6)
@@ -32,6 +32,18 @@ def test_characteristic_function(model):
     assert cf(0) == pytest.approx(1.0)
 
 
+def test_characteristic_function_is_martingale(model):
+    """
+    Tests that phi(-i) is the forward, E[S_t] = S_0 exp((r - q) t). This
+    fails if the i*u term of the discriminant d is dropped.
+    """
+    kw = PRICING_KWARGS
+    cf = model.cf(**kw)
+    forward = kw["spot"] * np.exp((kw["r"] - kw["q"]) * kw["t"])
+    assert cf(-1j) == pytest.approx(forward, rel=1e-12)
+    assert cf(np.array([-1j]))[0] == pytest.approx(forward, rel=1e-12)
+
+
 def test_sde_stepper(model):
     """
     Tests the SDE stepper for a single step with no randomness.
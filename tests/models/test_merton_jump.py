@@ -62,6 +62,15 @@ def test_characteristic_function(model):
     assert cf(0) == pytest.approx(1.0)
 
 
+def test_characteristic_function_scalar_matches_grid(model):
+    """
+    Tests that the single-node (cmath) path agrees with the grid path.
+    """
+    cf = model.cf(**PRICING_KWARGS)
+    nodes = np.array([0.7, 3.0 - 1.0j, -5.0 + 0.25j])
+    np.testing.assert_allclose([cf(x) for x in nodes.tolist()], cf(nodes), rtol=1e-13)
+
+
 def test_sde_stepper(model):
     """
     Tests the SDE stepper for a single step with no randomness and no jumps.
@@ -80,3 +89,22 @@ def test_sde_stepper(model):
 
     log_s1 = stepper(np.array([log_s0]), r, q, dt, dw, jump_counts, rng)
     assert log_s1[0] == pytest.approx(expected_log_s1)
+
+
+def test_sde_stepper_compound_jumps(model):
+    """
+    Tests that paths with several jumps receive the compound jump distribution.
+    """
+    stepper = model.get_sde_sampler()
+    n_paths, n_jumps = 200_000, 3
+    log_s0 = np.zeros(n_paths)
+    dw = np.zeros(n_paths)
+    jump_counts = np.full(n_paths, n_jumps)
+    jump_counts[::2] = 0  # Half the paths do not jump
+    rng = np.random.default_rng(0)
+
+    log_s1 = stepper(log_s0, 0.0, 0.0, 0.0, dw, jump_counts, rng)
+    assert np.all(log_s1[::2] == 0.0)
+    jumps = log_s1[1::2]
+    assert jumps.mean() == pytest.approx(n_jumps * PARAMS["mu_j"], abs=2e-3)
+    assert jumps.std() == pytest.approx(np.sqrt(n_jumps) * PARAMS["sigma_j"], rel=1e-2)
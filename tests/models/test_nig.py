@@ -35,6 +35,15 @@ def test_characteristic_function(model):
     assert cf(0) == pytest.approx(1.0)
 
 
+def test_characteristic_function_scalar_matches_grid(model):
+    """
+    Tests that the single-node (cmath) path agrees with the grid path.
+    """
+    cf = model.cf(**CF_KWARGS)
+    nodes = np.array([0.7, 3.0 - 1.0j, -5.0 + 0.25j])
+    np.testing.assert_allclose([cf(x) for x in nodes.tolist()], cf(nodes), rtol=1e-13)
+
+
 def test_raw_characteristic_function(model):
     """
     Tests the raw characteristic function at u=0, where it should be 1.
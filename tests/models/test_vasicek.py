@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from optpricing.models import VasicekModel
@@ -44,3 +45,13 @@ def test_not_implemented_methods(model):
         model.get_sde_sampler()
     with pytest.raises(NotImplementedError):
         model.get_pde_coeffs()
+
+
+def test_closed_form_price_over_a_maturity_grid(model):
+    """
+    Tests that an array of maturities prices the curve element by element.
+    """
+    maturities = np.array([0.25, 1.0, 5.0, 30.0])
+    prices = model.price_closed_form(spot=0.05, t=maturities)
+    expected = [model.price_closed_form(spot=0.05, t=t) for t in maturities]
+    np.testing.assert_allclose(prices, expected, rtol=1e-14)
@@ -29,6 +29,26 @@ def test_characteristic_function(model):
     assert cf(0) == pytest.approx(1.0)
 
 
+def test_characteristic_function_scalar_matches_grid(model):
+    """
+    Tests that the single-node (cmath) path agrees with the grid path.
+    """
+    cf = model.cf(**CF_KWARGS)
+    nodes = np.array([0.7, 3.0 - 1.0j, -5.0 + 0.25j])
+    np.testing.assert_allclose([cf(x) for x in nodes.tolist()], cf(nodes), rtol=1e-13)
+
+
+def test_characteristic_function_is_risk_neutral(model):
+    """
+    Tests that phi(-i) recovers the forward, E[S_T] = S exp((r - q) t).
+    """
+    cf = model.cf(**CF_KWARGS)
+    forward = CF_KWARGS["spot"] * np.exp(
+        (CF_KWARGS["r"] - CF_KWARGS["q"]) * CF_KWARGS["t"]
+    )
+    assert cf(-1j) == pytest.approx(forward)
+
+
 def test_raw_characteristic_function(model):
     """
     Tests the raw characteristic function at u=0, where it should be 1.
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from optpricing.parity import ImpliedRateModel
@@ -48,7 +50,7 @@ def test_implied_rate_no_dividend():
 def test_implied_rate_arbitrage_case():
     """
     Tests that the model raises a ValueError when prices suggest arbitrage
-    and a root cannot be bracketed.
+    and no positive discount factor satisfies parity.
     """
     # C - P > S, which is an arbitrage violation.
     arbitrage_params = TEST_PARAMS.copy()
@@ -56,5 +58,20 @@ def test_implied_rate_arbitrage_case():
     arbitrage_params["put_price"] = 5.0
 
     model = ImpliedRateModel(params={})
-    with pytest.raises(ValueError, match="Unable to bracket a root"):
+    with pytest.raises(ValueError, match="No implied rate: parity needs"):
         model._closed_form_impl(**arbitrage_params)
+
+
+def test_implied_rate_is_exact():
+    """
+    Tests that the solved rate reproduces put-call parity to machine precision.
+    """
+    spot, strike, t, q, r = 100.0, 110.0, 0.75, 0.02, 0.043
+    put_price = 12.0
+    call_price = put_price + spot * math.exp(-q * t) - strike * math.exp(-r * t)
+
+    model = ImpliedRateModel(params={})
+    implied_rate = model._closed_form_impl(
+        call_price=call_price, put_price=put_price, spot=spot, strike=strike, t=t, q=q
+    )
+    assert implied_rate == pytest.approx(r, abs=1e-12)
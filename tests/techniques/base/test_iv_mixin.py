@@ -2,8 +2,10 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+from scipy.optimize import brentq
 
 from optpricing.atoms import Option, OptionType, Rate, Stock
+from optpricing.models import BSMModel
 from optpricing.techniques.base import BaseTechnique, IVMixin, PricingResult
 
 
@@ -87,3 +89,60 @@ def test_implied_volatility_total_failure_returns_nan(setup):
                 option, stock, model, rate, target_price=target_price
             )
             assert np.isnan(iv)
+
+
+@pytest.mark.parametrize("option_type", [OptionType.CALL, OptionType.PUT])
+def test_initial_vol_guess_is_close_for_near_the_money(option_type):
+    """
+    Tests that the Corrado-Miller warm start lands near the true volatility.
+    """
+    option = Option(strike=105, maturity=1.0, option_type=option_type)
+    stock = Stock(spot=100)
+    rate = Rate(rate=0.05)
+    price = BSMModel(params={"sigma": 0.3}).price_closed_form(
+        spot=100, strike=105, r=0.05, q=0.0, t=1.0, call=option_type is OptionType.CALL
+    )
+
+    guess = IVMixin._initial_vol_guess(option, stock, rate, price)
+    assert guess == pytest.approx(0.3, abs=0.01)
+
+
+def test_initial_sigma_narrows_the_bracket(setup):
+    """
+    Tests that a good starting guess lets brentq search a narrow bracket.
+    """
+    technique, option, stock, model, rate = setup
+    target_vol = 0.25
+    technique.bsm_pricer.side_effect = lambda sigma: PricingResult(
+        price=10.0 + (sigma - target_vol)
+    )
+
+    with patch(
+        "optpricing.techniques.base.iv_mixin.brentq", wraps=brentq
+    ) as mock_brentq:
+        iv = technique.implied_volatility(
+            option, stock, model, rate, target_price=10.0, initial_sigma=0.24
+        )
+
+    _, a, b = mock_brentq.call_args.args
+    assert 0.2 < a < target_vol < b < 0.3
+    assert iv == pytest.approx(target_vol, abs=1e-6)
+
+
+def test_initial_sigma_that_reproduces_the_target_skips_the_search(setup):
+    """
+    Tests that a guess pricing exactly at the target is returned as is.
+    """
+    technique, option, stock, model, rate = setup
+    technique.bsm_pricer.side_effect = lambda sigma: PricingResult(
+        price=10.0 + (sigma - 0.25)
+    )
+
+    with patch("optpricing.techniques.base.iv_mixin.brentq") as mock_brentq:
+        iv = technique.implied_volatility(
+            option, stock, model, rate, target_price=10.0, initial_sigma=0.25
+        )
+
+    mock_brentq.assert_not_called()
+    assert technique.bsm_pricer.call_count == 1
+    assert iv == 0.25
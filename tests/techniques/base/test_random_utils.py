@@ -1,6 +1,10 @@
 import numpy as np
 
-from optpricing.techniques.base.random_utils import crn
+from optpricing.techniques.base.random_utils import (
+    crn,
+    double_exponential_jump_sizes,
+    normal_jump_sizes,
+)
 
 
 def test_crn_resets_state_and_allows_reuse():
@@ -54,3 +58,34 @@ def test_crn_does_not_affect_outer_sequence():
     # The sequence outside the 'with' block should be unaffected
     assert test_val1 == control_val1
     assert test_val2 == control_val2
+
+
+def test_normal_jump_sizes_match_the_compound_law():
+    """
+    Tests that the summed jumps have mean n * mu_j and variance n * sigma_j^2,
+    and that steps without jumps contribute exactly zero.
+    """
+    rng = np.random.default_rng(0)
+    counts = np.array([0, 1, 3])[:, None].repeat(200_000, axis=1)
+    sizes = normal_jump_sizes(rng, counts, -0.1, 0.15)
+
+    assert np.all(sizes[0] == 0.0)
+    np.testing.assert_allclose(sizes[1:].mean(axis=1), [-0.1, -0.3], atol=3e-3)
+    np.testing.assert_allclose(sizes[1:].var(axis=1), [0.15**2, 3 * 0.15**2], rtol=2e-2)
+
+
+def test_double_exponential_jump_sizes_match_the_compound_law():
+    """
+    Tests that the summed Kou jumps have the compound mean
+    n * (p_up / eta1 - (1 - p_up) / eta2), and zero where no jump occurs.
+    """
+    rng = np.random.default_rng(0)
+    p_up, eta1, eta2 = 0.3, 10.0, 5.0
+    counts = np.array([0, 1, 3])[:, None].repeat(200_000, axis=1)
+    sizes = double_exponential_jump_sizes(rng, counts, p_up, eta1, eta2)
+
+    single_mean = p_up / eta1 - (1 - p_up) / eta2
+    assert np.all(sizes[0] == 0.0)
+    np.testing.assert_allclose(
+        sizes[1:].mean(axis=1), [single_mean, 3 * single_mean], atol=3e-3
+    )
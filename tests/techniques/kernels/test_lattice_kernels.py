@@ -1,6 +1,11 @@
+import math
+
+import numpy as np
 import pytest
 
 from optpricing.techniques.kernels.lattice_kernels import (
+    _binomial_european_kernel,
+    _binomial_rollback_kernel,
     _crr_pricer,
     _lr_pricer,
     _topm_pricer,
@@ -46,6 +51,28 @@ def test_binomial_pricers_european_convergence(pricer_func):
         assert key in result
 
 
+def test_binomial_european_closed_form_matches_rollback():
+    """
+    Tests that the closed-form European node values agree with a full
+    backward induction on the same tree.
+    """
+    S0, K, N = 100.0, 105.0, 400
+    dt = 1.0 / N
+    u = math.exp(0.2 * math.sqrt(dt))
+    d = 1.0 / u
+    disc = math.exp(-0.05 * dt)
+    p = (math.exp(0.04 * dt) - d) / (u - d)
+    j = np.arange(N + 1, dtype=np.float64)
+    spots = S0 * u**j * d ** (N - j)
+    payoff = np.maximum(K - spots, 0.0)
+
+    closed_form = _binomial_european_kernel(payoff.copy(), p, disc, N)
+    rollback = _binomial_rollback_kernel(
+        payoff.copy(), spots, K, -1.0, disc * p, disc * (1.0 - p), 1.0 / d, False
+    )
+    np.testing.assert_allclose(closed_form, rollback, rtol=1e-10)
+
+
 def test_topm_pricer_european_convergence():
     """
     Tests that the trinomial pricer converges to the BSM price.
@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 from scipy import stats
 
+from optpricing.techniques.base import normal_jump_sizes
 from optpricing.techniques.kernels import mc_kernels
 
 N_PATHS_DRIFT = 10
@@ -109,7 +110,7 @@ def test_merton_kernel_drift():
     log_s0 = np.log(100)
     sigma, lambda_, mu_j, sigma_j = 0.2, 0.5, -0.1, 0.15
     dw = np.zeros((N_PATHS_DRIFT, N_STEPS))
-    jump_counts = np.zeros((N_PATHS_DRIFT, N_STEPS), dtype=np.int64)
+    jump_sizes = np.zeros((N_PATHS_DRIFT, N_STEPS))
 
     log_sT = mc_kernels.merton_kernel(
         N_PATHS_DRIFT,
@@ -123,7 +124,7 @@ def test_merton_kernel_drift():
         sigma_j,
         DT,
         dw,
-        jump_counts,
+        jump_sizes,
     )
 
     compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
@@ -244,6 +245,7 @@ def test_merton_kernel_jumps_are_applied():
     dw = rng.normal(0, np.sqrt(DT), (N_PATHS_STOCHASTIC, N_STEPS))
 
     jump_counts = rng.poisson(lambda_ * DT, (N_PATHS_STOCHASTIC, N_STEPS))
+    jump_sizes = normal_jump_sizes(rng, jump_counts, mu_j, sigma_j)
     log_sT_with_jumps = mc_kernels.merton_kernel(
         N_PATHS_STOCHASTIC,
         N_STEPS,
@@ -256,10 +258,10 @@ def test_merton_kernel_jumps_are_applied():
         sigma_j,
         DT,
         dw,
-        jump_counts,
+        jump_sizes,
     )
 
-    no_jump_counts = np.zeros((N_PATHS_STOCHASTIC, N_STEPS), dtype=np.int64)
+    no_jump_sizes = np.zeros((N_PATHS_STOCHASTIC, N_STEPS))
     log_sT_no_jumps = mc_kernels.merton_kernel(
         N_PATHS_STOCHASTIC,
         N_STEPS,
@@ -272,7 +274,7 @@ def test_merton_kernel_jumps_are_applied():
         sigma_j,
         DT,
         dw,
-        no_jump_counts,
+        no_jump_sizes,
     )
 
     t_stat, p_value = stats.ttest_ind(
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 from scipy import stats
 
+from optpricing.techniques.base import normal_jump_sizes
 from optpricing.techniques.kernels import path_kernels
 
 N_PATHS = 10
@@ -68,7 +69,7 @@ def test_merton_path_kernel_drift():
     log_s0 = np.log(s0)
     sigma, lambda_, mu_j, sigma_j = 0.2, 0.5, -0.1, 0.15
     dw = np.zeros((N_PATHS, N_STEPS))
-    jump_counts = np.zeros((N_PATHS, N_STEPS), dtype=np.int64)
+    jump_sizes = np.zeros((N_PATHS, N_STEPS))
 
     paths = path_kernels.merton_path_kernel(
         N_PATHS,
@@ -82,7 +83,7 @@ def test_merton_path_kernel_drift():
         sigma_j,
         DT,
         dw,
-        jump_counts,
+        jump_sizes,
     )
 
     compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
@@ -98,7 +99,7 @@ def test_bates_path_kernel_drift():
     lambda_, mu_j, sigma_j = 0.5, -0.1, 0.15
     dw1 = np.zeros((N_PATHS, N_STEPS))
     dw2 = np.zeros((N_PATHS, N_STEPS))
-    jump_counts = np.zeros((N_PATHS, N_STEPS), dtype=np.int64)
+    jump_sizes = np.zeros((N_PATHS, N_STEPS))
 
     paths = path_kernels.bates_path_kernel(
         N_PATHS,
@@ -117,7 +118,7 @@ def test_bates_path_kernel_drift():
         DT,
         dw1,
         dw2,
-        jump_counts,
+        jump_sizes,
     )
 
     compensator = lambda_ * (np.exp(mu_j + 0.5 * sigma_j**2) - 1)
@@ -246,6 +247,7 @@ def test_merton_path_kernel_jumps_are_applied():
 
     # With jumps
     jump_counts = rng.poisson(lambda_ * DT, (N_PATHS_STOCHASTIC, N_STEPS))
+    jump_sizes = normal_jump_sizes(rng, jump_counts, mu_j, sigma_j)
     paths_with_jumps = path_kernels.merton_path_kernel(
         N_PATHS_STOCHASTIC,
         N_STEPS,
@@ -258,11 +260,11 @@ def test_merton_path_kernel_jumps_are_applied():
         sigma_j,
         DT,
         dw,
-        jump_counts,
+        jump_sizes,
     )
 
     # Without jumps
-    no_jump_counts = np.zeros((N_PATHS_STOCHASTIC, N_STEPS), dtype=np.int64)
+    no_jump_sizes = np.zeros((N_PATHS_STOCHASTIC, N_STEPS))
     paths_no_jumps = path_kernels.merton_path_kernel(
         N_PATHS_STOCHASTIC,
         N_STEPS,
@@ -275,7 +277,7 @@ def test_merton_path_kernel_jumps_are_applied():
         sigma_j,
         DT,
         dw,
-        no_jump_counts,
+        no_jump_sizes,
     )
 
     # The means of the terminal prices should be different
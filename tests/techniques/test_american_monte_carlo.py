@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from optpricing.atoms import Option, OptionType, Rate, Stock
-from optpricing.models import BSMModel
+from optpricing.models import BSMModel, KouModel, MertonJumpModel
 from optpricing.techniques import AmericanMonteCarloTechnique, CRRTechnique
 
 
@@ -54,3 +54,21 @@ def test_get_path_kernel_selector():
     )
 
     assert kernel_func is path_kernels.heston_path_kernel
+
+
+@pytest.mark.parametrize("model_class", [MertonJumpModel, KouModel])
+def test_american_mc_jump_price_is_reproducible_for_a_seed(setup, model_class):
+    """
+    Tests that the parallel jump path kernels give the same price for the
+    same seed, since their jumps are drawn from the seeded generator.
+    """
+    option, stock, rate = setup
+    model = model_class(params=model_class.default_params)
+
+    prices = [
+        AmericanMonteCarloTechnique(n_paths=2000, n_steps=20, seed=5)
+        .price(option, stock, model, rate)
+        .price
+        for _ in range(2)
+    ]
+    assert prices[0] == prices[1]
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from optpricing.atoms import Option, OptionType, Rate, Stock, ZeroCouponBond
@@ -65,6 +66,29 @@ def test_analytic_greek_dispatch(setup):
         assert delta == 0.5
 
 
+@pytest.mark.parametrize("use_analytic_greeks", [True, False])
+def test_price_and_greeks_matches_individual_calls(setup, use_analytic_greeks):
+    """
+    Tests that the fused price-and-Greeks call agrees with the per-metric
+    methods, both through the model's fused analytic path and the fallback.
+    """
+    option, stock, model, rate = setup
+    technique = ClosedFormTechnique(use_analytic_greeks=use_analytic_greeks)
+
+    results = technique.price_and_greeks(option, stock, model, rate)
+    expected = {
+        "price": technique.price(option, stock, model, rate).price,
+        "delta": technique.delta(option, stock, model, rate),
+        "gamma": technique.gamma(option, stock, model, rate),
+        "vega": technique.vega(option, stock, model, rate),
+        "theta": technique.theta(option, stock, model, rate),
+        "rho": technique.rho(option, stock, model, rate),
+    }
+    assert results.keys() == expected.keys()
+    for name, value in expected.items():
+        assert results[name] == pytest.approx(value, rel=1e-6), name
+
+
 def test_numerical_greek_fallback_when_disabled(setup):
     """
     Tests that the technique falls back to numerical greeks when analytic greeks
@@ -83,6 +107,34 @@ def test_numerical_greek_fallback_when_disabled(setup):
         assert mock_price.call_count == 2
 
 
+@pytest.mark.parametrize("strike", [80.0, 100.0, 125.0])
+@pytest.mark.parametrize("option_type", [OptionType.CALL, OptionType.PUT])
+def test_implied_volatility_round_trip(setup, strike, option_type):
+    """
+    Tests that the closed-form IV solver recovers the pricing volatility.
+    """
+    _, stock, model, rate = setup
+    option = Option(strike=strike, maturity=0.75, option_type=option_type)
+    technique = ClosedFormTechnique()
+
+    target_price = technique.price(option, stock, model, rate).price
+    iv = technique.implied_volatility(
+        option, stock, model, rate, target_price=target_price, tol=1e-10
+    )
+    assert iv == pytest.approx(model.params["sigma"], abs=1e-8)
+
+
+def test_implied_volatility_arbitrage_price_falls_back(setup):
+    """
+    Tests that a price below intrinsic value defers to the IVMixin fallback.
+    """
+    option, stock, model, rate = setup
+    technique = ClosedFormTechnique()
+
+    iv = technique.implied_volatility(option, stock, model, rate, target_price=1e-3)
+    assert np.isnan(iv)
+
+
 def test_merton_closed_form_price(setup):
     """
     Tests the ClosedFormTechnique with the Merton Jump-Diffusion model against
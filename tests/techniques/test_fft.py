@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -6,6 +6,7 @@ import pytest
 from optpricing.atoms import Option, OptionType, Rate, Stock
 from optpricing.models import BSMModel
 from optpricing.techniques import FFTTechnique
+from optpricing.techniques.fft import _carr_madan_nodes
 
 
 # Common setup for tests
@@ -76,3 +77,55 @@ def test_fft_put_call_parity(setup):
     parity_rhs = S * np.exp(-q * T) - K * np.exp(-r * T)
 
     assert parity_lhs == pytest.approx(parity_rhs, abs=1e-5)
+
+
+def test_fft_grid_is_reused_across_strikes():
+    """
+    Tests that strikes on the same maturity slice reuse the cached FFT grid
+    instead of re-evaluating the characteristic function.
+    """
+    stock = Stock(spot=100)
+    rate = Rate(rate=0.05)
+    model = BSMModel(params={"sigma": 0.2})
+    technique = FFTTechnique(n=12)
+
+    with patch.object(model, "cf", wraps=model.cf) as mock_cf:
+        for strike in (90.0, 100.0, 110.0):
+            option = Option(strike=strike, maturity=1.0, option_type=OptionType.PUT)
+            technique.price(option, stock, model, rate)
+        assert mock_cf.call_count == 1
+
+        longer = Option(strike=100.0, maturity=2.0, option_type=OptionType.CALL)
+        technique.price(longer, stock, model, rate)
+        assert mock_cf.call_count == 2
+
+
+def test_fft_grid_cache_misses_after_in_place_param_update(setup):
+    """
+    Tests that mutating the model's params in place invalidates the grid.
+    """
+    option, stock, model, rate = setup
+    technique = FFTTechnique(n=12)
+    technique.price(option, stock, model, rate)
+
+    model.params["sigma"] = 0.3
+    expected = FFTTechnique(n=12).price(option, stock, model, rate).price
+    assert technique.price(option, stock, model, rate).price == expected
+
+
+def test_fft_nodes_are_memoized_across_models(setup):
+    """
+    Tests that repricing the same grid with new model parameters reuses the
+    node-only factors and recomputes only the CF.
+    """
+    option, stock, model, rate = setup
+    technique = FFTTechnique(alpha=1.5)
+    _carr_madan_nodes.cache_clear()
+
+    p1 = technique.price(option, stock, model, rate).price
+    p2 = technique.price(option, stock, BSMModel(params={"sigma": 0.25}), rate).price
+
+    info = _carr_madan_nodes.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert p2 > p1
@@ -93,3 +93,41 @@ def test_delta_fallback_mechanism(mock_super_delta, setup):
 
         # Assert that the superclass's (finite difference) delta was called
         mock_super_delta.assert_called_once()
+
+
+def test_free_gamma_accuracy(setup):
+    """
+    Tests that the 'free' gamma from integration matches the analytical BSM gamma
+    without any additional pricing calls.
+    """
+    option, stock, model, rate = setup
+
+    bsm_gamma = model.gamma_analytic(
+        spot=stock.spot,
+        strike=option.strike,
+        r=rate.get_rate(option.maturity),
+        q=stock.dividend,
+        t=option.maturity,
+    )
+
+    technique = IntegrationTechnique()
+    technique.price(option, stock, model, rate)
+    with patch.object(technique, "price") as mock_price:
+        integration_gamma = technique.gamma(option, stock, model, rate)
+        mock_price.assert_not_called()
+
+    assert integration_gamma == pytest.approx(bsm_gamma, abs=1e-6)
+
+
+def test_cached_greeks_miss_after_in_place_param_update(setup):
+    """
+    Tests that mutating the model's params in place forces a reprice before
+    the cached delta is returned.
+    """
+    option, stock, model, rate = setup
+    technique = IntegrationTechnique()
+    technique.price(option, stock, model, rate)
+
+    model.params["sigma"] = 0.3
+    expected = IntegrationTechnique().delta(option, stock, model, rate)
+    assert technique.delta(option, stock, model, rate) == pytest.approx(expected)
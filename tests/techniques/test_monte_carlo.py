@@ -120,7 +120,120 @@ def test_mc_price_correctness_for_bsm(setup):
     analytic_technique = ClosedFormTechnique()
     expected_price = analytic_technique.price(option, stock, model, rate).price
 
-    mc_technique = MonteCarloTechnique(n_paths=20000, n_steps=10, seed=0)
+    # BSM Europeans sample the terminal spot directly, so many paths are
+    # cheap; at 16M paths three standard errors (~0.009) fit the tolerance
+    mc_technique = MonteCarloTechnique(n_paths=16_000_000, n_steps=10, seed=0)
     mc_price = mc_technique.price(option, stock, model, rate).price
 
     assert mc_price == pytest.approx(expected_price, abs=1e-2)
+
+
+def test_bsm_terminal_sampling_is_independent_of_steps(setup):
+    """
+    Tests that BSM European pricing samples the terminal spot directly, so the
+    time grid has no effect on the result for a fixed seed.
+    """
+    option, stock, rate = setup
+    model = BSMModel(params={"sigma": 0.2})
+
+    coarse = MonteCarloTechnique(n_paths=1000, n_steps=1, seed=7)
+    fine = MonteCarloTechnique(n_paths=1000, n_steps=500, seed=7)
+
+    coarse_price = coarse.price(option, stock, model, rate).price
+    fine_price = fine.price(option, stock, model, rate).price
+    assert coarse_price == pytest.approx(fine_price, rel=1e-12)
+
+
+def test_control_variate_removes_linear_payoff_noise():
+    """
+    Tests that a payoff linear in the terminal spot is priced exactly by the
+    control-variate adjustment.
+    """
+    ST = np.random.default_rng(0).lognormal(mean=4.6, sigma=0.2, size=1000)
+    forward = 105.0
+    adjusted = MonteCarloTechnique._apply_control_variate(2.0 * ST + 1.0, ST, forward)
+    assert np.allclose(adjusted, 2.0 * forward + 1.0)
+
+
+def test_mc_price_with_control_variate_for_bsm(setup):
+    """
+    Tests that the control-variate estimator stays close to the analytic price.
+    """
+    option, stock, rate = setup
+    model = BSMModel(params={"sigma": 0.2})
+    expected_price = ClosedFormTechnique().price(option, stock, model, rate).price
+
+    # The control variate cuts the standard error about 4x, so 1M paths put
+    # three standard errors (~0.008) inside the tolerance
+    mc_technique = MonteCarloTechnique(n_paths=1_000_000, seed=0, control_variate=True)
+    mc_price = mc_technique.price(option, stock, model, rate).price
+    assert mc_price == pytest.approx(expected_price, abs=1e-2)
+
+
+def test_mc_price_with_sobol_shocks_for_bsm(setup):
+    """
+    Tests that scrambled Sobol shocks price a BSM European tightly with few paths.
+    """
+    option, stock, rate = setup
+    model = BSMModel(params={"sigma": 0.2})
+    expected_price = ClosedFormTechnique().price(option, stock, model, rate).price
+
+    mc_technique = MonteCarloTechnique(n_paths=4096, seed=0, quasi_random=True)
+    mc_price = mc_technique.price(option, stock, model, rate).price
+    assert mc_price == pytest.approx(expected_price, abs=0.02)
+
+
+def test_sobol_shocks_use_whole_base_2_blocks():
+    """
+    Tests that Sobol draws are rounded up to a full power-of-two block.
+    """
+    mc_technique = MonteCarloTechnique(n_paths=20000, seed=0, quasi_random=True)
+    ST = mc_technique._simulate_gbm_terminal(100.0, 0.05, 0.0, 0.2, 1.0)
+    assert len(ST) == 2 * 2**14
+
+
+def test_reused_samples_give_pathwise_parity(setup):
+    """
+    Tests that with reuse_samples the put reuses the call's terminal spots, so
+    the two prices satisfy put-call parity against the sample mean exactly.
+    """
+    option, stock, rate = setup
+    put = Option(
+        strike=option.strike, maturity=option.maturity, option_type=OptionType.PUT
+    )
+    model = HestonModel(
+        params={"v0": 0.04, "kappa": 2.0, "theta": 0.04, "rho": -0.7, "vol_of_vol": 0.5}
+    )
+    mc_technique = MonteCarloTechnique(
+        n_paths=2000, n_steps=20, seed=0, reuse_samples=True
+    )
+
+    with patch.object(
+        mc_technique, "_simulate_sde_path", wraps=mc_technique._simulate_sde_path
+    ) as simulate:
+        call_price = mc_technique.price(option, stock, model, rate).price
+        put_price = mc_technique.price(put, stock, model, rate).price
+    simulate.assert_called_once()
+
+    T = option.maturity
+    disc = np.exp(-rate.get_rate(T) * T)
+    ST = mc_technique._sample_cache[0]
+    expected = disc * (ST.mean() - option.strike)
+    assert call_price - put_price == pytest.approx(expected, rel=1e-10)
+
+
+def test_merton_price_is_reproducible_for_a_seed(setup):
+    """
+    Tests that the parallel Merton kernel gives the same price for the same
+    seed, since its jumps are drawn from the seeded generator.
+    """
+    option, stock, rate = setup
+    model = MertonJumpModel(params=MertonJumpModel.default_params)
+
+    prices = [
+        MonteCarloTechnique(n_paths=2000, n_steps=20, seed=11)
+        .price(option, stock, model, rate)
+        .price
+        for _ in range(2)
+    ]
+    assert prices[0] == prices[1]
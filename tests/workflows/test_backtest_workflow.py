@@ -71,3 +71,39 @@ def test_save_results(mock_to_csv, setup):
     workflow.save_results()
 
     mock_to_csv.assert_called_once()
+
+
+@patch("optpricing.workflows.backtest_workflow.load_market_snapshot")
+@patch("optpricing.workflows.backtest_workflow.get_available_snapshot_dates")
+@patch("optpricing.workflows.backtest_workflow.DailyWorkflow")
+def test_backtest_workflow_loads_each_snapshot_once(
+    mock_daily_workflow,
+    mock_get_dates,
+    mock_load_data,
+    setup,
+):
+    """
+    Tests that a snapshot shared by two periods is only loaded once.
+    """
+    workflow = setup
+    dates = ["2023-01-03", "2023-01-02", "2023-01-01"]
+    snapshots = {d: pd.DataFrame({"date": [d]}) for d in dates}
+    mock_get_dates.return_value = dates
+    mock_load_data.side_effect = lambda ticker, d: snapshots[d]
+
+    mock_daily_instance = MagicMock()
+    mock_daily_instance.results = {
+        "Status": "Success",
+        "Calibrated Params": {"sigma": 0.25},
+    }
+    mock_daily_instance._evaluate_rmse.return_value = 0.5
+    mock_daily_workflow.return_value = mock_daily_instance
+
+    workflow.run()
+
+    assert [c.args[1] for c in mock_load_data.call_args_list] == dates
+    # DailyWorkflow is built twice per period, calibration first
+    calib_calls = mock_daily_workflow.call_args_list[::2]
+    calib_frames = [c.kwargs["market_data"] for c in calib_calls]
+    assert [f["date"].iloc[0] for f in calib_frames] == dates[:2]
+    assert len(workflow.results) == 2
@@ -1,8 +1,12 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from optpricing.atoms import Rate, Stock
+from optpricing.models import BSMModel
+from optpricing.models.bsm import bsm_price_vectorized
 from optpricing.workflows import DailyWorkflow
 
 
@@ -74,3 +78,27 @@ def test_daily_workflow_failure_path(mock_fit_r_q, setup):
     assert "RMSE" in workflow.results
     assert "Error" in workflow.results
     assert workflow.results["Error"] == "Test Error"
+
+
+def test_evaluate_rmse_on_non_default_index(setup):
+    """
+    Tests the RMSE on a filtered chain whose index is not a fresh range.
+    """
+    workflow = setup
+    strikes = np.array([90.0, 100.0, 110.0])
+    calls = np.array([True, False, True])
+    market_prices = bsm_price_vectorized(100.0, strikes, 0.05, 0.01, 0.5, 0.2, calls)
+    workflow.market_data = pd.DataFrame(
+        {
+            "strike": strikes,
+            "maturity": 0.5,
+            "optionType": np.where(calls, "call", "put"),
+            "marketPrice": market_prices + np.array([0.1, -0.1, 0.1]),
+        },
+        index=[7, 3, 5],
+    )
+
+    rmse = workflow._evaluate_rmse(
+        BSMModel(params={"sigma": 0.2}), Stock(spot=100.0, dividend=0.01), Rate(0.05)
+    )
+    assert rmse == pytest.approx(0.1, rel=1e-9)